@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""HTTP conditional request helpers (ETag / Last-Modified / 304) for MGLTickets."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple, Optional
+from fastapi import Request, Response, status
+
+
+class Validator(NamedTuple):
+    """Version of a response body, as sent in ETag and Last-Modified."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def headers(self) -> dict[str, str]:
+        # Routes need a token, so only the client may keep a copy, and must revalidate it
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_as_utc(self.last_modified), usegmt=True)
+        return headers
+
+
+def _as_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def make_validator(*parts: Any, last_modified: Optional[datetime] = None) -> Validator:
+    """
+    Build a weak ETag from whatever identifies the body's version, e.g. an ID
+    and `updated_at`, so the body itself never needs to be serialized to tag it.
+    """
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return Validator(f'W/"{digest}"', last_modified)
+
+
+def is_fresh(request: Request, validator: Validator) -> bool:
+    """Whether the client's cached copy still matches, per If-None-Match or else If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: W/"x" and "x" match
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or validator.etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validator.last_modified is not None:
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have whole seconds
+        return _as_utc(validator.last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def conditional_response(request: Request, response: Response, validator: Validator) -> Optional[Response]:
+    """
+    Return a bodiless 304 if the client's copy is current, otherwise add the
+    validator headers to the route's `response` and return None.
+    """
+    headers = validator.headers()
+    if is_fresh(request, validator):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
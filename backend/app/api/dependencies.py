@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Shared FastAPI dependencies for MGLTickets."""
+
+from collections.abc import AsyncGenerator
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_session import get_async_session
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide one session (unit of work) per request.
+    Repositories called with this session share its connection and transaction,
+    which is committed once the path operation returns.
+    """
+    async with get_async_session() as session:
+        yield session
+
+
+# Commit before the response is sent, so a failed commit surfaces as an error
+DBSession = Annotated[AsyncSession, Depends(get_db, scope="function")]
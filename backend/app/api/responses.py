@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""Pre-serialized JSON responses for MGLTickets."""
+
+from typing import Any, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def serialized_response(value: Any, adapter: TypeAdapter, response: Optional[Response] = None) -> Response:
+    """
+    Serialize already-validated models straight to JSON bytes with pydantic-core.
+
+    Returned as-is, FastAPI would dump the models to dicts, validate them again
+    against the route's response_model (running BaseModelEAT's datetime
+    conversion on every field of every row a second time) and then encode them.
+    Keep response_model on the route for the OpenAPI schema. Headers already set
+    on the route's injected `response`, such as the ETag, are carried over.
+    """
+    headers = None
+    if response is not None:
+        headers = {name: header for name, header in response.headers.items() if name != "content-length"}
+    return Response(content=adapter.dump_json(value), media_type="application/json", headers=headers)
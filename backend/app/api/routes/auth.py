@@ -4,37 +4,38 @@
 from fastapi import APIRouter, HTTPException, status, Depends, Request
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.services.user_services import (
-    get_user_by_email_service,
-    authenticate_user_service
-)
+from app.services.user_services import authenticate_user_service
 from app.core.security import (
     create_access_token,
     get_current_user,
 )
+from app.core.hashing import HashingBusyError
+from app.core.revocation import revocation_list
+from app.api.dependencies import DBSession
 
 router = APIRouter()
 
 
 @router.post("/login")
-async def login(form: OAuth2PasswordRequestForm = Depends()):
+async def login(db: DBSession, form: OAuth2PasswordRequestForm = Depends()):
     """
     Authenticate user and return an access token.
     """
     # OAuth2PasswordRequestForm has username and password, so email in this case is username.
     email = form.username
-    user = get_user_by_email_service(email)
-    if not user:
+    try:
+        user = await authenticate_user_service(email, form.password, session=db)
+    except HashingBusyError as e:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid email or password",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
         )
-
-    if not authenticate_user_service(user.id, email, form.password):
+    except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
-    )
+        )
 
     token = create_access_token(user.id)
 
@@ -61,11 +62,14 @@ async def refresh_token(user=Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout(user=Depends(get_current_user)):
+async def logout(request: Request, db: DBSession, user=Depends(get_current_user)):
     """
-    'Logout' by instructing client to delete the token.
-    JWT invalidation is client-side unless you use a blacklist.
+    Logout by revoking the current token until it expires.
+    The client should delete the token as well.
     """
+    payload = request.state.token_payload
+    if payload.get("jti"):
+        await revocation_list.revoke(payload["jti"], payload["exp"], session=db)
     return {
         "message": "Logout successful. Client should delete the token."
     }
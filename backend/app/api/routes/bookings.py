@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Booking routes for MGLTickets."""
+
+import math
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.schemas.booking import BookingCreate, BookingRequest, BookingOut
+from app.schemas.waiting_room import QueueTicketOut
+import app.services.booking_services as booking_services
+import app.services.waiting_room as waiting_room
+from app.core.security import get_current_user
+
+router = APIRouter()
+
+@router.post("/events/{event_id}/queue", response_model=QueueTicketOut)
+async def join_waiting_room(event_id: int, user=Depends(get_current_user)):
+    """
+    Join the event's waiting room and get a queue token.
+    Events without a waiting room answer with admitted=true and no token.
+    """
+    return waiting_room.join_queue_service(event_id, user.id)
+
+@router.get("/events/{event_id}/queue", response_model=QueueTicketOut)
+async def get_queue_status(event_id: int, token: str, user=Depends(get_current_user)):
+    """
+    Check whether a queue token has been admitted yet.
+    """
+    try:
+        return waiting_room.queue_status_service(event_id, user.id, token)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@router.post("/bookings", response_model=BookingOut)
+def create_booking(
+    booking_request: BookingRequest,
+    user=Depends(get_current_user),
+    x_queue_token: Optional[str] = Header(default=None),
+):
+    """
+    Create a booking for the current user, priced from the ticket type.
+    Declared sync so the booking transaction runs in the threadpool, not on the event loop.
+    """
+    booking_data = BookingCreate(user_id=user.id, **booking_request.model_dump())
+    try:
+        return booking_services.create_booking_service(booking_data, queue_token=x_queue_token)
+    except waiting_room.NotAdmittedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Gate check-in routes for MGLTickets."""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.schemas.checkin import (
+    CheckInRequest,
+    CheckInResult,
+    CheckInPreloadOut,
+    CheckInSyncRequest,
+    CheckInSyncResult,
+)
+import app.services.checkin_services as checkin_services
+from app.core.security import get_current_user
+from app.api.dependencies import DBSession
+
+router = APIRouter()
+
+GATE_ROLES = ("organizer", "admin")
+
+async def require_gate_staff(event_id: int, db: DBSession, user=Depends(get_current_user)):
+    """Only admins, and the organizer of the event itself, may scan its tickets."""
+    if user.role not in GATE_ROLES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to check in tickets")
+    organizer_id = await checkin_services.get_event_organizer_service(event_id, session=db)
+    if organizer_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    if user.role != "admin" and organizer_id != user.id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to check in tickets for this event")
+    return user
+
+@router.post("/events/{event_id}/check-in/preload", response_model=CheckInPreloadOut)
+async def preload_check_in(event_id: int, db: DBSession, user=Depends(require_gate_staff)):
+    """
+    Load the event's active ticket codes into memory before the gates open.
+    """
+    codes = await checkin_services.preload_event_codes_service(event_id, session=db)
+    return CheckInPreloadOut(event_id=event_id, codes=codes)
+
+@router.post("/events/{event_id}/check-in", response_model=CheckInResult)
+async def check_in_ticket(event_id: int, scan: CheckInRequest, db: DBSession, user=Depends(require_gate_staff)):
+    """
+    Scan a ticket code at the gate. `result` is "admitted" only the first time.
+    """
+    return await checkin_services.check_in_ticket_service(event_id, scan.code, session=db)
+
+@router.get("/events/{event_id}/check-in/bundle")
+async def export_scanner_bundle(event_id: int, db: DBSession, user=Depends(require_gate_staff)):
+    """
+    Download the signed offline bundle of the event's active ticket codes for gate devices.
+    """
+    bundle = await checkin_services.export_scanner_bundle_service(event_id, session=db)
+    return StreamingResponse(
+        bundle.chunks(),
+        media_type="application/octet-stream",
+        headers={
+            "Content-Length": str(bundle.size),
+            "Content-Disposition": f'attachment; filename="event-{event_id}-bundle.bin"',
+            "X-Bundle-Count": str(bundle.count),
+        },
+    )
+
+@router.post("/events/{event_id}/check-in/sync", response_model=CheckInSyncResult)
+async def sync_offline_scans(event_id: int, batch: CheckInSyncRequest, db: DBSession, user=Depends(require_gate_staff)):
+    """
+    Upload scans a gate device recorded while offline, applied in one transaction.
+    """
+    try:
+        return await checkin_services.sync_offline_scans_service(
+            event_id, batch.scans, device_id=batch.device_id, session=db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
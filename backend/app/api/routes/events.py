@@ -1,19 +1,42 @@
 #!/usr/bin/env python3
 """Events routes for MGLTickets."""
 
-from fastapi import APIRouter, Depends
-from app.schemas.event import EventOut
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from app.schemas.event import EventOut, EventDetailsOut
+from app.schemas.pagination import Page
+from app.core.config import PAGE_SIZE_DEFAULT, PAGE_SIZE_MAX
 import app.services.event_services as event_services
 from app.core.security import get_current_user
+from app.api.dependencies import DBSession
+from app.api.conditional import conditional_response, make_validator
+from app.api.responses import serialized_response
 
 router = APIRouter()
 
-@router.get("/events", response_model=list[EventOut])
-async def get_all_events(user=Depends(get_current_user)):
-    """
-    Get all events.
-    """
-    return event_services.get_all_events_service()
+@router.get("/events", response_model=Page[EventOut])
+async def get_all_events(
+    request: Request,
+    response: Response,
+    db: DBSession,
+    user=Depends(get_current_user),
+    cursor: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+):
+    """
+    Get a page of events, pass `next_cursor` back as `cursor` for the next page.
+    Answers 304 without loading the page if `If-None-Match` holds its current ETag.
+    """
+    # Read from the database on every request, a cached version could answer 304 for a changed listing
+    version = await event_services.get_events_version_service(session=db)
+    validator = make_validator("events", *version, cursor, limit)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    try:
+        page = await event_services.get_all_events_service(cursor, limit, version=version, session=db)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return serialized_response(page, event_services.EVENT_PAGE, response)
 
 @router.get("/events/test", response_model=list[EventOut])
 async def get_latest_events(): # user=Depends(get_current_user)
@@ -38,57 +61,98 @@ async def get_latest_events(): # user=Depends(get_current_user)
 
 
 @router.get("/events/{event_id}", response_model=EventOut)
-async def get_event_by_id(event_id: int, user=Depends(get_current_user)):
+async def get_event_by_id(event_id: int, request: Request, response: Response, db: DBSession, user=Depends(get_current_user)):
     """
-    Get an event by its ID.
+    Get an event by its ID, or 304 if `If-None-Match` / `If-Modified-Since` show it is unchanged.
     """
-    return event_services.get_event_by_id_service(event_id)
+    event = await event_services.get_event_by_id_service(event_id, session=db)
+    if not event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    validator = make_validator("event", event.id, event.updated_at, last_modified=event.updated_at)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    return event
+
+@router.get("/events/{event_id}/details", response_model=EventDetailsOut)
+async def get_event_details(event_id: int, request: Request, response: Response, db: DBSession, user=Depends(get_current_user)):
+    """
+    Get an event with its ticket types and remaining stock, everything an event page needs.
+    Sales bump the ticket types' `updated_at`, so the ETag changes with the stock.
+    """
+    event = await event_services.get_event_details_service(event_id, session=db)
+    if not event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    versions = [(ticket_type.id, ticket_type.updated_at) for ticket_type in event.ticket_types]
+    last_modified = max([event.updated_at, *(updated_at for _, updated_at in versions)])
+    validator = make_validator("event-details", event.id, event.updated_at, *versions, last_modified=last_modified)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    return event
 
 @router.post("/events", response_model=EventOut)
-async def create_event(event_data: EventOut, user=Depends(get_current_user)):
+async def create_event(event_data: EventOut, db: DBSession, user=Depends(get_current_user)):
     """
     Create a new event.
     """
-    return event_services.create_event_service(event_data)
+    return await event_services.create_event_service(event_data, session=db)
 
 @router.put("/events/{event_id}", response_model=EventOut)
-async def update_event(event_id: int, event_data: EventOut, user=Depends(get_current_user)):
+async def update_event(event_id: int, event_data: EventOut, db: DBSession, user=Depends(get_current_user)):
     """
     Update an event by its ID.
     """
-    return event_services.update_event_service(event_id, event_data)
+    return await event_services.update_event_service(event_id, event_data, session=db)
 
 @router.post("/events/{event_id}/approve", response_model=EventOut)
-async def approve_event(event_id: int, user=Depends(get_current_user)):
+async def approve_event(event_id: int, db: DBSession, user=Depends(get_current_user)):
     """
     Approve an event by its ID.
     """
-    return event_services.approve_event_service(event_id)
+    return await event_services.approve_event_service(event_id, session=db)
 
 @router.post("/events/{event_id}/reject", response_model=EventOut)
-async def reject_event(event_id: int, user=Depends(get_current_user)):
+async def reject_event(event_id: int, db: DBSession, user=Depends(get_current_user)):
     """
     Reject an event by its ID.
     """
-    return event_services.reject_event_service(event_id)
+    return await event_services.reject_event_service(event_id, session=db)
 
 @router.delete("/events/{event_id}", response_model=EventOut)
-async def delete_event(event_id: int, user=Depends(get_current_user)):
+async def delete_event(event_id: int, db: DBSession, user=Depends(get_current_user)):
     """
     Delete an event by its ID.
     """
-    return event_services.delete_event_service(event_id)
+    return await event_services.delete_event_service(event_id, session=db)
 
 @router.put("/events/{event_id}/status/{status}", response_model=EventOut)
-async def update_event_status(event_id: int, status: str, user=Depends(get_current_user)):
+async def update_event_status(event_id: int, status: str, db: DBSession, user=Depends(get_current_user)):
     """
     Update the status of an event by its ID.
     """
-    return event_services.update_event_status_service(event_id, status)
+    return await event_services.update_event_status_service(event_id, status, session=db)
 
-@router.get("/events/status/{status}", response_model=list[EventOut])
-async def get_events_by_status(status: str, user=Depends(get_current_user)):
-    """
-    Get events by their status.
-    """
-    return event_services.get_events_by_status_service(status)
\ No newline at end of file
+@router.get("/events/status/{event_status}", response_model=Page[EventOut])
+async def get_events_by_status(
+    event_status: str,
+    request: Request,
+    response: Response,
+    db: DBSession,
+    user=Depends(get_current_user),
+    cursor: Optional[str] = None,
+    limit: int = Query(PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAX),
+):
+    """
+    Get a page of events by their status.
+    Answers 304 without loading the page if `If-None-Match` holds its current ETag.
+    """
+    version = await event_services.get_events_version_service(event_status, session=db)
+    validator = make_validator("events", event_status, *version, cursor, limit)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    try:
+        page = await event_services.get_events_by_status_service(
+            event_status, cursor, limit, version=version, session=db
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return serialized_response(page, event_services.EVENT_PAGE, response)
\ No newline at end of file
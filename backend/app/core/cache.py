@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""In-process caches for MGLTickets."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+from app.core.config import USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS, TOKEN_CACHE_SIZE
+from app.core.metrics import registry
+
+V = TypeVar("V")
+
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ("cache", "result"),
+)
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe LRU cache whose entries also expire after a time to live.
+    When full, the least recently used entry is evicted.
+    Entries live in process memory, so each worker has its own copy.
+
+    Every invalidation starts a new generation. A caller that loads a value
+    after a miss passes the generation it read before loading, and the value
+    is not stored if an invalidation happened meanwhile, so a load that raced
+    with a write cannot put the old value back.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()  # key -> (expires_at, value)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def generation(self) -> int:
+        """Read before loading a missing value, then pass it to set()."""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Optional[V]:
+        """Return the cached value, or `default` if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                self._data.move_to_end(key)
+                CACHE_REQUESTS.inc(cache=self.name, result="hit")
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return default
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None, generation: Optional[int] = None) -> None:
+        """
+        Store a value, optionally with its own time to live in seconds.
+        With a `generation`, the value is dropped if the cache was invalidated since.
+        """
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+
+# Authenticated users (UserOut) by user ID, read by get_current_user on every request
+user_cache: TTLCache = TTLCache("user", USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS)
+
+# Decoded JWT payloads by token hash, each kept only until the token's exp
+token_cache: TTLCache = TTLCache("token", TOKEN_CACHE_SIZE, 0)
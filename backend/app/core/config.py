@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Configuration settings for MGLTickets."""
 
+import hashlib
+import hmac
+import os
 from starlette.config import Config
-from starlette.datastructures import Secret
+from starlette.datastructures import Secret, CommaSeparatedStrings
 
 # Load environment variables from a .env file
 config = Config(".env")
@@ -16,14 +19,113 @@ DB_NAME: str = config("DB_NAME")
 
 # Construct the SQLAlchemy Database URI
 # get_secret_value() is used to retrieve the actual password string from the Secret object
-DATABASE_URL: str = (
+# DATABASE_URL / ASYNC_DATABASE_URL override the built URIs, e.g. to point the tests at another database
+DATABASE_URL: str = config("DATABASE_URL", default=(
     f"postgresql+psycopg2://{DB_USER}:{str(DB_PASSWORD)}@"
     f"{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
+))
+
+# Async SQLAlchemy Database URI (asyncpg driver) used by the async request path
+ASYNC_DATABASE_URL: str = config("ASYNC_DATABASE_URL", default=(
+    f"postgresql+asyncpg://{DB_USER}:{str(DB_PASSWORD)}@"
+    f"{DB_HOST}:{DB_PORT}/{DB_NAME}"
+))
 
 # Optional SQLAlchemy settings
 SQLALCHEMY_ECHO: bool = config("SQLALCHEMY_ECHO", cast=bool, default=False)
 
+# Connection pool settings, applied per engine in every worker process
+DB_POOL_SIZE: int = config("DB_POOL_SIZE", cast=int, default=5)
+DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", cast=int, default=10)
+DB_POOL_TIMEOUT: float = config("DB_POOL_TIMEOUT", cast=float, default=30.0)  # seconds to wait for a connection
+DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", cast=int, default=1800)  # seconds, -1 disables recycling
+DB_POOL_PRE_PING: bool = config("DB_POOL_PRE_PING", cast=bool, default=True)
+
+# Keyset pagination for list endpoints
+PAGE_SIZE_DEFAULT: int = config("PAGE_SIZE_DEFAULT", cast=int, default=50)
+PAGE_SIZE_MAX: int = config("PAGE_SIZE_MAX", cast=int, default=200)
+
+# Ticket holds: a pending booking keeps its stock reserved for this long
+BOOKING_HOLD_TTL_SECONDS: int = config("BOOKING_HOLD_TTL_SECONDS", cast=int, default=600)
+HOLD_SWEEPER_ENABLED: bool = config("HOLD_SWEEPER_ENABLED", cast=bool, default=True)
+HOLD_SWEEP_INTERVAL_SECONDS: float = config("HOLD_SWEEP_INTERVAL_SECONDS", cast=float, default=5.0)
+HOLD_SWEEP_BATCH_SIZE: int = config("HOLD_SWEEP_BATCH_SIZE", cast=int, default=500)
+
+# Flash-sale waiting room: events listed here queue buyers before booking.
+# Rooms are kept in process memory: run a single worker, or route each event to one worker.
+WAITING_ROOM_EVENT_IDS: list[int] = [
+    int(event_id) for event_id in config("WAITING_ROOM_EVENT_IDS", cast=CommaSeparatedStrings, default="")
+]
+WAITING_ROOM_ADMIT_RATE: float = config("WAITING_ROOM_ADMIT_RATE", cast=float, default=20.0)  # buyers per second, per worker
+WAITING_ROOM_BURST: int = config("WAITING_ROOM_BURST", cast=int, default=50)  # admitted immediately when the room opens
+WAITING_ROOM_TOKEN_TTL_SECONDS: float = config("WAITING_ROOM_TOKEN_TTL_SECONDS", cast=float, default=300.0)  # admitted tokens expire about this long after admission
+
+# Gate check-in
+CHECKIN_SYNC_MAX_SCANS: int = config("CHECKIN_SYNC_MAX_SCANS", cast=int, default=5000)  # scans per offline sync batch
+# Codes missing from a preloaded index are rejected in memory; at most this often, a miss first
+# pulls tickets issued since the last load, so tickets sold at the door are admitted within this delay
+CHECKIN_INDEX_REFRESH_SECONDS: float = config("CHECKIN_INDEX_REFRESH_SECONDS", cast=float, default=2.0)
+EVENT_OWNER_CACHE_TTL_SECONDS: float = config("EVENT_OWNER_CACHE_TTL_SECONDS", cast=float, default=60.0)  # gate staff checks
+
+# Authenticated-user cache, per worker. Role and account changes made by
+# another worker show up here after at most the TTL, so keep it short.
+USER_CACHE_SIZE: int = config("USER_CACHE_SIZE", cast=int, default=10000)
+USER_CACHE_TTL_SECONDS: float = config("USER_CACHE_TTL_SECONDS", cast=float, default=15.0)
+
+# Verified access tokens, per worker. Entries expire with the token itself.
+TOKEN_CACHE_SIZE: int = config("TOKEN_CACHE_SIZE", cast=int, default=10000)
+
+# Argon2 password hashing. Cost parameters only apply to newly created hashes.
+ARGON2_TIME_COST: int = config("ARGON2_TIME_COST", cast=int, default=2)
+ARGON2_MEMORY_COST: int = config("ARGON2_MEMORY_COST", cast=int, default=102400)  # KiB
+ARGON2_PARALLELISM: int = config("ARGON2_PARALLELISM", cast=int, default=8)
+HASH_WORKERS: int = config("HASH_WORKERS", cast=int, default=os.cpu_count() or 1)  # hashing threads per worker
+HASH_MAX_PENDING: int = config("HASH_MAX_PENDING", cast=int, default=64)  # queued + running, beyond this logins get 503
+
+# Revoked access tokens (logout), stored in the database and mirrored in a per-worker
+# bloom filter. Other workers reject a revoked token after at most the sync interval.
+REVOCATION_BLOOM_CAPACITY: int = config("REVOCATION_BLOOM_CAPACITY", cast=int, default=100000)
+REVOCATION_BLOOM_ERROR_RATE: float = config("REVOCATION_BLOOM_ERROR_RATE", cast=float, default=0.001)
+REVOCATION_SYNC_INTERVAL_SECONDS: float = config("REVOCATION_SYNC_INTERVAL_SECONDS", cast=float, default=1.0)
+REVOCATION_PRUNE_INTERVAL_SECONDS: float = config("REVOCATION_PRUNE_INTERVAL_SECONDS", cast=float, default=300.0)
+
+# Logging: records go through a bounded in-memory queue to a background writer
+LOG_QUEUE_SIZE: int = config("LOG_QUEUE_SIZE", cast=int, default=10000)
+LOG_QUEUE_FULL_POLICY: str = config("LOG_QUEUE_FULL_POLICY", default="drop")  # drop or block, anything else fails at startup
+LOG_QUEUE_BLOCK_TIMEOUT: float = config("LOG_QUEUE_BLOCK_TIMEOUT", cast=float, default=0.05)  # seconds, "block" only
+
+# Log sampling: keep this fraction of successful requests' INFO logs. Responses with
+# a status of LOG_ALWAYS_STATUS or above (client and server errors by default) and
+# slow requests are always logged. Overrides are "path_prefix=rate" pairs,
+# e.g. "/metrics=0,/api/v1/events=0.05", the longest matching prefix wins.
+LOG_SAMPLE_RATE: float = config("LOG_SAMPLE_RATE", cast=float, default=1.0)
+LOG_SLOW_REQUEST_MS: float = config("LOG_SLOW_REQUEST_MS", cast=float, default=1000.0)
+LOG_ALWAYS_STATUS: int = config("LOG_ALWAYS_STATUS", cast=int, default=400)  # 500 samples client errors too
+LOG_SAMPLE_RATE_OVERRIDES: dict[str, float] = {
+    path.strip(): float(rate)
+    for path, rate in (
+        item.split("=", 1) for item in config("LOG_SAMPLE_RATE_OVERRIDES", cast=CommaSeparatedStrings, default="")
+    )
+}
+
+# SQL query profiler: "off", "header" (requests sending X-Query-Profile: 1) or "always"
+QUERY_PROFILER: str = config("QUERY_PROFILER", default="off")
+QUERY_PROFILER_REPEAT_THRESHOLD: int = config("QUERY_PROFILER_REPEAT_THRESHOLD", cast=int, default=5)  # same SQL this often is flagged
+
+# Event catalog cache for public listings: "memory" (per worker) or "redis" (shared, needs REDIS_URL)
+CATALOG_CACHE_BACKEND: str = config("CATALOG_CACHE_BACKEND", default="memory")
+CATALOG_CACHE_TTL_SECONDS: float = config("CATALOG_CACHE_TTL_SECONDS", cast=float, default=30.0)
+CATALOG_CACHE_SIZE: int = config("CATALOG_CACHE_SIZE", cast=int, default=1000)  # listings kept, memory backend
+REDIS_URL: str = config("REDIS_URL", default="")
+
 # Other secrets
 SECRET_KEY: str = config("SECRET_KEY", cast=Secret)
-ALGORITHM: str = config("ALGORITHM", default="HS256")
\ No newline at end of file
+ALGORITHM: str = config("ALGORITHM", default="HS256")
+
+# Key shared with gate devices to verify offline scanner bundles.
+# Defaults to a key derived from SECRET_KEY, so SECRET_KEY itself never leaves the server.
+SCANNER_BUNDLE_KEY: Secret = config(
+    "SCANNER_BUNDLE_KEY",
+    cast=Secret,
+    default=hmac.new(str(SECRET_KEY).encode(), b"scanner-bundle", hashlib.sha256).hexdigest(),
+)
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Password hashing for MGLTickets.
+
+Argon2 is deliberately slow, so hashing and verification run in a dedicated,
+size-limited thread pool instead of on the event loop. argon2-cffi releases
+the GIL while hashing, so the pool scales with CPU cores. Once
+HASH_MAX_PENDING jobs are queued or running, new ones are refused with
+HashingBusyError rather than piling up behind a login storm.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from passlib.hash import argon2
+
+from app.core.config import (
+    ARGON2_TIME_COST,
+    ARGON2_MEMORY_COST,
+    ARGON2_PARALLELISM,
+    HASH_WORKERS,
+    HASH_MAX_PENDING,
+)
+from app.core.metrics import registry
+
+T = TypeVar("T")
+
+HASH_DURATION = registry.histogram(
+    "password_hash_seconds",
+    "Time spent in argon2, by operation (hash or verify).",
+    ("operation",),
+)
+HASH_REJECTED = registry.counter(
+    "password_hash_rejected_total",
+    "Hashing jobs refused because the hashing pool was saturated.",
+    ("operation",),
+)
+
+
+class HashingBusyError(RuntimeError):
+    """Raised when the hashing pool already has HASH_MAX_PENDING jobs."""
+
+
+# Hashes record their own parameters, so changing these only affects new hashes
+_hasher = argon2.using(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(HASH_MAX_PENDING)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Create the hashing pool on first use (again after a shutdown)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="argon2")
+        return _executor
+
+
+def _timed(operation: str, function: Callable[[], T]) -> Callable[[], T]:
+    def run() -> T:
+        start = time.perf_counter()
+        try:
+            return function()
+        finally:
+            HASH_DURATION.observe(time.perf_counter() - start, operation=operation)
+    return run
+
+
+async def _submit(operation: str, function: Callable[[], T]) -> T:
+    """Run `function` on the hashing pool, or fail fast if the pool is saturated."""
+    if not _slots.acquire(blocking=False):
+        HASH_REJECTED.inc(operation=operation)
+        raise HashingBusyError("Too many password operations in progress, please retry.")
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), _timed(operation, function))
+    finally:
+        _slots.release()
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with argon2 off the event loop."""
+    return await _submit("hash", lambda: _hasher.hash(password))
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against an argon2 hash off the event loop."""
+    return await _submit("verify", lambda: _hasher.verify(password, password_hash))
+
+
+def shutdown_hashing_pool() -> None:
+    """Stop the hashing threads, letting queued jobs finish."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
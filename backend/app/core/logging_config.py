@@ -1,16 +1,55 @@
 #!/usr/bin/env python
 """Logging configuration for MGLTickets."""
 
+import atexit
 import logging
 import json
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from pathlib import Path
 from contextvars import ContextVar
+from typing import Optional
+
+from app.core.config import (
+    LOG_QUEUE_SIZE,
+    LOG_QUEUE_FULL_POLICY,
+    LOG_QUEUE_BLOCK_TIMEOUT,
+    LOG_SAMPLE_RATE,
+    LOG_SAMPLE_RATE_OVERRIDES,
+)
+from app.core.metrics import registry
+
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+LOG_RECORDS_DROPPED = registry.counter(
+    "log_records_dropped_total",
+    "Log records discarded because the log queue was full.",
+)
 
 
 # Context variables for request-scoped logging
 user_id_var: ContextVar[str] = ContextVar("user_id", default="anonymous")
 role_var: ContextVar[str] = ContextVar("role", default="guest")
+# Whether the current request was picked for logging, see sample_request()
+log_sampled_var: ContextVar[bool] = ContextVar("log_sampled", default=True)
+
+# Longest prefix first, so the most specific override wins
+_sample_rate_overrides = sorted(LOG_SAMPLE_RATE_OVERRIDES.items(), key=lambda item: len(item[0]), reverse=True)
+
+
+def sample_request(path: str) -> bool:
+    """Decide whether a request's INFO logs are kept, using the rate configured for its path."""
+    rate = LOG_SAMPLE_RATE
+    for prefix, prefix_rate in _sample_rate_overrides:
+        if path.startswith(prefix):
+            rate = prefix_rate
+            break
+    return rate >= 1.0 or random.random() < rate
 
 
 class ContextFilter(logging.Filter):
@@ -22,9 +61,38 @@ class ContextFilter(logging.Filter):
         return True
 
 
+def _dumps(log_data: dict) -> str:
+    """Serialize a log record, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(log_data, default=str).decode()
+    return json.dumps(log_data, default=str, separators=(",", ":"))
+
+
+class SamplingFilter(logging.Filter):
+    """Drops records below WARNING logged while handling a request that was not sampled."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or log_sampled_var.get()
+
+
 class JSONFormatter(logging.Formatter):
     """Formatter that outputs logs in structured JSON."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Records arrive many per second, so the date part is formatted once per second
+        self._cached_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._cached_time
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
             "timestamp": self.formatTime(record, self.datefmt),
@@ -40,11 +108,50 @@ class JSONFormatter(logging.Formatter):
         if record.__dict__.get("extra", None):
             log_data.update(record.__dict__["extra"])
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler over a bounded queue. When the queue is full the record is
+    dropped right away ("drop") or after waiting up to `block_timeout`
+    seconds for space ("block"), and counted in log_records_dropped_total.
+    Any other policy raises ValueError, so a typo fails at startup instead of
+    silently dropping logs.
+    """
+
+    policies = ("drop", "block")
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop", block_timeout: float = 0.05):
+        if policy not in self.policies:
+            raise ValueError(f"LOG_QUEUE_FULL_POLICY must be one of {', '.join(self.policies)}, got {policy!r}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+
+_listener: Optional[QueueListener] = None
 
 
 def configure_logging() -> None:
-    """Configure the application logging system with JSON logs."""
+    """
+    Configure the application logging system with JSON logs.
+    Records are handed to a bounded queue on the calling thread, and a
+    background listener thread formats them and writes the file, so disk
+    I/O and rotation never run on the event loop.
+    """
+    global _listener
+    if _listener is not None:
+        return
 
     logs_dir = Path("app/logs/")
     logs_dir.mkdir(exist_ok=True)
@@ -58,10 +165,30 @@ def configure_logging() -> None:
     )
     file_handler.setFormatter(JSONFormatter())
 
+    queue_handler = BoundedQueueHandler(
+        queue.Queue(maxsize=LOG_QUEUE_SIZE),
+        policy=LOG_QUEUE_FULL_POLICY,
+        block_timeout=LOG_QUEUE_BLOCK_TIMEOUT,
+    )
+    # Handler filters run on the logging thread, so the request's context vars are captured
+    queue_handler.addFilter(SamplingFilter())
+    queue_handler.addFilter(ContextFilter())
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(file_handler)
-    root_logger.addFilter(ContextFilter())
+    root_logger.addHandler(queue_handler)
+
+    _listener = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Write out the queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 # App-level logger
@@ -1,52 +1,104 @@
 #!/usr/bin/env python3
 """Logging middleware for MGLTickets."""
 
-from typing import Awaitable, Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.logging_config import logger, user_id_var, role_var
+from app.core.logging_config import logger, user_id_var, role_var, log_sampled_var, sample_request
+from app.core.config import LOG_ALWAYS_STATUS, LOG_SLOW_REQUEST_MS
+from app.core.metrics import registry
 
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method and response status.",
+    ("method", "status"),
+)
+HTTP_RESPONSE_SIZE = registry.histogram(
+    "http_response_size_bytes",
+    "Size of HTTP response bodies.",
+    ("method",),
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+
+class LoggingMiddleware:
     """
-    Middleware that attaches contextual user data to each log entry.
-    BaseHTTPMiddleware allows us to run code before and after each request.
+    Pure ASGI middleware that logs each request and its response with the
+    status, body size and duration, and records them as metrics.
+    Unlike BaseHTTPMiddleware it adds no extra task or body stream per
+    request, so streaming responses pass straight through.
     """
 
     def __init__(self, app: ASGIApp):
         """Initializes the middleware with the FastAPI app instance"""
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Runs for every HTTP request, and logs the request and response.
         """
-        # Extract user from request
-        user = getattr(request.state, "user", None)
-
-        if user:
-            user_id_var.set(str(getattr(user, "id", "unknown")))
-            role_var.set(str(getattr(user, "role", "unknown")))
-        else:
-            user_id_var.set("anonymous")
-            role_var.set("guest")
-
-        logger.info("Incoming request", extra={"extra": {
-            "method": request.method,
-            "path": request.url.path,
-        }})
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        # Repeated on the response record: when only that one is force-logged (an error or a
+        # slow request that was not sampled), it still says what the request was
+        request_fields = {
+            "method": method,
+            "path": path,
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "client": client[0] if client else None,
+        }
+
+        # get_current_user sets these once the user is known
+        user_id_var.set("anonymous")
+        role_var.set("guest")
+        # Only a sample of requests log at INFO, see LOG_SAMPLE_RATE
+        log_sampled_var.set(sample_request(path))
+
+        logger.info("Incoming request", extra={"extra": request_fields})
 
-        response = await call_next(request)
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            log_sampled_var.set(True)
+            logger.exception("Unhandled error", extra={"extra": request_fields})
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            # Label by template (/events/{event_id}) rather than raw path to bound cardinality
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(duration_ms / 1000, method=method, route=route)
+            HTTP_REQUESTS.inc(method=method, status=status_code)
+            HTTP_RESPONSE_SIZE.observe(response_size, method=method)
+
+        # Errors (4xx included by default) and slow requests are always logged
+        if status_code >= LOG_ALWAYS_STATUS or duration_ms >= LOG_SLOW_REQUEST_MS:
+            log_sampled_var.set(True)
 
         logger.info("Outgoing response", extra={"extra": {
-            "status": response.status_code,
-            "path": request.url.path,
+            **request_fields,
+            "status": status_code,
+            "duration_ms": round(duration_ms, 2),
+            "response_bytes": response_size,
         }})
-
-        return response
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Query profiling middleware for MGLTickets."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import QUERY_PROFILER
+from app.core.logging_config import logger, log_sampled_var
+from app.db.profiler import profile_queries
+
+PROFILE_HEADER = b"x-query-profile"
+
+
+class QueryProfilerMiddleware:
+    """
+    Profiles the SQL executed by a request when QUERY_PROFILER is "always", or
+    when it is "header" and the request sends `X-Query-Profile: 1`.
+    Logs a per-request summary (a warning when statements repeat) and adds
+    a Server-Timing header with the query count and time so far.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _enabled(self, scope: Scope) -> bool:
+        if QUERY_PROFILER == "always":
+            return True
+        if QUERY_PROFILER == "header":
+            return dict(scope["headers"]).get(PROFILE_HEADER) in (b"1", b"true")
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._enabled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    server_timing = f'db;dur={profile.total_time * 1000:.2f};desc="{profile.count} queries"'
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (b"server-timing", server_timing.encode()),
+                    ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                summary = profile.summary()
+                route = getattr(scope.get("route"), "path", scope["path"])
+                extra = {"extra": {"method": scope["method"], "route": route, **summary}}
+                # A profiled request was asked for, so its summary bypasses log sampling
+                log_sampled_var.set(True)
+                if summary["repeated_queries"]:
+                    logger.warning("Repeated queries in request, possible N+1", extra=extra)
+                else:
+                    logger.info("Query profile", extra=extra)
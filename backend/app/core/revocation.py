@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Access token revocation for MGLTickets.
+
+Revoked token IDs (the `jti` claim) are stored in the revoked_tokens table
+until the token would have expired anyway, so a logout applies to every
+worker and survives restarts. Every authenticated request checks its token,
+so the check goes through an in-process bloom filter first: tokens that were
+never revoked, i.e. almost all of them, are cleared without touching the
+database, and only filter hits are confirmed against the table.
+
+Each worker keeps its filter current in the background: every
+REVOCATION_SYNC_INTERVAL_SECONDS it adds the revocations made since its last
+sync, and every REVOCATION_PRUNE_INTERVAL_SECONDS it rebuilds the filter
+without expired IDs and deletes their rows. A logout is rejected at once on
+the worker that served it, and on the others after at most one sync interval.
+"""
+
+import asyncio
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import (
+    REVOCATION_BLOOM_CAPACITY,
+    REVOCATION_BLOOM_ERROR_RATE,
+    REVOCATION_SYNC_INTERVAL_SECONDS,
+    REVOCATION_PRUNE_INTERVAL_SECONDS,
+)
+from app.core.logging_config import logger
+from app.core.metrics import registry
+from app.db.repositories import async_revoked_token_repo as revoked_token_repo
+
+REVOKED_TOKENS = registry.gauge(
+    "revoked_tokens",
+    "Revoked token IDs in this worker's bloom filter, including expired ones not pruned yet.",
+)
+REVOCATION_CHECKS = registry.counter(
+    "revocation_checks_total",
+    "Revocation checks that reached the database, by result (revoked or false_positive).",
+    ("result",),
+)
+
+# Syncs look back a little further than the last one, to allow for clock skew
+# between workers and for revocations committed just after they were stamped
+_SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings, sized for `capacity` items at `error_rate`."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))  # bits
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0  # Items added, repeats included
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Double hashing: position i = h1 + i * h2
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationList:
+    """Bloom filter over the revoked_tokens table, synced in the background."""
+
+    def __init__(self, capacity: int, error_rate: float, sync_interval: float, prune_interval: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.prune_interval = prune_interval
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._synced_at: Optional[datetime] = None  # Start of the last successful sync, None until loaded
+        self._next_prune = time.monotonic() + prune_interval
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        REVOKED_TOKENS.set_function(lambda: self._bloom.count)
+
+    async def revoke(self, jti: str, expires_at: float, session: Optional[AsyncSession] = None) -> None:
+        """Revoke a token until `expires_at` (POSIX seconds), after which it is rejected as expired anyway."""
+        if expires_at <= time.time():
+            return
+        await revoked_token_repo.revoke_token_repo(
+            jti, datetime.fromtimestamp(expires_at, timezone.utc), session=session
+        )
+        with self._lock:
+            self._bloom.add(jti)
+
+    async def is_revoked(self, jti: Optional[str], session: Optional[AsyncSession] = None) -> bool:
+        """Whether the token with this ID has been revoked. Only bloom filter hits query the database."""
+        if not jti or jti not in self._bloom:
+            return False
+        revoked = await revoked_token_repo.is_token_revoked_repo(jti, session=session)
+        REVOCATION_CHECKS.inc(result="revoked" if revoked else "false_positive")
+        return revoked
+
+    async def sync(self) -> None:
+        """Add revocations made since the last sync, by any worker, to the filter."""
+        if self._synced_at is None:
+            await self.rebuild()
+            return
+        synced_at = datetime.now(timezone.utc)
+        jtis = await revoked_token_repo.get_revoked_jtis_repo(revoked_since=self._synced_at - _SYNC_OVERLAP)
+        with self._lock:
+            for jti in jtis:
+                self._bloom.add(jti)
+            self._synced_at = synced_at
+
+    async def rebuild(self) -> None:
+        """Reload the filter from the unexpired revocations, dropping expired IDs."""
+        synced_at = datetime.now(timezone.utc)
+        jtis = await revoked_token_repo.get_revoked_jtis_repo()
+        # Grow the filter if more tokens are revoked than it was sized for
+        bloom = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        with self._lock:
+            # Revocations made on this worker during the reload are in the table already,
+            # the next sync adds them back since it looks back past synced_at
+            self._bloom = bloom
+            self._synced_at = synced_at
+            self._next_prune = time.monotonic() + self.prune_interval
+
+    async def prune(self) -> None:
+        """Delete expired revocations from the table and rebuild the filter without them."""
+        removed = await revoked_token_repo.delete_expired_revocations_repo()
+        await self.rebuild()
+        logger.info("Pruned %s expired token revocations", removed)
+
+    def clear(self) -> None:
+        """Forget every loaded revocation, the next sync reloads them from the table."""
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._synced_at = None
+
+    def start(self) -> None:
+        """Start syncing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="revocation-sync")
+
+    async def stop(self) -> None:
+        """Stop syncing and wait for the current sync to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if time.monotonic() >= self._next_prune:
+                    await self.prune()
+                else:
+                    await self.sync()
+            except Exception:
+                logger.exception("Token revocation sync failed")
+            await asyncio.sleep(self.sync_interval)
+
+
+revocation_list = RevocationList(
+    REVOCATION_BLOOM_CAPACITY,
+    REVOCATION_BLOOM_ERROR_RATE,
+    REVOCATION_SYNC_INTERVAL_SECONDS,
+    REVOCATION_PRUNE_INTERVAL_SECONDS,
+)
@@ -1,18 +1,28 @@
 #!/usr/bin/env python3
 """Security for MGLTickets."""
 
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 
 from fastapi import Request, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 
-from app.services.user_services import get_user_by_id_service
+from app.services.user_services import get_cached_user_by_id_service
 from app.core.config import SECRET_KEY, ALGORITHM
+from app.core.cache import token_cache
+from app.core.revocation import revocation_list
+from app.core.logging_config import user_id_var, role_var
+from app.api.dependencies import DBSession
 
 # FastAPI security scheme
 bearer_scheme = HTTPBearer()
 
+# Signing key, unwrapped from the Secret once instead of on every token
+SIGNING_KEY = str(SECRET_KEY)
+
 def create_access_token(user_id: int, expires_minutes: int = 60) -> str:
     """Create a signed JWT."""
     if not "user_id":
@@ -20,13 +30,32 @@ def create_access_token(user_id: int, expires_minutes: int = 60) -> str:
     
     payload = {
         "id": user_id,
-        "exp": datetime.utcnow() + timedelta(minutes=expires_minutes)
+        "exp": datetime.utcnow() + timedelta(minutes=expires_minutes),
+        "jti": uuid.uuid4().hex,  # Token ID, lets a single token be revoked
     }
 
-    return jwt.encode(payload, str(SECRET_KEY), algorithm=ALGORITHM)
+    return jwt.encode(payload, SIGNING_KEY, algorithm=ALGORITHM)
+
+def decode_access_token(token: str) -> dict:
+    """
+    Verify a JWT and return its payload, raising JWTError if it is invalid or expired.
+    Verified payloads are cached by token hash until the token's exp, so repeat
+    requests with the same token skip the signature check.
+    """
+    token_key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(token_key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, SIGNING_KEY, algorithms=[ALGORITHM])
+    ttl = payload.get("exp", 0) - time.time()
+    if ttl > 0:
+        token_cache.set(token_key, payload, ttl=ttl)
+    return payload
 
-def get_current_user(
+async def get_current_user(
     request: Request,
+    db: DBSession,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
 ) -> dict:
     """
@@ -41,7 +70,7 @@ def get_current_user(
         return None
 
     try:
-        payload = jwt.decode(token, str(SECRET_KEY), algorithms=[ALGORITHM])
+        payload = decode_access_token(token)
        
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
@@ -49,13 +78,22 @@ def get_current_user(
     user_id = payload.get("id")
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+
+    if await revocation_list.is_revoked(payload.get("jti"), session=db):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
     
-    user = get_user_by_id_service(user_id)
+    # Served from the per-worker user cache, user_repo writes invalidate it
+    user = await get_cached_user_by_id_service(user_id, session=db)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    if not user.is_active:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User account is deactivated")
 
-    # Attach user to request state - picked up by logging middleware
+    # Attach user to request state and the logging context
     request.state.user = user
+    request.state.token_payload = payload
+    user_id_var.set(str(user.id))
+    role_var.set(str(user.role))
 
     return user
\ No newline at end of file
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Async database connection and session management for MGLTickets."""
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Optional
+from contextlib import asynccontextmanager
+
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    SQLALCHEMY_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
+from app.db.instrumentation import InstrumentedAsyncQueuePool, register_pool_gauges, register_query_metrics
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=SQLALCHEMY_ECHO,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+register_pool_gauges(async_engine.sync_engine, "async")
+register_query_metrics(async_engine.sync_engine, "async")
+
+# expire_on_commit=False keeps loaded attributes usable after commit,
+# lazy refreshes are not possible once the session has been awaited out.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run `callback` once `session`'s transaction has been committed by get_async_session."""
+    session.info.setdefault("after_commit", []).append(callback)
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an async transactional scope around a series of operations."""
+    session: AsyncSession = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        callbacks = session.info.pop("after_commit", [])
+        await session.close()
+    for callback in callbacks:
+        await callback()
+
+@asynccontextmanager
+async def use_async_session(session: Optional[AsyncSession] = None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Reuse the caller's session (request-scoped unit of work) when given one,
+    otherwise open a new transactional scope for this call only.
+    """
+    if session is not None:
+        yield session
+        return
+    async with get_async_session() as new_session:
+        yield new_session
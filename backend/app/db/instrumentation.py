@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Connection pool and query instrumentation for MGLTickets."""
+
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+from app.core.metrics import registry
+from app.db.profiler import current_query_profile
+
+POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    ("pool",),
+)
+POOL_CHECKOUT_TIMEOUTS = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout.",
+    ("pool",),
+)
+POOL_IN_USE = registry.gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the pool.",
+    ("pool",),
+)
+POOL_IDLE = registry.gauge(
+    "db_pool_connections_idle",
+    "Connections sitting idle in the pool.",
+    ("pool",),
+)
+POOL_OVERFLOW = registry.gauge(
+    "db_pool_overflow",
+    "Connections opened beyond pool_size (negative while the pool is still filling).",
+    ("pool",),
+)
+POOL_SIZE = registry.gauge(
+    "db_pool_size",
+    "Configured number of persistent connections in the pool.",
+    ("pool",),
+)
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds",
+    "Time spent executing SQL statements, by engine and statement type.",
+    ("engine", "statement"),
+)
+DB_QUERY_ERRORS = registry.counter(
+    "db_query_errors_total",
+    "SQL statements that raised an error.",
+    ("engine",),
+)
+
+_STATEMENT_TYPES = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+
+class _CheckoutTimingMixin:
+    """Records how long each checkout waits, and checkouts that time out."""
+
+    metrics_label = "sync"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc(pool=self.metrics_label)
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start, pool=self.metrics_label)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """QueuePool for the sync engine that exports checkout metrics."""
+
+    metrics_label = "sync"
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool for the async engine that exports checkout metrics."""
+
+    metrics_label = "async"
+
+
+def register_pool_gauges(engine: Engine, label: str) -> None:
+    """Expose pool saturation gauges, read from `engine.pool` at scrape time."""
+    # engine.pool is looked up on every scrape, dispose() swaps in a new pool
+    POOL_IN_USE.set_function(lambda: engine.pool.checkedout(), pool=label)
+    POOL_IDLE.set_function(lambda: engine.pool.checkedin(), pool=label)
+    POOL_OVERFLOW.set_function(lambda: engine.pool.overflow(), pool=label)
+    POOL_SIZE.set_function(lambda: engine.pool.size(), pool=label)
+
+
+def _statement_type(statement: str) -> str:
+    """First keyword of a statement, so metric labels stay bounded."""
+    keyword = statement.lstrip()[:6].upper()
+    return keyword if keyword in _STATEMENT_TYPES else "OTHER"
+
+
+def register_query_metrics(engine: Engine, label: str) -> None:
+    """Time every statement executed on `engine` through cursor execute events."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["query_start_time"].pop()
+        DB_QUERY_DURATION.observe(duration, engine=label, statement=_statement_type(statement))
+        profile = current_query_profile.get()
+        if profile is not None:
+            profile.record(statement, duration)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+        DB_QUERY_ERRORS.inc(engine=label)
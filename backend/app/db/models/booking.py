@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Booking model for MGLTickets."""
 
-from sqlalchemy import ForeignKey, Integer, DateTime, String
+from sqlalchemy import ForeignKey, Integer, DateTime, String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 from datetime import datetime, timezone
@@ -18,12 +18,18 @@ class Booking(Base):
     """Booking model representing a ticket booking in the system."""
 
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_bookings_created_at_id", "created_at", "id"),
+        # Hold expiry sweeps scan pending bookings oldest first
+        Index("ix_bookings_status_created_at", "status", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     ticket_type_id: Mapped[int] = mapped_column(Integer, ForeignKey("ticket_types.id"), nullable=False)
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
-    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")  # e.g., pending, confirmed, cancelled
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")  # e.g., pending, confirmed, cancelled, expired
     total_price: Mapped[int] = mapped_column(nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Database Event model for MGLTickets."""
 
-from sqlalchemy import ForeignKey, Integer, String, DateTime
+from sqlalchemy import ForeignKey, Integer, String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime, timezone
@@ -17,6 +17,14 @@ class Event(Base):
     """Event model representing an event in the system."""
 
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_events_start_time_id", "start_time", "id"),
+        Index("ix_events_status_start_time_id", "status", "start_time", "id"),
+        # Listing versions (count, max updated_at) for ETags, read on every list request
+        Index("ix_events_updated_at", "updated_at"),
+        Index("ix_events_status_updated_at", "status", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -45,8 +53,8 @@ class Event(Base):
     organizer_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     organizer: Mapped["User"] = relationship("User", back_populates="events")
 
-    # Foreign key relationship to Booking (bookings)
-    bookings: Mapped[list["Booking"]] = relationship("Booking", back_populates="event")
+    # Bookings of all the event's ticket types, reached through ticket_types (read-only)
+    bookings: Mapped[list["Booking"]] = relationship("Booking", secondary="ticket_types", viewonly=True)
     ticket_types: Mapped[list["TicketType"]] = relationship("TicketType", back_populates="event")    
 
     def __repr__(self) -> str:
@@ -2,7 +2,7 @@
 
 """Payment model for MGLTickets."""
 
-from sqlalchemy import ForeignKey, Integer, String, DateTime
+from sqlalchemy import ForeignKey, Integer, String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime, timezone
@@ -16,13 +16,17 @@ class Payment(Base):
     """Payment model representing a payment in the system."""
 
     __tablename__ = "payments"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_payments_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     booking_id: Mapped[int] = mapped_column(Integer, ForeignKey("bookings.id"), nullable=False)
     amount: Mapped[float] = mapped_column(nullable=False)
     currency: Mapped[str] = mapped_column(String(10), nullable=False, default="KES")
     method: Mapped[str] = mapped_column(String(50), nullable=False)  # e.g., credit_card, paypal, m-pesa
-    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")  # e.g., pending, completed, failed, refunded
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")  # e.g., pending, completed, failed, refund_required, refunded
     mpesa_ref: Mapped[str] = mapped_column(String(100), nullable=False)
     callback_payload: Mapped[Optional[str]] = mapped_column(String(2000), nullable=True, default=None)  # Full M-Pesa response (for auditing)
     created_at: Mapped[datetime] = mapped_column(
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""RevokedToken model for MGLTickets."""
+
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime, timezone
+from app.db.session import Base
+
+class RevokedToken(Base):
+    """An access token revoked on logout, kept until the token would have expired anyway."""
+
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String(64), primary_key=True)  # Token ID claim
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)  # Token exp
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        index=True,  # Workers pull revocations newer than their last sync
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<RevokedToken jti={self.jti} expires_at={self.expires_at}>"
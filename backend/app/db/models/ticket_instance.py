@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """TicketInstance model for MGLTickets."""
 
-from sqlalchemy import ForeignKey, Integer, DateTime, String
+from sqlalchemy import ForeignKey, Integer, DateTime, String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING, Optional
 from datetime import datetime, timezone
@@ -17,6 +17,10 @@ class TicketInstance(Base):
     """TicketInstance model representing individual ticket instances issued for bookings."""
 
     __tablename__ = "ticket_instances"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_ticket_instances_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Database User model for MGLTickets."""
 
-from sqlalchemy import Integer, String, DateTime
+from sqlalchemy import Integer, String, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 from datetime import datetime, timezone
@@ -17,6 +17,10 @@ class User(Base):
     """User model representing a user in the system."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
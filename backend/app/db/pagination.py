@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Keyset (cursor) pagination helpers for MGLTickets repositories."""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.config import PAGE_SIZE_MAX
+from app.schemas.base import BaseModelEAT
+from app.schemas.pagination import Page
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    """Encode the (sort value, id) of the last row of a page as an opaque token."""
+    raw = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a token produced by encode_cursor, raising ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor.") from e
+
+
+def clamp_limit(limit: int) -> int:
+    """Keep the page size between 1 and PAGE_SIZE_MAX."""
+    return max(1, min(limit, PAGE_SIZE_MAX))
+
+
+def keyset_select(
+    model: Any,
+    sort_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    limit: int,
+    *criteria: Any,
+) -> Select:
+    """
+    Build a SELECT for the page after `cursor`, ordered by (sort_column, id).
+    One extra row is fetched to know whether another page follows.
+    """
+    stmt = select(model).where(*criteria)
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(sort_column, model.id) > tuple_(sort_value, last_id))
+    return stmt.order_by(sort_column, model.id).limit(clamp_limit(limit) + 1)
+
+
+def build_page(rows: Sequence[Any], schema: type[BaseModelEAT], sort_attr: str, limit: int) -> Page:
+    """Convert the rows of a keyset_select into a Page with its next cursor."""
+    limit = clamp_limit(limit)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(getattr(rows[-1], sort_attr), rows[-1].id) if has_more else None
+    return Page(items=[schema.model_validate(row) for row in rows], next_cursor=next_cursor)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Per-request SQL query profiler for MGLTickets.
+
+While a profile is active in the current context, every statement executed
+on the sync or async engine is recorded with its duration (see
+app.db.instrumentation). Statements run many times with the same SQL, such
+as a lazy relationship loaded once per row, are reported as repeated: the
+usual sign of an N+1 query pattern.
+
+Usable around any block of code, e.g. in a test:
+
+    with profile_queries() as profile:
+        ...
+    assert not profile.repeated()
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Generator
+from typing import Optional
+
+from app.core.config import QUERY_PROFILER_REPEAT_THRESHOLD
+
+current_query_profile: ContextVar[Optional["QueryProfile"]] = ContextVar("query_profile", default=None)
+
+
+class QueryProfile:
+    """Statements executed within one request or profiled block, with their timings."""
+
+    def __init__(self):
+        self.statements: list[tuple[str, float]] = []  # (SQL, seconds)
+        self._lock = threading.Lock()  # Sync routes run queries from worker threads
+
+    def record(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self.statements.append((statement, duration))
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_time(self) -> float:
+        return sum(duration for _, duration in self.statements)
+
+    def repeated(self, threshold: int = QUERY_PROFILER_REPEAT_THRESHOLD) -> dict[str, int]:
+        """Statements executed at least `threshold` times, with their counts."""
+        counts = Counter(statement for statement, _ in self.statements)
+        return {statement: n for statement, n in counts.most_common() if n >= threshold}
+
+    def summary(self, threshold: int = QUERY_PROFILER_REPEAT_THRESHOLD) -> dict:
+        """Compact report for logging."""
+        return {
+            "queries": self.count,
+            "query_ms": round(self.total_time * 1000, 2),
+            "slowest_query_ms": round(max((d for _, d in self.statements), default=0) * 1000, 2),
+            "repeated_queries": [
+                {"count": n, "statement": " ".join(statement.split())[:300]}
+                for statement, n in self.repeated(threshold).items()
+            ],
+        }
+
+
+@contextmanager
+def profile_queries() -> Generator[QueryProfile, None, None]:
+    """Record every statement executed in this context until the block exits."""
+    profile = QueryProfile()
+    token = current_query_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        current_query_profile.reset(token)
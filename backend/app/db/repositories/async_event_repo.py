@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Async repository for Event model operations."""
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.db.models.event import Event
+from app.db.async_session import use_async_session
+from typing import Optional
+from app.schemas.event import EventOut, EventDetailsOut, EventCreatWithFlyer, EventUpdate
+from app.schemas.pagination import Page
+from app.db.pagination import keyset_select, build_page
+from app.core.config import PAGE_SIZE_DEFAULT
+from datetime import datetime
+
+async def create_event_repo(event_data: EventCreatWithFlyer, session: Optional[AsyncSession] = None) -> EventOut:
+    """Create a new event in the database."""
+    async with use_async_session(session) as session:
+        new_event = Event(
+            title=event_data.title,
+            description=event_data.description,
+            venue=event_data.venue,
+            start_time=event_data.start_time,
+            end_time=event_data.end_time,
+            flyer_url=event_data.flyer_url,
+            organizer_id=event_data.organizer_id,
+        )
+        session.add(new_event)
+        await session.flush()
+        return EventOut.model_validate(new_event)
+
+async def update_event_repo(event_id: int, event_data: EventUpdate, session: Optional[AsyncSession] = None) -> Optional[EventOut]:
+    """Update an event in the database."""
+    async with use_async_session(session) as session:
+        event = await session.get(Event, event_id)
+        if event:
+            event.title = event_data.title
+            event.description = event_data.description
+            event.venue = event_data.venue
+            event.start_time = event_data.start_time
+            event.end_time = event_data.end_time
+            await session.flush()
+            return EventOut.model_validate(event)
+        return None
+
+async def get_approved_events_repo(session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get all approved events from the database."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.approved == True))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_unapproved_events_repo(session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get all unapproved events from the database."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.approved == False))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_all_events_repo(
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE_DEFAULT,
+    session: Optional[AsyncSession] = None,
+) -> Page[EventOut]:
+    """Get one page of events ordered by start time."""
+    async with use_async_session(session) as session:
+        stmt = keyset_select(Event, Event.start_time, cursor, limit)
+        events = (await session.scalars(stmt)).all()
+        return build_page(events, EventOut, "start_time", limit)
+
+async def get_event_by_id_repo(event_id: int, session: Optional[AsyncSession] = None) -> Optional[EventOut]:
+    """Retrieve an event by its ID."""
+    async with use_async_session(session) as session:
+        event = await session.get(Event, event_id)
+        return EventOut.model_validate(event) if event else None
+
+async def get_event_details_repo(event_id: int, session: Optional[AsyncSession] = None) -> Optional[EventDetailsOut]:
+    """Retrieve an event with its ticket types in two queries (event, then selectinload of ticket types)."""
+    async with use_async_session(session) as session:
+        stmt = select(Event).options(selectinload(Event.ticket_types)).where(Event.id == event_id)
+        event = await session.scalar(stmt)
+        return EventDetailsOut.model_validate(event) if event else None
+
+async def approve_event_repo(event_id: int, session: Optional[AsyncSession] = None) -> Optional[EventOut]:
+    """Approve an event."""
+    async with use_async_session(session) as session:
+        event = await session.get(Event, event_id)
+        if event:
+            event.approved = True
+            await session.flush()
+            return EventOut.model_validate(event)
+        return None
+
+async def reject_event_repo(event_id: int, session: Optional[AsyncSession] = None) -> bool:
+    """Reject an event."""
+    async with use_async_session(session) as session:
+        event = await session.get(Event, event_id)
+        if event:
+            event.rejected = True
+            await session.flush()
+            return True
+        return False
+
+async def delete_event_repo(event_id: int, session: Optional[AsyncSession] = None) -> bool:
+    """Delete an event by its ID."""
+    async with use_async_session(session) as session:
+        event = await session.get(Event, event_id)
+        if event:
+            await session.delete(event)
+            await session.flush()
+            return True
+        return False
+
+async def update_event_status_repo(event_id: int, new_status: str, session: Optional[AsyncSession] = None) -> Optional[EventOut]:
+    """Update the status of an event."""
+    async with use_async_session(session) as session:
+        event = await session.get(Event, event_id)
+        if event:
+            event.status = new_status
+            await session.flush()
+            return EventOut.model_validate(event)
+        return None
+
+async def get_events_by_organizer_repo(organizer_id: int, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get all events organized by a specific user."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.organizer_id == organizer_id))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_in_date_range_repo(start_date: datetime, end_date: datetime, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get all events within a specific date range."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(
+            select(Event).where(
+                Event.start_time >= start_date,
+                Event.end_time <= end_date
+            )
+        )
+        return [EventOut.model_validate(event) for event in events]
+
+async def search_events_by_title_repo(keyword: str, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Search events by title keyword."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.title.ilike(f"%{keyword}%")))
+        return [EventOut.model_validate(event) for event in events]
+
+async def count_events_repo(session: Optional[AsyncSession] = None) -> int:
+    """Count the total number of events in the database."""
+    async with use_async_session(session) as session:
+        count = await session.scalar(select(func.count()).select_from(Event))
+        return count
+
+async def get_events_version_repo(
+    status: Optional[str] = None,
+    session: Optional[AsyncSession] = None,
+) -> tuple[int, Optional[datetime]]:
+    """
+    Get the number of events (optionally with a given status) and their latest
+    `updated_at`. Any insert, update or delete changes one of the two, so
+    together they version a listing without loading it.
+    """
+    async with use_async_session(session) as session:
+        stmt = select(func.count(), func.max(Event.updated_at)).select_from(Event)
+        if status is not None:
+            stmt = stmt.where(Event.status == status)
+        count, last_updated = (await session.execute(stmt)).one()
+        return count, last_updated
+
+async def get_latest_events_repo(limit: int = 5, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get the latest added events."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).order_by(Event.created_at.desc()).limit(limit))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_by_status_repo(
+    status: str,
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE_DEFAULT,
+    session: Optional[AsyncSession] = None,
+) -> Page[EventOut]:
+    """Get one page of events with a given status, ordered by start time."""
+    async with use_async_session(session) as session:
+        stmt = keyset_select(Event, Event.start_time, cursor, limit, Event.status == status)
+        events = (await session.scalars(stmt)).all()
+        return build_page(events, EventOut, "start_time", limit)
+
+async def get_events_with_bookings_repo(session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get all events that have bookings."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.bookings.any()))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_without_bookings_repo(session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get all events that do not have any bookings."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(~Event.bookings.any()))
+        return [EventOut.model_validate(event) for event in events]
+
+async def search_events_by_venue_repo(venue: str, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events by venue."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.venue.ilike(f"%{venue}%")))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_created_after_repo(date: datetime, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events created after a specific date."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.created_at > date))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_created_before_repo(date: datetime, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events created before a specific date."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.created_at < date))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_updated_after_repo(date: datetime, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events updated after a specific date."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.updated_at > date))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_updated_before_repo(date: datetime, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events updated before a specific date."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.updated_at < date))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_sorted_by_start_time_repo(ascending: bool = True, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events sorted by their start time."""
+    async with use_async_session(session) as session:
+        order = Event.start_time.asc() if ascending else Event.start_time.desc()
+        events = await session.scalars(select(Event).order_by(order))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_sorted_by_end_time_repo(ascending: bool = True, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events sorted by their end time."""
+    async with use_async_session(session) as session:
+        order = Event.end_time.asc() if ascending else Event.end_time.desc()
+        events = await session.scalars(select(Event).order_by(order))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_sorted_by_creation_date_repo(ascending: bool = True, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events sorted by their creation date."""
+    async with use_async_session(session) as session:
+        order = Event.created_at.asc() if ascending else Event.created_at.desc()
+        events = await session.scalars(select(Event).order_by(order))
+        return [EventOut.model_validate(event) for event in events]
+
+async def get_events_by_country_repo(country: str, session: Optional[AsyncSession] = None) -> list[EventOut]:
+    """Get events by country."""
+    async with use_async_session(session) as session:
+        events = await session.scalars(select(Event).where(Event.country.ilike(f"%{country}%")))
+        return [EventOut.model_validate(event) for event in events]
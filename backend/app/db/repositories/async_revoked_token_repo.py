@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Async repository for RevokedToken model operations."""
+
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.revoked_token import RevokedToken
+from app.db.async_session import use_async_session
+from typing import Optional
+from datetime import datetime, timezone
+
+async def revoke_token_repo(jti: str, expires_at: datetime, session: Optional[AsyncSession] = None) -> None:
+    """Record a revoked token ID until the token expires. Revoking it again is a no-op."""
+    async with use_async_session(session) as session:
+        await session.merge(RevokedToken(jti=jti, expires_at=expires_at, revoked_at=datetime.now(timezone.utc)))
+        await session.flush()
+
+async def is_token_revoked_repo(jti: str, session: Optional[AsyncSession] = None) -> bool:
+    """Whether the token ID has been revoked and the token has not expired yet."""
+    async with use_async_session(session) as session:
+        stmt = select(RevokedToken.jti).where(
+            RevokedToken.jti == jti,
+            RevokedToken.expires_at > datetime.now(timezone.utc),
+        )
+        return await session.scalar(stmt) is not None
+
+async def get_revoked_jtis_repo(revoked_since: Optional[datetime] = None, session: Optional[AsyncSession] = None) -> list[str]:
+    """IDs of unexpired revoked tokens, optionally only those revoked at or after `revoked_since`."""
+    async with use_async_session(session) as session:
+        stmt = select(RevokedToken.jti).where(RevokedToken.expires_at > datetime.now(timezone.utc))
+        if revoked_since is not None:
+            stmt = stmt.where(RevokedToken.revoked_at >= revoked_since)
+        return list(await session.scalars(stmt))
+
+async def delete_expired_revocations_repo(session: Optional[AsyncSession] = None) -> int:
+    """Delete revocations of tokens that have expired, returning how many were removed."""
+    async with use_async_session(session) as session:
+        result = await session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+        )
+        return result.rowcount
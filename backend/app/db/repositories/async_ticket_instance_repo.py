@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Async repository for TicketInstance operations on the gate check-in path."""
+
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from sqlalchemy import select, update, values, column, String, DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.ticket_instance import TicketInstance
+from app.db.models.ticket_type import TicketType
+from app.db.async_session import use_async_session
+from typing import Optional
+from app.schemas.ticket_instance import TicketInstanceOut
+
+async def check_in_ticket_repo(event_id: int, code: str, session: Optional[AsyncSession] = None) -> Optional[TicketInstanceOut]:
+    """
+    Mark an active ticket of `event_id` as used in one conditional UPDATE ... RETURNING.
+    Returns None if the code is unknown, for another event, or not active,
+    so two gates scanning the same ticket can never both admit it.
+    """
+    async with use_async_session(session) as session:
+        event_ticket_types = select(TicketType.id).where(TicketType.event_id == event_id)
+        now = datetime.now(timezone.utc)
+        stmt = (
+            update(TicketInstance)
+            .where(
+                TicketInstance.code == code,
+                TicketInstance.status == "active",
+                TicketInstance.ticket_type_id.in_(event_ticket_types),
+            )
+            .values(status="used", used_at=now)
+            .returning(*TicketInstance.__table__.c)
+            .execution_options(synchronize_session=False)
+        )
+        row = (await session.execute(stmt)).mappings().one_or_none()
+        return TicketInstanceOut.model_validate(row) if row else None
+
+async def sync_check_ins_repo(
+    event_id: int,
+    scans: list[tuple[str, datetime]],
+    session: Optional[AsyncSession] = None,
+) -> list[TicketInstanceOut]:
+    """
+    Apply a batch of offline scans as (code, scanned_at) pairs in a single
+    UPDATE ... FROM (VALUES ...) RETURNING statement.
+    Only active tickets of `event_id` are marked used, each with the time it was
+    scanned at the gate. Returns the tickets that were updated.
+    """
+    if not scans:
+        return []
+    async with use_async_session(session) as session:
+        event_ticket_types = select(TicketType.id).where(TicketType.event_id == event_id)
+        scanned = values(
+            column("code", String),
+            column("scanned_at", DateTime(timezone=True)),
+            name="scanned",
+        ).data(scans)
+        stmt = (
+            update(TicketInstance)
+            .where(
+                TicketInstance.code == scanned.c.code,
+                TicketInstance.status == "active",
+                TicketInstance.ticket_type_id.in_(event_ticket_types),
+            )
+            .values(status="used", used_at=scanned.c.scanned_at)
+            .returning(*TicketInstance.__table__.c)
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await session.execute(stmt)).mappings().all()
+        return [TicketInstanceOut.model_validate(row) for row in rows]
+
+async def get_ticket_instances_by_codes_repo(
+    codes: list[str],
+    session: Optional[AsyncSession] = None,
+) -> dict[str, tuple[TicketInstanceOut, int]]:
+    """Retrieve TicketInstances by code in one query, keyed by code, with the ID of their event."""
+    if not codes:
+        return {}
+    async with use_async_session(session) as session:
+        stmt = (
+            select(TicketInstance, TicketType.event_id)
+            .join(TicketType, TicketType.id == TicketInstance.ticket_type_id)
+            .where(TicketInstance.code.in_(codes))
+        )
+        rows = (await session.execute(stmt)).all()
+        return {
+            ticket_instance.code: (TicketInstanceOut.model_validate(ticket_instance), ticket_event_id)
+            for ticket_instance, ticket_event_id in rows
+        }
+
+async def get_ticket_instance_by_code_repo(code: str, session: Optional[AsyncSession] = None) -> Optional[tuple[TicketInstanceOut, int]]:
+    """Retrieve a TicketInstance by its code, with the ID of the event it belongs to."""
+    async with use_async_session(session) as session:
+        stmt = (
+            select(TicketInstance, TicketType.event_id)
+            .join(TicketType, TicketType.id == TicketInstance.ticket_type_id)
+            .where(TicketInstance.code == code)
+        )
+        row = (await session.execute(stmt)).one_or_none()
+        if not row:
+            return None
+        ticket_instance, ticket_event_id = row
+        return TicketInstanceOut.model_validate(ticket_instance), ticket_event_id
+
+async def stream_active_codes_for_event_repo(
+    event_id: int,
+    issued_since: Optional[datetime] = None,
+    session: Optional[AsyncSession] = None,
+) -> AsyncIterator[str]:
+    """
+    Yield the codes of every active ticket for an event, or only of those issued
+    since `issued_since`, without loading ORM objects.
+    """
+    async with use_async_session(session) as session:
+        stmt = (
+            select(TicketInstance.code)
+            .join(TicketType, TicketType.id == TicketInstance.ticket_type_id)
+            .where(TicketType.event_id == event_id, TicketInstance.status == "active")
+            .execution_options(yield_per=5000)
+        )
+        if issued_since is not None:
+            stmt = stmt.where(TicketInstance.created_at >= issued_since)
+        async for code in await session.stream_scalars(stmt):
+            yield code
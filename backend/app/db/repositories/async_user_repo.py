@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Async repository for User model operations used on the request path."""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models.user import User
+from app.db.async_session import use_async_session
+from typing import Optional
+from app.schemas.user import UserOut, UserOutWithPWD, UserAuth
+
+async def get_user_by_email_repo(email: str, session: Optional[AsyncSession] = None) -> Optional[UserOut]:
+    """Retrieve a user by their email address."""
+    async with use_async_session(session) as session:
+        user = await session.scalar(select(User).where(User.email == email))
+        return UserOut.model_validate(user) if user else None
+
+async def get_user_by_id_repo(user_id: int, session: Optional[AsyncSession] = None) -> Optional[UserOut]:
+    """Retrieve a user by their ID."""
+    async with use_async_session(session) as session:
+        user = await session.get(User, user_id)
+        return UserOut.model_validate(user) if user else None
+
+async def get_user_with_password_by_id_repo(user_id: int, session: Optional[AsyncSession] = None) -> Optional[UserOutWithPWD]:
+    """Retrieve a user by their ID including password hash."""
+    async with use_async_session(session) as session:
+        user = await session.get(User, user_id)
+        return UserOutWithPWD.model_validate(user) if user else None
+
+async def get_user_auth_by_email_repo(email: str, session: Optional[AsyncSession] = None) -> Optional[UserAuth]:
+    """Retrieve only the fields needed for login by the indexed email column."""
+    async with use_async_session(session) as session:
+        stmt = select(User.id, User.password_hash, User.is_active, User.role).where(User.email == email)
+        row = (await session.execute(stmt)).mappings().one_or_none()
+        return UserAuth.model_validate(row) if row else None
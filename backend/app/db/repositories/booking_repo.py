@@ -1,19 +1,39 @@
 #!/usr/bin/env python3
 """Repository for Booking model operations."""
 
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
 from app.db.session import get_session
 from typing import Optional
 from app.db.models.booking import Booking
+from app.db.repositories.ticket_type_repo import reserve_tickets_repo, release_tickets_repo
+from app.db.repositories.ticket_instance_repo import issue_ticket_instances_repo
+from app.schemas.ticket_instance import TicketInstanceOut
+from app.utils.ticket_codes import generate_ticket_codes
 from app.schemas.booking import BookingOut, BookingCreate, BookingUpdate
+from app.schemas.pagination import Page
+from app.db.pagination import keyset_select, build_page
+from app.core.config import PAGE_SIZE_DEFAULT
 
 def create_booking_repo(booking_data: BookingCreate) -> BookingOut:
-    """Create a new booking in the database."""
+    """
+    Create a new booking in the database.
+    Stock is reserved in the same transaction, so the booking and the
+    decrement are committed or rolled back together. The total price is
+    computed from the unit price read by the reservation itself.
+    """
     with get_session() as session:
+        reserved = reserve_tickets_repo(booking_data.ticket_type_id, booking_data.quantity, session=session)
+        if reserved is None:
+            raise ValueError("Not enough tickets available.")
+        _, unit_price = reserved
         new_booking = Booking(
             user_id=booking_data.user_id,
             ticket_type_id=booking_data.ticket_type_id,
             quantity=booking_data.quantity,
-            total_price=booking_data.total_price,
+            total_price=unit_price * booking_data.quantity,
             status="pending"
         )
         session.add(new_booking)
@@ -40,6 +60,77 @@ def update_booking_repo(booking_id: int, booking_data: BookingUpdate) -> Optiona
         session.refresh(booking)
         return BookingOut.model_validate(booking)
     
+def confirm_booking_repo(booking_id: int, issued_to: Optional[str] = None) -> Optional[tuple[BookingOut, list[TicketInstanceOut]]]:
+    """
+    Confirm a pending booking and issue all of its tickets in the same transaction.
+    The status change is conditional, so tickets are only ever issued once.
+    Returns None if the booking is missing or no longer pending.
+    """
+    with get_session() as session:
+        stmt = (
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status == "pending")
+            .values(status="confirmed")
+            .returning(Booking)
+            .execution_options(synchronize_session=False)
+        )
+        booking = session.scalars(stmt).one_or_none()
+        if not booking:
+            return None
+        return BookingOut.model_validate(booking), _issue_tickets(booking, issued_to, session)
+
+def reinstate_expired_booking_repo(booking_id: int, issued_to: Optional[str] = None) -> Optional[tuple[BookingOut, list[TicketInstanceOut]]]:
+    """
+    Confirm a booking whose hold the sweeper expired before its payment came in:
+    take its tickets from stock again and issue them, all in one transaction.
+    The booking goes straight from expired to confirmed, so the sweeper cannot expire it again.
+    Returns None if the booking is not expired or its tickets are no longer in stock.
+    """
+    with get_session() as session:
+        stmt = (
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status == "expired")
+            .values(status="confirmed")
+            .returning(Booking)
+            .execution_options(synchronize_session=False)
+        )
+        booking = session.scalars(stmt).one_or_none()
+        if not booking:
+            return None
+        if reserve_tickets_repo(booking.ticket_type_id, booking.quantity, session=session) is None:
+            session.rollback()
+            return None
+        return BookingOut.model_validate(booking), _issue_tickets(booking, issued_to, session)
+
+def _issue_tickets(booking: Booking, issued_to: Optional[str], session: Session) -> list[TicketInstanceOut]:
+    return issue_ticket_instances_repo(
+        booking.id,
+        booking.ticket_type_id,
+        booking.user_id,
+        generate_ticket_codes(booking.quantity),
+        issued_to=issued_to,
+        session=session,
+    )
+
+def cancel_booking_repo(booking_id: int) -> Optional[BookingOut]:
+    """
+    Cancel a pending or confirmed booking and return its tickets to stock.
+    The status change is conditional, so a booking is only released once.
+    """
+    with get_session() as session:
+        stmt = (
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status.in_(("pending", "confirmed")))
+            .values(status="cancelled")
+            .returning(Booking)
+            .execution_options(synchronize_session=False)
+        )
+        booking = session.scalars(stmt).one_or_none()
+        if not booking:
+            return None
+        release_tickets_repo(booking.ticket_type_id, booking.quantity, session=session)
+        return BookingOut.model_validate(booking)
+
 def delete_booking_repo(booking_id: int) -> bool:
     """Delete a booking from the database."""
     with get_session() as session:
@@ -50,11 +141,12 @@ def delete_booking_repo(booking_id: int) -> bool:
         session.commit()
         return True
     
-def list_bookings_repo() -> list[BookingOut]:
-    """List all bookings in the database."""
+def list_bookings_repo(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[BookingOut]:
+    """List one page of bookings ordered by creation time."""
     with get_session() as session:
-        bookings = session.query(Booking).all()
-        return [BookingOut.model_validate(booking) for booking in bookings]
+        stmt = keyset_select(Booking, Booking.created_at, cursor, limit)
+        bookings = session.scalars(stmt).all()
+        return build_page(bookings, BookingOut, "created_at", limit)
     
 def list_bookings_by_user_repo(user_id: int) -> list[BookingOut]:
     """List all bookings for a specific user."""
@@ -90,4 +182,36 @@ def list_bookings_in_date_range_repo(start_date: str, end_date: str) -> list[Boo
     """List all bookings within a specific date range."""
     with get_session() as session:
         bookings = session.query(Booking).filter(Booking.created_at >= start_date, Booking.created_at <= end_date).all()
-        return [BookingOut.model_validate(booking) for booking in bookings]
\ No newline at end of file
+        return [BookingOut.model_validate(booking) for booking in bookings]
+
+def expire_stale_holds_repo(cutoff: datetime, batch_size: int) -> int:
+    """
+    Expire up to `batch_size` pending bookings created before `cutoff` and
+    return their tickets to stock, all in one short transaction.
+    Rows locked by checkout or another sweeper are skipped (SKIP LOCKED),
+    so concurrent sweepers never block each other or buyers.
+    Returns the number of bookings expired.
+    """
+    with get_session() as session:
+        stale_ids = (
+            select(Booking.id)
+            .where(Booking.status == "pending", Booking.created_at < cutoff)
+            .order_by(Booking.created_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        expired = session.execute(
+            update(Booking)
+            .where(Booking.id.in_(stale_ids), Booking.status == "pending")
+            .values(status="expired")
+            .returning(Booking.ticket_type_id, Booking.quantity)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+        # One stock update per ticket type rather than per booking
+        released = Counter()
+        for ticket_type_id, quantity in expired:
+            released[ticket_type_id] += quantity
+        for ticket_type_id, quantity in released.items():
+            release_tickets_repo(ticket_type_id, quantity, session=session)
+        return len(expired)
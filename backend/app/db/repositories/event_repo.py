@@ -5,6 +5,9 @@ from app.db.models.event import Event
 from app.db.session import get_session
 from typing import Optional
 from app.schemas.event import EventOut, EventCreatWithFlyer, EventCreate, EventUpdate
+from app.schemas.pagination import Page
+from app.db.pagination import keyset_select, build_page
+from app.core.config import PAGE_SIZE_DEFAULT
 from datetime import datetime
 
 def create_event_repo(event_data: EventCreatWithFlyer) -> EventOut:
@@ -50,11 +53,12 @@ def get_unapproved_events_repo() -> list[EventOut]:
         events = session.query(Event).filter(Event.approved == False).all()
         return [EventOut.model_validate(event) for event in events]
 
-def get_all_events_repo() -> list[EventOut]:
-    """Get all events from the database."""
+def get_all_events_repo(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[EventOut]:
+    """Get one page of events ordered by start time."""
     with get_session() as session:
-        events = session.query(Event).all()
-        return [EventOut.model_validate(event) for event in events]
+        stmt = keyset_select(Event, Event.start_time, cursor, limit)
+        events = session.scalars(stmt).all()
+        return build_page(events, EventOut, "start_time", limit)
     
 def get_event_by_id_repo(event_id: int) -> Optional[EventOut]:
     """Retrieve an event by its ID."""
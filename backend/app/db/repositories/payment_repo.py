@@ -6,6 +6,9 @@ from app.db.models.payment import Payment
 from app.db.session import get_session
 from typing import Optional
 from app.schemas.payment import PaymentOut, PaymentCreate, PaymentUpdate
+from app.schemas.pagination import Page
+from app.db.pagination import keyset_select, build_page
+from app.core.config import PAGE_SIZE_DEFAULT
 
 def create_payment_repo(payment: PaymentCreate) -> PaymentOut:
     """Create a new payment record in the database."""
@@ -67,11 +70,12 @@ def delete_payment_repo(payment_id: int) -> bool:
             return True
         return False
     
-def list_payments_repo() -> list[PaymentOut]:
-    """List all payment records."""
+def list_payments_repo(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[PaymentOut]:
+    """List one page of payment records ordered by creation time."""
     with get_session() as session:
-        db_payments = session.query(Payment).all()
-        return [PaymentOut.model_validate(payment) for payment in db_payments]
+        stmt = keyset_select(Payment, Payment.created_at, cursor, limit)
+        db_payments = session.scalars(stmt).all()
+        return build_page(db_payments, PaymentOut, "created_at", limit)
     
 def get_payments_by_booking_id_repo(booking_id: int) -> list[PaymentOut]:
     """Retrieve all payment records for a specific booking ID."""
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Repository for TicketInstance model operations."""
 
-from app.db.session import get_session
+from datetime import datetime, timezone
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.db.session import get_session, use_session
 from typing import Optional
 from app.db.models.ticket_instance import TicketInstance
 from app.schemas.ticket_instance import TicketInstanceOut, TicketInstanceCreate, TicketInstanceUpdate
+from app.schemas.pagination import Page
+from app.db.pagination import keyset_select, build_page
+from app.core.config import PAGE_SIZE_DEFAULT
 
 def create_ticket_instance_repo(ticket_instance_create: TicketInstanceCreate) -> TicketInstanceOut:
     """Create a new TicketInstance in the database."""
@@ -55,11 +61,12 @@ def delete_ticket_instance_repo(ticket_instance_id: int) -> bool:
         session.commit()
         return True
     
-def list_ticket_instances_repo() -> list[TicketInstanceOut]:
-    """List all TicketInstances in the database."""
+def list_ticket_instances_repo(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[TicketInstanceOut]:
+    """List one page of TicketInstances ordered by creation time."""
     with get_session() as session:
-        ticket_instances = session.query(TicketInstance).all()
-        return [TicketInstanceOut.model_validate(ti) for ti in ticket_instances]
+        stmt = keyset_select(TicketInstance, TicketInstance.created_at, cursor, limit)
+        ticket_instances = session.scalars(stmt).all()
+        return build_page(ticket_instances, TicketInstanceOut, "created_at", limit)
     
 def list_ticket_instances_in_date_range_repo(start_date: str, end_date: str) -> list[TicketInstanceOut]:
     """List TicketInstances created within a specific date range."""
@@ -84,4 +91,39 @@ def get_ticket_instances_by_status_repo(status: str) -> list[TicketInstanceOut]:
         ticket_instances = session.query(TicketInstance).filter(
             TicketInstance.status == status
         ).all()
-        return [TicketInstanceOut.model_validate(ti) for ti in ticket_instances]
\ No newline at end of file
+        return [TicketInstanceOut.model_validate(ti) for ti in ticket_instances]
+
+def issue_ticket_instances_repo(
+    booking_id: int,
+    ticket_type_id: int,
+    user_id: int,
+    codes: list[str],
+    issued_to: Optional[str] = None,
+    session: Optional[Session] = None,
+) -> list[TicketInstanceOut]:
+    """
+    Insert one active TicketInstance per code in a single bulk INSERT ... RETURNING
+    (sent as multi-row VALUES batches), instead of one round trip per ticket.
+    """
+    if not codes:
+        return []
+    # One timestamp for the whole batch, instead of calling the column defaults per row
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "booking_id": booking_id,
+            "ticket_type_id": ticket_type_id,
+            "user_id": user_id,
+            "code": code,
+            "status": "active",
+            "issued_to": issued_to,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for code in codes
+    ]
+    with use_session(session) as session:
+        # Return plain rows, not ORM objects, to keep large batches out of the identity map
+        stmt = insert(TicketInstance).returning(*TicketInstance.__table__.c)
+        result = session.execute(stmt, rows)
+        return [TicketInstanceOut.model_validate(row) for row in result.mappings()]
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Repository for TicketType model operations."""
 
-from app.db.session import get_session
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from app.db.session import get_session, use_session
 from typing import Optional
 from app.db.models.ticket_type import TicketType
 from app.schemas.ticket_type import TicketTypeOut, TicketTypeCreate, TicketTypeUpdate
@@ -49,4 +51,48 @@ def list_ticket_types_event_id_repo(event_id: int) -> list[TicketTypeOut]:
     """List all TicketTypes for a given Event ID."""
     with get_session() as session:
         ticket_types = session.query(TicketType).filter(TicketType.event_id == event_id).all()
-        return [TicketTypeOut.model_validate(tt) for tt in ticket_types]
\ No newline at end of file
+        return [TicketTypeOut.model_validate(tt) for tt in ticket_types]
+
+def reserve_tickets_repo(ticket_type_id: int, quantity: int, session: Optional[Session] = None) -> Optional[tuple[int, int]]:
+    """
+    Atomically take `quantity` tickets from a TicketType's stock.
+    A single conditional UPDATE ... RETURNING, so concurrent buyers never oversell
+    and no row lock is held beyond the statement's own transaction.
+    Returns the new quantity_sold and the unit price, or None if there is not enough stock left.
+    """
+    if quantity < 1:
+        raise ValueError("Quantity must be at least 1.")
+    with use_session(session) as session:
+        stmt = (
+            update(TicketType)
+            .where(
+                TicketType.id == ticket_type_id,
+                TicketType.quantity_sold + quantity <= TicketType.quantity_available,
+            )
+            .values(quantity_sold=TicketType.quantity_sold + quantity)
+            .returning(TicketType.quantity_sold, TicketType.price)
+            .execution_options(synchronize_session=False)
+        )
+        reserved = session.execute(stmt).one_or_none()
+        return tuple(reserved) if reserved else None
+
+def release_tickets_repo(ticket_type_id: int, quantity: int, session: Optional[Session] = None) -> Optional[int]:
+    """
+    Atomically return `quantity` tickets to a TicketType's stock.
+    Returns the new quantity_sold, or None if the TicketType does not exist
+    or fewer than `quantity` tickets are sold.
+    """
+    if quantity < 1:
+        raise ValueError("Quantity must be at least 1.")
+    with use_session(session) as session:
+        stmt = (
+            update(TicketType)
+            .where(
+                TicketType.id == ticket_type_id,
+                TicketType.quantity_sold >= quantity,
+            )
+            .values(quantity_sold=TicketType.quantity_sold - quantity)
+            .returning(TicketType.quantity_sold)
+            .execution_options(synchronize_session=False)
+        )
+        return session.execute(stmt).scalar_one_or_none()
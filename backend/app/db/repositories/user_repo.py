@@ -6,6 +6,10 @@ from app.db.models.user import User
 from app.db.session import get_session
 from typing import Optional
 from app.schemas.user import UserOut, UserOutWithPWD
+from app.schemas.pagination import Page
+from app.db.pagination import keyset_select, build_page
+from app.core.config import PAGE_SIZE_DEFAULT
+from app.core.cache import user_cache
 
 def create_user_repo(name: str, email: str, password_hash: str, phone_number: str, role: str = "attendee") -> UserOut:
     """Create a new user in the database."""
@@ -53,6 +57,7 @@ def update_user_role_repo(user_id: int, new_role: str) -> Optional[UserOut]:
         if user:
             user.role = new_role
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -64,6 +69,7 @@ def deactivate_user_repo(user_id: int) -> Optional[UserOut]:
         if user:
             user.is_active = False
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -75,14 +81,16 @@ def delete_user_repo(user_id: int) -> bool:
         if user:
             session.delete(user)
             session.commit()
+            user_cache.invalidate(user_id)
             return True
         return False
     
-def list_all_users_repo() -> list[UserOut]:
-    """List all users in the database."""
+def list_all_users_repo(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[UserOut]:
+    """List one page of users ordered by creation time."""
     with get_session() as session:
-        users = session.query(User).all()
-        return [UserOut.model_validate(user) for user in users]
+        stmt = keyset_select(User, User.created_at, cursor, limit)
+        users = session.scalars(stmt).all()
+        return build_page(users, UserOut, "created_at", limit)
     
 def count_users_by_role_repo(role: str) -> int:
     """Count the number of users with a specific role."""
@@ -100,6 +108,7 @@ def update_user_contact_repo(user_id: int, new_email: Optional[str] = None, new_
             if new_phone_number:
                 user.phone_number = new_phone_number
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -111,6 +120,7 @@ def update_user_password_repo(user_id: int, new_password_hash: str) -> Optional[
         if user:
             user.password_hash = new_password_hash
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -128,6 +138,7 @@ def activate_user_repo(user_id: int) -> Optional[UserOut]:
         if user:
             user.is_active = True
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -139,6 +150,7 @@ def verify_user_email_repo(user_id: int) -> Optional[UserOut]:
         if user:
             user.is_verified = True
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -150,6 +162,7 @@ def unverify_user_email_repo(user_id: int) -> Optional[UserOut]:
         if user:
             user.is_verified = False
             session.commit()
+            user_cache.invalidate(user_id)
             session.refresh(user)
             return UserOut.model_validate(user)
         return None
@@ -4,11 +4,32 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from collections.abc import Generator
+from typing import Optional
 from contextlib import contextmanager
 
-from app.core.config import DATABASE_URL, SQLALCHEMY_ECHO
+from app.core.config import (
+    DATABASE_URL,
+    SQLALCHEMY_ECHO,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
+from app.db.instrumentation import InstrumentedQueuePool, register_pool_gauges, register_query_metrics
 
-engine = create_engine(DATABASE_URL, echo=SQLALCHEMY_ECHO)
+engine = create_engine(
+    DATABASE_URL,
+    echo=SQLALCHEMY_ECHO,
+    poolclass=InstrumentedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+)
+register_pool_gauges(engine, "sync")
+register_query_metrics(engine, "sync")
 
 SessionLocal = sessionmaker(
     bind=engine,
@@ -32,4 +53,16 @@ def get_session() -> Generator[Session, None, None]:
         session.rollback()
         raise
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+@contextmanager
+def use_session(session: Optional[Session] = None) -> Generator[Session, None, None]:
+    """
+    Reuse the caller's session so several repository calls share one transaction,
+    otherwise open a new transactional scope for this call only.
+    """
+    if session is not None:
+        yield session
+        return
+    with get_session() as new_session:
+        yield new_session
@@ -1,17 +1,43 @@
 #!/usr/bin/env python3
 """FastAPI entrypoint for MGLTickets."""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from app.core.logging_config import configure_logging, logger
 from app.core.logging_middleware import LoggingMiddleware
-from app.api.routes import auth, events
+from app.core.profiler_middleware import QueryProfilerMiddleware
+from app.api.routes import auth, events, bookings, checkin, metrics
+from app.db.async_session import async_engine
+from app.services.hold_sweeper import HoldSweeper
+from app.core.hashing import shutdown_hashing_pool
+from app.core.revocation import revocation_list
+from app.core.config import HOLD_SWEEPER_ENABLED, HOLD_SWEEP_INTERVAL_SECONDS
 
 configure_logging() # Initialize logging configuration
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown hooks for the application."""
+    # Release stock held by bookings whose payment never completed
+    hold_sweeper = HoldSweeper(HOLD_SWEEP_INTERVAL_SECONDS)
+    if HOLD_SWEEPER_ENABLED:
+        hold_sweeper.start()
+    # Load revoked tokens before serving, then keep the filter in step with the other workers
+    await revocation_list.sync()
+    revocation_list.start()
+    yield
+    await revocation_list.stop()
+    await hold_sweeper.stop()
+    # Close pooled asyncpg connections on shutdown
+    await async_engine.dispose()
+    shutdown_hashing_pool()
+
+app = FastAPI(lifespan=lifespan)
 
 # Middlewares
+# Add query profiling middleware (opt-in, see QUERY_PROFILER)
+app.add_middleware(QueryProfilerMiddleware)
 # Add logging middleware
 app.add_middleware(LoggingMiddleware)
 
@@ -22,5 +48,8 @@ app.mount("/uploads", StaticFiles(directory="app/uploads"), name="uploads")
 # Routes
 app.include_router(auth.router, prefix="/api/v1", tags=["Authentication"])
 app.include_router(events.router, prefix="/api/v1", tags=["Events"])
+app.include_router(bookings.router, prefix="/api/v1", tags=["Bookings"])
+app.include_router(checkin.router, prefix="/api/v1", tags=["Check-in"])
+app.include_router(metrics.router, tags=["Metrics"])
 
 # Register handlers globally
\ No newline at end of file
@@ -23,12 +23,17 @@ class BookingOut(BaseModelEAT):
     class Config:
         from_attributes = True
 
-class BookingCreate(BaseModelEAT):
-    """Schema for creating a new Booking."""
-    user_id: int
+class BookingRequest(BaseModelEAT):
+    """Schema for a buyer's booking request. The price is never taken from the client."""
     ticket_type_id: int
     quantity: int
-    total_price: int
+
+    class Config:
+        from_attributes = True
+
+class BookingCreate(BookingRequest):
+    """Schema for creating a new Booking, total_price is computed from the TicketType."""
+    user_id: int
 
     class Config:
         from_attributes = True
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Gate check-in schemas for MGLTickets."""
+
+from datetime import datetime
+from typing import Optional
+from app.schemas.base import BaseModelEAT
+
+class CheckInRequest(BaseModelEAT):
+    """Schema for a single ticket scan at the gate."""
+    code: str
+
+class CheckInResult(BaseModelEAT):
+    """Schema for the outcome of a ticket scan."""
+    code: str
+    result: str  # admitted, already_used, invalid, wrong_event, not_active
+    ticket_instance_id: Optional[int] = None
+    ticket_type_id: Optional[int] = None
+    used_at: Optional[datetime] = None  # When the ticket was first scanned
+
+class CheckInPreloadOut(BaseModelEAT):
+    """Schema for the result of preloading an event's ticket codes."""
+    event_id: int
+    codes: int
+
+class OfflineScan(BaseModelEAT):
+    """Schema for a scan recorded by a gate device while offline."""
+    code: str
+    scanned_at: datetime
+
+class CheckInSyncRequest(BaseModelEAT):
+    """Schema for a batch of offline scans uploaded by a gate device."""
+    device_id: Optional[str] = None
+    scans: list[OfflineScan]
+
+class CheckInSyncResult(BaseModelEAT):
+    """Schema for the outcome of an offline scan upload."""
+    event_id: int
+    applied: int  # Scans that admitted a ticket
+    conflicts: list[CheckInResult]  # Scans that did not, with the reason
@@ -4,6 +4,7 @@
 from datetime import datetime
 from app.schemas.base import BaseModelEAT
 from typing import Optional
+from app.schemas.ticket_type import TicketTypeAvailabilityOut
 
 # from app.schemas.user import UserOut
 # from app.schemas.booking import BookingOut
@@ -29,6 +30,10 @@ class EventOut(BaseModelEAT):
     class Config:
         from_attributes = True
 
+class EventDetailsOut(EventOut):
+    """Schema for an event page: the event with its ticket types and remaining stock."""
+    ticket_types: list[TicketTypeAvailabilityOut] = []
+
 class EventCreate(BaseModelEAT):
     """Schema for creating a new Event."""
     title: str
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Pagination schemas for MGLTickets."""
+
+from typing import Generic, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing."""
+    items: list[T]
+    next_cursor: Optional[str] = None  # Opaque token for the next page, None on the last page
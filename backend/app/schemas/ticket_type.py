@@ -3,6 +3,7 @@
 
 from datetime import datetime
 from typing import Optional
+from pydantic import computed_field
 
 from app.schemas.base import BaseModelEAT
 # from app.schemas.event import EventOut
@@ -27,6 +28,15 @@ class TicketTypeOut(BaseModelEAT):
     class Config:
         from_attributes = True
 
+class TicketTypeAvailabilityOut(TicketTypeOut):
+    """Schema for a TicketType with the stock still on sale."""
+
+    @computed_field
+    @property
+    def quantity_remaining(self) -> int:
+        """Tickets left to book; sold includes tickets held by pending bookings."""
+        return max(self.quantity_available - self.quantity_sold, 0)
+
 class TicketTypeCreate(BaseModelEAT):
     """Schema for creating a new TicketType."""
     event_id: int
@@ -27,6 +27,16 @@ class UserOutWithPWD(UserOut):
     """Schema for outputting User data with password."""
     password_hash: str
 
+class UserAuth(BaseModelEAT):
+    """Schema for the fields needed to authenticate a User."""
+    id: int
+    password_hash: str
+    is_active: bool
+    role: str
+
+    class Config:
+        from_attributes = True
+
 class UserCreate(BaseModelEAT):
     """Schema for creating a new User."""
     name: str
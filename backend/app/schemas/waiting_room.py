@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Waiting room schemas for MGLTickets."""
+
+from typing import Optional
+from pydantic import BaseModel
+
+class QueueTicketOut(BaseModel):
+    """Schema for a buyer's place in an event's waiting room."""
+    event_id: int
+    waiting_room: bool  # False when the event has no waiting room and booking is open
+    token: Optional[str] = None  # Send as X-Queue-Token when creating the booking
+    position: Optional[int] = None
+    admitted: bool
+    ahead: int = 0
+    retry_after: float = 0.0  # Seconds until the position is expected to be admitted
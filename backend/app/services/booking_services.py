@@ -1,16 +1,49 @@
 #!/usr/bin/env python3
 """Booking services for MGLTickets."""
 
-from core.logging_config import logger
+from app.core.logging_config import logger
+from app.core.metrics import registry
 import app.db.repositories.booking_repo as booking_repo
-from app.schemas.booking import BookingCreate, BookingUpdate
+import app.db.repositories.ticket_type_repo as tt_repo
+import app.services.waiting_room as waiting_room
+from app.schemas.booking import BookingCreate, BookingUpdate, BookingOut
+from app.schemas.pagination import Page
+from app.core.config import PAGE_SIZE_DEFAULT, BOOKING_HOLD_TTL_SECONDS, HOLD_SWEEP_BATCH_SIZE
 from typing import Optional
+from datetime import datetime, timedelta, timezone
 
-def create_booking_service(booking_data: BookingCreate) -> dict:
-    """Service to create a new booking."""
+BOOKINGS = registry.counter(
+    "bookings_total",
+    "Booking outcomes: created, failed, confirmed, reinstated, cancelled or expired.",
+    ("outcome",),
+)
+
+def create_booking_service(booking_data: BookingCreate, queue_token: Optional[str] = None) -> dict:
+    """
+    Service to create a new booking.
+    Events with a waiting room only accept buyers holding an admitted queue token.
+    """
     logger.info("Creating a new booking")
-    booking = booking_repo.create_booking_repo(booking_data)
-    logger.info(f"Created booking with ID: {booking.id}")
+    if booking_data.quantity < 1:
+        raise ValueError("Quantity must be at least 1.")
+
+    event_id, position = None, None
+    if waiting_room.has_waiting_rooms():
+        ticket_type = tt_repo.get_ticket_type_by_id_repo(booking_data.ticket_type_id)
+        if not ticket_type:
+            raise ValueError("Ticket type not found.")
+        event_id = ticket_type.event_id
+        position = waiting_room.admit(event_id, booking_data.user_id, queue_token)
+
+    try:
+        booking = booking_repo.create_booking_repo(booking_data)
+    except Exception:
+        # Let the buyer retry with the same token
+        waiting_room.readmit(event_id, position)
+        BOOKINGS.inc(outcome="failed")
+        raise
+    BOOKINGS.inc(outcome="created")
+    logger.info("Created booking with ID: %s", booking.id)
     return booking
 
 def get_booking_by_id_service(booking_id: int) -> Optional[dict]:
@@ -18,9 +51,9 @@ def get_booking_by_id_service(booking_id: int) -> Optional[dict]:
     logger.info("Retrieving booking by ID", extra={"extra": {"booking_id": booking_id}})
     booking = booking_repo.get_booking_by_id_repo(booking_id)
     if booking:
-        logger.info(f"Retrieved booking: {booking}")
+        logger.info("Retrieved booking: %s", booking)
     else:
-        logger.warning(f"Booking with ID {booking_id} not found")
+        logger.warning("Booking with ID %s not found", booking_id)
     return booking
 
 def update_booking_service(booking_id: int, booking_data: BookingUpdate) -> Optional[dict]:
@@ -28,9 +61,40 @@ def update_booking_service(booking_id: int, booking_data: BookingUpdate) -> Opti
     logger.info("Updating booking", extra={"extra": {"booking_id": booking_id}})
     booking = booking_repo.update_booking_repo(booking_id, booking_data)
     if booking:
-        logger.info(f"Updated booking: {booking}")
+        logger.info("Updated booking: %s", booking)
     else:
-        logger.warning(f"Booking with ID {booking_id} not found for update")
+        logger.warning("Booking with ID %s not found for update", booking_id)
+    return booking
+
+def confirm_booking_service(booking_id: int, issued_to: Optional[str] = None) -> Optional[dict]:
+    """
+    Service to confirm a paid booking and issue its tickets.
+    A booking whose hold expired before the payment came in is reinstated if its tickets are still in stock.
+    """
+    logger.info("Confirming booking", extra={"extra": {"booking_id": booking_id}})
+    confirmed = booking_repo.confirm_booking_repo(booking_id, issued_to)
+    if not confirmed:
+        confirmed = booking_repo.reinstate_expired_booking_repo(booking_id, issued_to)
+        if confirmed:
+            BOOKINGS.inc(outcome="reinstated")
+            logger.info("Reinstated expired booking after payment", extra={"extra": {"booking_id": booking_id}})
+    if not confirmed:
+        logger.warning("Booking with ID %s not found, no longer pending, or expired and sold out", booking_id)
+        return None
+    booking, ticket_instances = confirmed
+    BOOKINGS.inc(outcome="confirmed")
+    logger.info("Issued tickets for booking", extra={"extra": {"booking_id": booking_id, "tickets": len(ticket_instances)}})
+    return booking
+
+def cancel_booking_service(booking_id: int) -> Optional[dict]:
+    """Service to cancel a booking and release its tickets."""
+    logger.info("Cancelling booking", extra={"extra": {"booking_id": booking_id}})
+    booking = booking_repo.cancel_booking_repo(booking_id)
+    if booking:
+        BOOKINGS.inc(outcome="cancelled")
+        logger.info("Cancelled booking with ID: %s", booking_id)
+    else:
+        logger.warning("Booking with ID %s not found or not cancellable", booking_id)
     return booking
 
 def delete_booking_service(booking_id: int) -> bool:
@@ -38,16 +102,15 @@ def delete_booking_service(booking_id: int) -> bool:
     logger.info("Deleting booking", extra={"extra": {"booking_id": booking_id}})
     booking = booking_repo.delete_booking_repo(booking_id)
     if booking:
-        logger.info(f"Deleted booking with ID: {booking_id}")
+        logger.info("Deleted booking with ID: %s", booking_id)
     else:
-        logger.warning(f"Booking with ID {booking_id} not found for deletion")
+        logger.warning("Booking with ID %s not found for deletion", booking_id)
     return booking
 
-def list_bookings_service() -> list[dict]:
-    """Service to list all bookings."""
-    logger.info("Listing all bookings")
-    booking = booking_repo.list_bookings_repo()
-    return booking
+def list_bookings_service(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[BookingOut]:
+    """Service to list one page of bookings."""
+    logger.info("Listing all bookings", extra={"extra": {"cursor": cursor, "limit": limit}})
+    return booking_repo.list_bookings_repo(cursor, limit)
 
 def list_bookings_by_user_service(user_id: int) -> list[dict]:
     """Service to list all bookings for a specific user."""
@@ -77,4 +140,18 @@ def list_recent_bookings_service(limit: int = 10) -> list[dict]:
 def list_bookings_in_date_range_service(start_date: str, end_date: str) -> list[dict]:
     """Service to list bookings within a specific date range."""
     logger.info("Listing bookings in date range", extra={"extra": {"start_date": start_date, "end_date": end_date}})
-    return booking_repo.list_bookings_in_date_range_repo(start_date, end_date)
\ No newline at end of file
+    return booking_repo.list_bookings_in_date_range_repo(start_date, end_date)
+
+def expire_booking_holds_service() -> int:
+    """Service to expire pending bookings whose hold has lapsed, batch by batch."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=BOOKING_HOLD_TTL_SECONDS)
+    total = 0
+    while True:
+        expired = booking_repo.expire_stale_holds_repo(cutoff, HOLD_SWEEP_BATCH_SIZE)
+        total += expired
+        if expired < HOLD_SWEEP_BATCH_SIZE:
+            break
+    if total:
+        BOOKINGS.inc(total, outcome="expired")
+        logger.info("Expired booking holds", extra={"extra": {"expired": total}})
+    return total
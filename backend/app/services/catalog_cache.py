@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Event catalog cache for MGLTickets.
+
+Public event listings are read far more often than events change, so
+event_services keeps them here for CATALOG_CACHE_TTL_SECONDS and drops all of
+them whenever an event is written. Every clear bumps a generation counter,
+and a listing loaded before a clear is not cached afterwards, so a read that
+raced with a write cannot put the old rows back. Two backends are available:
+
+- "memory" (default): per-worker TTLCache holding the validated models, so a
+  hit costs a dict lookup. Writes on another worker show up here after at
+  most the TTL.
+- "redis": shared by all workers, holding listings as JSON. Needs the
+  optional `redis` package and REDIS_URL, and falls back to memory without.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, Protocol
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import CATALOG_CACHE_BACKEND, CATALOG_CACHE_SIZE, CATALOG_CACHE_TTL_SECONDS, REDIS_URL
+from app.core.logging_config import logger
+from app.core.metrics import registry
+from app.db.async_session import after_commit
+
+try:  # Optional shared backend
+    import redis.asyncio as aioredis
+    from redis.exceptions import WatchError
+except ImportError:  # pragma: no cover
+    aioredis = None
+
+CATALOG_REQUESTS = registry.counter(
+    "catalog_cache_requests_total",
+    "Event catalog cache lookups by result: hit, miss, or stale (loaded across an event write, not cached).",
+    ("result",),
+)
+
+
+class CatalogBackend(Protocol):
+    """Storage for cached listings."""
+
+    # True if values are kept as Python objects, False if they must be serialized to JSON
+    stores_objects: bool
+
+    async def get(self, key: str) -> tuple[Optional[Any], int]:
+        """Return the cached value (None on a miss) and the current generation."""
+
+    async def set(self, key: str, value: Any, ttl: float, generation: int) -> bool:
+        """Store a value unless the cache was cleared since `generation`, returning whether it was stored."""
+
+    async def clear(self) -> None:
+        """Drop every value and start a new generation."""
+
+
+class MemoryCatalogBackend:
+    """Per-worker backend over TTLCache."""
+
+    stores_objects = True
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache("catalog", maxsize, ttl)
+        self._generation = 0
+
+    async def get(self, key: str) -> tuple[Optional[Any], int]:
+        return self._cache.get(key), self._generation
+
+    async def set(self, key: str, value: Any, ttl: float, generation: int) -> bool:
+        # No await between the check and the write, so a clear cannot slip in
+        if generation != self._generation:
+            return False
+        self._cache.set(key, value, ttl=ttl)
+        return True
+
+    async def clear(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+
+
+class RedisCatalogBackend:
+    """Backend shared by all workers through Redis."""
+
+    stores_objects = False
+    prefix = "mgl:catalog:"
+    keys_set = "mgl:catalog-keys"  # Every cached key, so clear() needs no SCAN
+    generation_key = "mgl:catalog-generation"
+
+    def __init__(self, url: str):
+        self._redis = aioredis.from_url(url)
+
+    async def get(self, key: str) -> tuple[Optional[bytes], int]:
+        generation, value = await self._redis.mget(self.generation_key, self.prefix + key)
+        return value, int(generation or 0)
+
+    async def set(self, key: str, value: bytes, ttl: float, generation: int) -> bool:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            # WATCH makes the write fail if any worker clears the cache after the check
+            await pipe.watch(self.generation_key)
+            if int(await pipe.get(self.generation_key) or 0) != generation:
+                return False
+            pipe.multi()
+            pipe.set(self.prefix + key, value, px=int(ttl * 1000))
+            pipe.sadd(self.keys_set, self.prefix + key)
+            try:
+                await pipe.execute()
+            except WatchError:
+                return False
+            return True
+
+    async def clear(self) -> None:
+        keys = await self._redis.smembers(self.keys_set)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.incr(self.generation_key)
+            if keys:
+                pipe.delete(*keys)
+            pipe.delete(self.keys_set)
+            await pipe.execute()
+
+
+def _create_backend() -> CatalogBackend:
+    if CATALOG_CACHE_BACKEND == "redis":
+        if aioredis is not None and REDIS_URL:
+            return RedisCatalogBackend(REDIS_URL)
+        logger.warning("Redis catalog cache unavailable (redis package or REDIS_URL missing), using memory")
+    return MemoryCatalogBackend(CATALOG_CACHE_SIZE, CATALOG_CACHE_TTL_SECONDS)
+
+
+class CatalogCache:
+    """Listings cache in front of the event repository, keyed by query."""
+
+    def __init__(self, backend: CatalogBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get_or_load(self, key: str, adapter: TypeAdapter, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached listing for `key`, or load and cache it on a miss.
+        A listing loaded while an event write committed is returned but not cached.
+        """
+        try:
+            value, generation = await self.backend.get(key)
+        except Exception:
+            logger.exception("Catalog cache read failed")
+            return await load()
+        if value is not None:
+            CATALOG_REQUESTS.inc(result="hit")
+            return value if self.backend.stores_objects else adapter.validate_json(value)
+
+        value = await load()
+        try:
+            stored = await self.backend.set(
+                key, value if self.backend.stores_objects else adapter.dump_json(value), self.ttl, generation
+            )
+        except Exception:
+            logger.exception("Catalog cache write failed")
+            stored = True  # Counted as a plain miss
+        CATALOG_REQUESTS.inc(result="miss" if stored else "stale")
+        return value
+
+    async def clear(self) -> None:
+        """Drop every cached listing."""
+        try:
+            await self.backend.clear()
+        except Exception:
+            logger.exception("Catalog cache invalidation failed")
+
+    async def invalidate(self, session: Optional[AsyncSession] = None) -> None:
+        """
+        Drop every cached listing after an event write. With a caller's
+        session the cache is cleared once it commits, otherwise the write has
+        already committed and the cache is cleared now. A read that loaded the
+        old rows before the clear sees the new generation and does not cache them.
+        """
+        if session is not None:
+            after_commit(session, self.clear)
+        else:
+            await self.clear()
+
+
+catalog_cache = CatalogCache(_create_backend(), CATALOG_CACHE_TTL_SECONDS)
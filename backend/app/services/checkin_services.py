@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Gate check-in services for MGLTickets."""
+
+import hashlib
+import hmac
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.db.repositories.async_event_repo as event_repo
+import app.db.repositories.async_ticket_instance_repo as ti_repo
+from app.schemas.checkin import CheckInResult, CheckInSyncResult, OfflineScan
+from app.core.cache import TTLCache
+from app.core.config import (
+    CHECKIN_INDEX_REFRESH_SECONDS,
+    CHECKIN_SYNC_MAX_SCANS,
+    EVENT_OWNER_CACHE_TTL_SECONDS,
+    SCANNER_BUNDLE_KEY,
+)
+from app.core.logging_config import logger
+from app.core.metrics import registry
+from app.utils.ticket_codes import ticket_code_hash
+from app.utils.datetime import to_utc
+
+CHECK_INS = registry.counter(
+    "checkins_total",
+    "Ticket scans by result and channel (gate or offline sync).",
+    ("result", "channel"),
+)
+
+
+class TicketCodeIndex:
+    """
+    Compact in-memory index of an event's ticket codes.
+    Codes are kept as a sorted array of 64-bit hashes (8 bytes per ticket) with a
+    parallel array of scan times, so lookups are a binary search, and repeat
+    scans and unknown codes at this worker are answered without touching the database.
+    """
+
+    def __init__(self, hashes: Iterable[int], loaded_at: Optional[datetime] = None):
+        self._hashes = array("Q", sorted(set(hashes)))
+        self._used_at = array("d", bytes(8 * len(self._hashes)))  # POSIX timestamps, 0.0 = not scanned
+        self._lock = threading.Lock()
+        self.loaded_at = loaded_at or datetime.now(timezone.utc)  # Tickets issued before this are indexed
+        self._refreshed = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    @property
+    def hashes(self) -> array:
+        """Sorted code hashes, as shipped in the offline scanner bundle."""
+        return self._hashes
+
+    def _position(self, code: str) -> int:
+        code_hash = ticket_code_hash(code)
+        i = bisect_left(self._hashes, code_hash)
+        return i if i < len(self._hashes) and self._hashes[i] == code_hash else -1
+
+    def __contains__(self, code: str) -> bool:
+        return self._position(code) >= 0
+
+    def used_at(self, code: str) -> Optional[datetime]:
+        """When this worker saw the code scanned, or None."""
+        i = self._position(code)
+        if i < 0 or not self._used_at[i]:
+            return None
+        return datetime.fromtimestamp(self._used_at[i], timezone.utc)
+
+    def mark_used(self, code: str, used_at: datetime) -> None:
+        i = self._position(code)
+        if i >= 0:
+            with self._lock:
+                self._used_at[i] = used_at.timestamp()
+
+    def refresh_due(self) -> bool:
+        """Whether tickets issued since the last load should be looked up again."""
+        return time.monotonic() - self._refreshed >= CHECKIN_INDEX_REFRESH_SECONDS
+
+    def add(self, hashes: Iterable[int], loaded_at: datetime) -> None:
+        """Merge the hashes of tickets issued since the last load, keeping scan times."""
+        with self._lock:
+            self._refreshed = time.monotonic()
+            self.loaded_at = loaded_at
+            new = set(hashes).difference(self._hashes)
+            if not new:
+                return
+            used_at = dict(zip(self._hashes, self._used_at))
+            self._hashes = array("Q", sorted(new.union(self._hashes)))
+            self._used_at = array("d", (used_at.get(code_hash, 0.0) for code_hash in self._hashes))
+
+
+_indexes: dict[int, TicketCodeIndex] = {}
+# Refreshes look back a little further than the last load, to allow for clock skew between workers
+_REFRESH_OVERLAP = timedelta(seconds=30)
+
+_event_owners = TTLCache("event_owner", 10000, EVENT_OWNER_CACHE_TTL_SECONDS)
+
+
+async def _load_event_code_index(event_id: int, session: Optional[AsyncSession] = None) -> TicketCodeIndex:
+    """Build a code index from the event's active tickets, hashing codes as they stream in."""
+    loaded_at = datetime.now(timezone.utc)
+    hashes = array("Q")
+    async for code in ti_repo.stream_active_codes_for_event_repo(event_id, session=session):
+        hashes.append(ticket_code_hash(code))
+    return TicketCodeIndex(hashes, loaded_at)
+
+
+async def _refresh_event_code_index(event_id: int, index: TicketCodeIndex, session: Optional[AsyncSession] = None) -> None:
+    """Add the tickets issued since the index was last loaded, e.g. sold at the door."""
+    loaded_at = datetime.now(timezone.utc)
+    hashes = array("Q")
+    async for code in ti_repo.stream_active_codes_for_event_repo(
+        event_id, issued_since=index.loaded_at - _REFRESH_OVERLAP, session=session
+    ):
+        hashes.append(ticket_code_hash(code))
+    index.add(hashes, loaded_at)
+
+
+async def get_event_organizer_service(event_id: int, session: Optional[AsyncSession] = None) -> Optional[int]:
+    """Return the organizer ID of an event, cached since gate staff are checked on every scan."""
+    organizer_id = _event_owners.get(event_id)
+    if organizer_id is None:
+        event = await event_repo.get_event_by_id_repo(event_id, session=session)
+        if not event:
+            return None
+        organizer_id = event.organizer_id
+        _event_owners.set(event_id, organizer_id)
+    return organizer_id
+
+
+async def preload_event_codes_service(event_id: int, session: Optional[AsyncSession] = None) -> int:
+    """Load the active ticket codes of an event into memory ahead of gate opening."""
+    logger.info("Preloading ticket codes for event ID: %s", event_id)
+    index = _indexes[event_id] = await _load_event_code_index(event_id, session=session)
+    logger.info("Preloaded %s ticket codes for event ID: %s", len(index), event_id)
+    return len(index)
+
+
+def get_event_code_index(event_id: int) -> Optional[TicketCodeIndex]:
+    """Return the preloaded code index of an event, if any."""
+    return _indexes.get(event_id)
+
+
+async def check_in_ticket_service(event_id: int, code: str, session: Optional[AsyncSession] = None) -> CheckInResult:
+    """
+    Validate a scanned code and admit its holder at most once.
+    The database update is the source of truth, so scans on different workers
+    or gates cannot both admit the same ticket.
+    """
+    result = await _check_in_ticket(event_id, code, session=session)
+    CHECK_INS.inc(result=result.result, channel="gate")
+    return result
+
+
+async def _check_in_ticket(event_id: int, code: str, session: Optional[AsyncSession] = None) -> CheckInResult:
+    """Check in one scanned code and report the outcome."""
+    index = _indexes.get(event_id)
+    if index is not None:
+        used_at = index.used_at(code)
+        if used_at is not None:
+            return CheckInResult(code=code, result="already_used", used_at=used_at)
+        if code not in index and index.refresh_due():
+            # The code may have been issued after the index was loaded
+            await _refresh_event_code_index(event_id, index, session=session)
+        if code not in index:
+            # Unknown, forged, cancelled or another event's code: rejected without a query
+            logger.warning("Unknown ticket code scanned", extra={"extra": {"event_id": event_id}})
+            return CheckInResult(code=code, result="invalid")
+
+    ticket_instance = await ti_repo.check_in_ticket_repo(event_id, code, session=session)
+    if ticket_instance:
+        if index is not None:
+            index.mark_used(code, ticket_instance.used_at)
+        return CheckInResult(
+            code=code,
+            result="admitted",
+            ticket_instance_id=ticket_instance.id,
+            ticket_type_id=ticket_instance.ticket_type_id,
+            used_at=ticket_instance.used_at,
+        )
+
+    found = await ti_repo.get_ticket_instance_by_code_repo(code, session=session)
+    if not found:
+        logger.warning("Unknown ticket code scanned", extra={"extra": {"event_id": event_id}})
+        return CheckInResult(code=code, result="invalid")
+
+    ticket_instance, ticket_event_id = found
+    if ticket_event_id != event_id:
+        result = "wrong_event"
+    elif ticket_instance.status == "used":
+        result = "already_used"
+        if index is not None and ticket_instance.used_at:
+            index.mark_used(code, ticket_instance.used_at)
+    else:
+        result = "not_active"
+    return CheckInResult(
+        code=code,
+        result=result,
+        ticket_instance_id=ticket_instance.id,
+        ticket_type_id=ticket_instance.ticket_type_id,
+        used_at=ticket_instance.used_at,
+    )
+
+
+# Offline scanner bundle layout (all integers big-endian):
+#   header    magic b"MGLB", version u8, event_id u32, generated_at u64 (unix seconds), count u32
+#   body      count sorted u64 ticket code hashes (blake2b, 8 bytes)
+#   trailer   32-byte HMAC-SHA256 of header + body, keyed with SCANNER_BUNDLE_KEY
+BUNDLE_MAGIC = b"MGLB"
+BUNDLE_VERSION = 1
+_BUNDLE_HEADER = struct.Struct(">4sBIQI")
+_BUNDLE_CHUNK_SIZE = 64 * 1024
+
+
+class ScannerBundle:
+    """Signed snapshot of an event's active ticket codes for gate devices that may go offline."""
+
+    def __init__(self, event_id: int, index: TicketCodeIndex):
+        self.event_id = event_id
+        self.count = len(index)
+        self.generated_at = int(time.time())
+        body = array("Q", index.hashes)
+        if sys.byteorder == "little":
+            body.byteswap()
+        self._header = _BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, event_id, self.generated_at, self.count)
+        self._body = body.tobytes()
+        signature = hmac.new(str(SCANNER_BUNDLE_KEY).encode(), self._header, hashlib.sha256)
+        signature.update(self._body)
+        self._signature = signature.digest()
+
+    @property
+    def size(self) -> int:
+        return len(self._header) + len(self._body) + len(self._signature)
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield the bundle in fixed-size pieces for a streaming response."""
+        yield self._header
+        body = memoryview(self._body)
+        for start in range(0, len(body), _BUNDLE_CHUNK_SIZE):
+            yield bytes(body[start:start + _BUNDLE_CHUNK_SIZE])
+        yield self._signature
+
+
+async def export_scanner_bundle_service(event_id: int, session: Optional[AsyncSession] = None) -> ScannerBundle:
+    """Build the offline scanner bundle of an event from its active tickets."""
+    index = await _load_event_code_index(event_id, session=session)
+    bundle = ScannerBundle(event_id, index)
+    logger.info("Exported scanner bundle of %s codes for event ID: %s", bundle.count, event_id)
+    return bundle
+
+
+async def sync_offline_scans_service(
+    event_id: int,
+    scans: list[OfflineScan],
+    device_id: Optional[str] = None,
+    session: Optional[AsyncSession] = None,
+) -> CheckInSyncResult:
+    """
+    Apply scans recorded offline by a gate device in one transaction.
+    A ticket is admitted by the earliest scan of it in the batch; every other
+    scan comes back as a conflict with the reason it was not admitted.
+    """
+    if len(scans) > CHECKIN_SYNC_MAX_SCANS:
+        raise ValueError(f"At most {CHECKIN_SYNC_MAX_SCANS} scans can be synced at once.")
+    logger.info("Syncing %s offline scans for event ID: %s", len(scans), event_id, extra={"extra": {"device_id": device_id}})
+
+    # Devices may send naive or offset-aware times, compare and store them all as UTC
+    earliest: dict[str, tuple[datetime, OfflineScan]] = {}
+    for scan in scans:
+        scanned_at = to_utc(scan.scanned_at)
+        if scan.code not in earliest or scanned_at < earliest[scan.code][0]:
+            earliest[scan.code] = (scanned_at, scan)
+
+    applied = await ti_repo.sync_check_ins_repo(
+        event_id, [(code, scanned_at) for code, (scanned_at, _) in earliest.items()], session=session
+    )
+    applied_by_code = {ticket_instance.code: ticket_instance for ticket_instance in applied}
+    index = _indexes.get(event_id)
+    if index is not None:
+        for ticket_instance in applied:
+            index.mark_used(ticket_instance.code, ticket_instance.used_at)
+
+    missing = [code for code in earliest if code not in applied_by_code]
+    found = await ti_repo.get_ticket_instances_by_codes_repo(missing, session=session)
+
+    conflicts = []
+    for scan in scans:
+        ticket_instance = applied_by_code.get(scan.code)
+        if ticket_instance is not None:
+            if scan is earliest[scan.code][1]:
+                continue
+            # Same ticket scanned again later in the batch
+            result, ticket_event_id = "already_used", event_id
+        elif scan.code in found:
+            ticket_instance, ticket_event_id = found[scan.code]
+            result = "already_used" if ticket_instance.status == "used" else "not_active"
+        else:
+            conflicts.append(CheckInResult(code=scan.code, result="invalid"))
+            continue
+        if ticket_event_id != event_id:
+            result = "wrong_event"
+        conflicts.append(CheckInResult(
+            code=scan.code,
+            result=result,
+            ticket_instance_id=ticket_instance.id,
+            ticket_type_id=ticket_instance.ticket_type_id,
+            used_at=ticket_instance.used_at,
+        ))
+
+    CHECK_INS.inc(len(applied), result="admitted", channel="offline")
+    for conflict in conflicts:
+        CHECK_INS.inc(result=conflict.result, channel="offline")
+    if conflicts:
+        logger.warning(
+            "%s offline scans for event ID: %s were not admitted",
+            len(conflicts),
+            event_id,
+            extra={"extra": {"device_id": device_id}},
+        )
+    return CheckInSyncResult(event_id=event_id, applied=len(applied), conflicts=conflicts)
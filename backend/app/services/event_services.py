@@ -1,143 +1,197 @@
 #!/usr/bin/env python3
 """Event services for MGLTickets."""
 
-import app.db.repositories.event_repo as event_repo
-from app.schemas.event import EventCreate
+import app.db.repositories.async_event_repo as event_repo
+from app.schemas.event import EventCreate, EventOut, EventDetailsOut
+from app.schemas.pagination import Page
+from app.core.config import PAGE_SIZE_DEFAULT
 from datetime import datetime
+from typing import Optional
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.logging_config import logger
+from app.services.catalog_cache import catalog_cache
 
-async def create_event_service(event_data: EventCreate) -> dict:
+EVENT_LIST = TypeAdapter(list[EventOut])
+EVENT_PAGE = TypeAdapter(Page[EventOut])
+
+async def create_event_service(event_data: EventCreate, session: Optional[AsyncSession] = None) -> dict:
     """Create a new event."""
-    logger.info(f"Creating event: {event_data}")
+    logger.info("Creating event: %s", event_data)
     flyer_url = "jhjhjhjhjnet"
     event_data = event_data.copy(update={"flyer_url": flyer_url})
-    event = event_repo.create_event_repo(event_data)
-    logger.info(f"Created event with ID: {event.id}")
+    event = await event_repo.create_event_repo(event_data, session=session)
+    await catalog_cache.invalidate(session)
+    logger.info("Created event with ID: %s", event.id)
     return event
 
-async def update_event_service(event_id: int, event_data: EventCreate) -> dict:
+async def update_event_service(event_id: int, event_data: EventCreate, session: Optional[AsyncSession] = None) -> dict:
     """Update an event by its ID."""
-    logger.info(f"Updating event with ID: {event_id}")
-    event = event_repo.update_event_repo(event_id, event_data)
-    logger.info(f"Updated event with ID: {event.id}")
+    logger.info("Updating event with ID: %s", event_id)
+    event = await event_repo.update_event_repo(event_id, event_data, session=session)
+    await catalog_cache.invalidate(session)
+    logger.info("Updated event with ID: %s", event.id)
     return event
 
-async def get_approved_events_service() -> list[dict]:
+async def get_approved_events_service(session: Optional[AsyncSession] = None) -> list[dict]:
     """Retrieve all approved events."""
     logger.info("Retrieving approved events")
-    return event_repo.get_approved_events_repo()
+    return await catalog_cache.get_or_load(
+        "approved", EVENT_LIST, lambda: event_repo.get_approved_events_repo(session=session)
+    )
 
-async def get_unapproved_events_service() -> list[dict]:
+async def get_unapproved_events_service(session: Optional[AsyncSession] = None) -> list[dict]:
     """Retrieve all unapproved events."""
     logger.info("Retrieving unapproved events")
-    return event_repo.get_unapproved_events_repo()
-
-async def get_all_events_service() -> list[dict]:
-    """Retrieve all events."""
+    return await event_repo.get_unapproved_events_repo(session=session)
+
+async def get_all_events_service(
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE_DEFAULT,
+    version: Optional[tuple[int, Optional[datetime]]] = None,
+    session: Optional[AsyncSession] = None,
+) -> Page[EventOut]:
+    """
+    Retrieve one page of events. Pass the listing's current `version` to key
+    the cached page by it, so the page always matches an ETag built from it.
+    """
     logger.info("Retrieving all events")
-    return event_repo.get_all_events_repo()
+    return await catalog_cache.get_or_load(
+        f"all:{cursor}:{limit}:{version}", EVENT_PAGE, lambda: event_repo.get_all_events_repo(cursor, limit, session=session)
+    )
 
-async def get_event_by_id_service(event_id: int) -> dict:
+async def get_event_by_id_service(event_id: int, session: Optional[AsyncSession] = None) -> dict:
     """Retrieve an event by its ID."""
-    logger.info(f"Retrieving event with ID: {event_id}")
-    return event_repo.get_event_by_id_repo(event_id)
+    logger.info("Retrieving event with ID: %s", event_id)
+    return await event_repo.get_event_by_id_repo(event_id, session=session)
 
-async def approve_event_service(event_id: int) -> dict:
+async def get_event_details_service(event_id: int, session: Optional[AsyncSession] = None) -> Optional[EventDetailsOut]:
+    """Retrieve an event with its ticket types and remaining stock."""
+    logger.info("Retrieving details of event with ID: %s", event_id)
+    return await event_repo.get_event_details_repo(event_id, session=session)
+
+async def approve_event_service(event_id: int, session: Optional[AsyncSession] = None) -> dict:
     """Approve an event."""
-    logger.info(f"Approving event with ID: {event_id}")
-    return event_repo.approve_event_repo(event_id)
+    logger.info("Approving event with ID: %s", event_id)
+    result = await event_repo.approve_event_repo(event_id, session=session)
+    await catalog_cache.invalidate(session)
+    return result
 
-async def reject_event_service(event_id: int) -> dict:
+async def reject_event_service(event_id: int, session: Optional[AsyncSession] = None) -> dict:
     """Reject an event."""
-    logger.info(f"Rejecting event with ID: {event_id}")
-    return event_repo.reject_event_repo(event_id)
+    logger.info("Rejecting event with ID: %s", event_id)
+    result = await event_repo.reject_event_repo(event_id, session=session)
+    await catalog_cache.invalidate(session)
+    return result
 
-async def delete_event_service(event_id: int) -> None:
+async def delete_event_service(event_id: int, session: Optional[AsyncSession] = None) -> None:
     """Delete an event."""
-    logger.info(f"Deleting event with ID: {event_id}")
-    return event_repo.delete_event_repo(event_id)
+    logger.info("Deleting event with ID: %s", event_id)
+    result = await event_repo.delete_event_repo(event_id, session=session)
+    await catalog_cache.invalidate(session)
+    return result
 
-async def update_event_status_service(event_id: int, status: str) -> dict:
+async def update_event_status_service(event_id: int, status: str, session: Optional[AsyncSession] = None) -> dict:
     """Update the status of an event."""
-    logger.info(f"Updating status of event with ID: {event_id} to {status.upper()}")
-    return event_repo.update_event_status_repo(event_id, status)
+    logger.info("Updating status of event with ID: %s to %s", event_id, status.upper())
+    event = await event_repo.update_event_status_repo(event_id, status, session=session)
+    await catalog_cache.invalidate(session)
+    return event
 
-async def get_events_by_organizer_service(organizer_id: int) -> list[dict]:
+async def get_events_by_organizer_service(organizer_id: int, session: Optional[AsyncSession] = None) -> list[dict]:
     """Retrieve events by organizer ID."""
-    logger.info(f"Retrieving events for organizer with ID: {organizer_id}")
-    return event_repo.get_events_by_organizer_repo(organizer_id)
+    logger.info("Retrieving events for organizer with ID: %s", organizer_id)
+    return await event_repo.get_events_by_organizer_repo(organizer_id, session=session)
 
-async def get_events_in_date_range_service(start_date: datetime, end_date: datetime) -> list[dict]:
+async def get_events_in_date_range_service(start_date: datetime, end_date: datetime, session: Optional[AsyncSession] = None) -> list[dict]:
     """Retrieve events within a specific date range."""
-    logger.info(f"Retrieving events from {start_date} to {end_date}")
-    return event_repo.get_events_in_date_range_repo(start_date, end_date)
+    logger.info("Retrieving events from %s to %s", start_date, end_date)
+    return await event_repo.get_events_in_date_range_repo(start_date, end_date, session=session)
 
-async def search_events_by_title_service(title: str) -> list[dict]:
+async def search_events_by_title_service(title: str, session: Optional[AsyncSession] = None) -> list[dict]:
     """Search events by title."""
-    logger.info(f"Searching events by title: {title}")
-    return event_repo.search_events_by_title_repo(title)
+    logger.info("Searching events by title: %s", title)
+    return await event_repo.search_events_by_title_repo(title, session=session)
 
-async def count_events_service() -> int:
+async def count_events_service(session: Optional[AsyncSession] = None) -> int:
     """Count total number of events."""
     logger.info("Counting total number of events")
-    return event_repo.count_events_repo()
+    return await event_repo.count_events_repo(session=session)
 
-async def get_latest_events_service(limit: int = 5) -> list[dict]:
-    """Get the latest added events."""
-    logger.info(f"Retrieving the latest {limit} events")
-    return event_repo.get_latest_events_repo(limit)
-
-async def get_events_by_status_service(status: str) -> list[dict]:
-    """Get events by their status."""
-    logger.info(f"Retrieving events with status: {status.upper()}")
-    return event_repo.get_events_by_status_repo(status)
+async def get_events_version_service(status: Optional[str] = None, session: Optional[AsyncSession] = None) -> tuple[int, Optional[datetime]]:
+    """Get the count and latest update time of all events, or of those with a given status."""
+    # Never cached: list ETags are built from it, and a stale version would answer 304 for changed
+    # listings. The aggregate is served from ix_events_updated_at / ix_events_status_updated_at.
+    return await event_repo.get_events_version_repo(status, session=session)
 
-async def get_events_with_bookings_service() -> list[dict]:
+async def get_latest_events_service(limit: int = 5, session: Optional[AsyncSession] = None) -> list[dict]:
+    """Get the latest added events."""
+    logger.info("Retrieving the latest %s events", limit)
+    return await catalog_cache.get_or_load(
+        f"latest:{limit}", EVENT_LIST, lambda: event_repo.get_latest_events_repo(limit, session=session)
+    )
+
+async def get_events_by_status_service(
+    status: str,
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE_DEFAULT,
+    version: Optional[tuple[int, Optional[datetime]]] = None,
+    session: Optional[AsyncSession] = None,
+) -> Page[EventOut]:
+    """Get one page of events by their status, keyed by the listing's `version` like get_all_events_service."""
+    logger.info("Retrieving events with status: %s", status.upper())
+    return await catalog_cache.get_or_load(
+        f"status:{status}:{cursor}:{limit}:{version}",
+        EVENT_PAGE,
+        lambda: event_repo.get_events_by_status_repo(status, cursor, limit, session=session),
+    )
+
+async def get_events_with_bookings_service(session: Optional[AsyncSession] = None) -> list[dict]:
     """Get all events that have bookings."""
     logger.info("Retrieving events with bookings")
-    return event_repo.get_events_with_bookings_repo()
+    return await event_repo.get_events_with_bookings_repo(session=session)
 
-async def get_events_without_bookings_service() -> list[dict]:
+async def get_events_without_bookings_service(session: Optional[AsyncSession] = None) -> list[dict]:
     """Get all events that do not have bookings."""
     logger.info("Retrieving events without bookings")
-    return event_repo.get_events_without_bookings_repo()
+    return await event_repo.get_events_without_bookings_repo(session=session)
 
-async def search_events_by_venue_service(venue: str) -> list[dict]:
+async def search_events_by_venue_service(venue: str, session: Optional[AsyncSession] = None) -> list[dict]:
     """Search events by venue."""
-    logger.info(f"Searching events by venue: {venue.upper()}")
-    return event_repo.search_events_by_venue_repo(venue)
+    logger.info("Searching events by venue: %s", venue.upper())
+    return await event_repo.search_events_by_venue_repo(venue, session=session)
 
-async def get_events_created_after_service(date: datetime) -> list[dict]:
+async def get_events_created_after_service(date: datetime, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events created after a specific date."""
-    logger.info(f"Retrieving events created after {date}")
-    return event_repo.get_events_created_after_repo(date)
+    logger.info("Retrieving events created after %s", date)
+    return await event_repo.get_events_created_after_repo(date, session=session)
 
-async def get_events_created_before_service(date: datetime) -> list[dict]:
+async def get_events_created_before_service(date: datetime, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events created before a specific date."""
-    logger.info(f"Retrieving events created before {date}")
-    return event_repo.get_events_created_before_repo(date)
+    logger.info("Retrieving events created before %s", date)
+    return await event_repo.get_events_created_before_repo(date, session=session)
 
-async def get_events_updated_after_service(date: datetime) -> list[dict]:
+async def get_events_updated_after_service(date: datetime, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events updated after a specific date."""
-    logger.info(f"Retrieving events updated after {date}")
-    return event_repo.get_events_updated_after_repo(date)
+    logger.info("Retrieving events updated after %s", date)
+    return await event_repo.get_events_updated_after_repo(date, session=session)
 
-async def get_events_updated_before_service(date: datetime) -> list[dict]:
+async def get_events_updated_before_service(date: datetime, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events updated before a specific date."""
-    logger.info(f"Retrieving events updated before {date}")
-    return event_repo.get_events_updated_before_repo(date)
+    logger.info("Retrieving events updated before %s", date)
+    return await event_repo.get_events_updated_before_repo(date, session=session)
 
-async def get_events_sorted_by_start_time_service(ascending: bool = True) -> list[dict]:
+async def get_events_sorted_by_start_time_service(ascending: bool = True, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events sorted by start time."""
     logger.info("Retrieving events sorted by start time")
-    return event_repo.get_events_sorted_by_start_time_repo(ascending)
+    return await event_repo.get_events_sorted_by_start_time_repo(ascending, session=session)
 
-async def get_events_sorted_by_end_time_service(ascending: bool = True) -> list[dict]:
+async def get_events_sorted_by_end_time_service(ascending: bool = True, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events sorted by end time."""
     logger.info("Retrieving events sorted by end time")
-    return event_repo.get_events_sorted_by_end_time_repo(ascending)
+    return await event_repo.get_events_sorted_by_end_time_repo(ascending, session=session)
 
-async def get_events_by_country_service(country: str) -> list[dict]:
+async def get_events_by_country_service(country: str, session: Optional[AsyncSession] = None) -> list[dict]:
     """Get events by country."""
-    logger.info(f"Retrieving events in {country.upper()}")
-    return event_repo.get_events_by_country_repo(country)
\ No newline at end of file
+    logger.info("Retrieving events in %s", country.upper())
+    return await event_repo.get_events_by_country_repo(country, session=session)
\ No newline at end of file
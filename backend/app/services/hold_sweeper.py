@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Background sweeper that releases expired ticket holds for MGLTickets."""
+
+import asyncio
+from typing import Optional
+
+from app.core.logging_config import logger
+from app.services.booking_services import expire_booking_holds_service
+
+
+class HoldSweeper:
+    """Periodically expires lapsed pending bookings on the running event loop."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sweeping in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="hold-sweeper")
+
+    async def stop(self) -> None:
+        """Stop sweeping and wait for the current sweep to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                # The sweep uses the sync engine, keep it off the event loop
+                await asyncio.to_thread(expire_booking_holds_service)
+            except Exception:
+                logger.exception("Booking hold sweep failed")
+            await asyncio.sleep(self.interval_seconds)
@@ -4,57 +4,85 @@
 from typing import Optional
 from datetime import datetime
 import app.db.repositories.payment_repo as payment_repo
-from app.schemas.payment import PaymentCreate, PaymentUpdate
+from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentOut
+from app.schemas.pagination import Page
+from app.core.config import PAGE_SIZE_DEFAULT
 from app.core.logging_config import logger
+from app.core.metrics import registry
+from app.services.booking_services import confirm_booking_service, get_booking_by_id_service
+
+PAYMENTS = registry.counter(
+    "payments_total",
+    "Payment records created or moved to a status, by status. refund_required counts payments that bought no tickets.",
+    ("status",),
+)
 
 def create_payment_service(payment: PaymentCreate) -> dict:
     """Service to create a new payment."""
     logger.info("Creating a new payment record.")
-    return payment_repo.create_payment_repo(payment)
+    created = payment_repo.create_payment_repo(payment)
+    PAYMENTS.inc(status=created.status)
+    return created
 
 def get_payment_by_id_service(payment_id: int) -> Optional[dict]:
     """Service to retrieve a payment by its ID."""
-    logger.info(f"Retrieving payment record with ID: {payment_id}.")
+    logger.info("Retrieving payment record with ID: %s.", payment_id)
     return payment_repo.get_payment_by_id_repo(payment_id)
 
 def update_payment_service(payment_id: int, payment_update: PaymentUpdate) -> Optional[dict]:
     """Service to update payment details."""
-    logger.info(f"Updating payment record with ID: {payment_id}.")
+    logger.info("Updating payment record with ID: %s.", payment_id)
     return payment_repo.update_payment_repo(payment_id, payment_update)
 
 def update_payment_status_service(payment_id: int, status: str) -> Optional[dict]:
-    """Service to update the status of a payment."""
-    logger.info(f"Updating status of payment record with ID: {payment_id} to {status}.")
-    return payment_repo.update_payment_status_repo(payment_id, status)
+    """
+    Service to update the status of a payment, confirming its booking once paid.
+    A completed payment whose booking cannot be confirmed (cancelled, or expired
+    and sold out) is moved to "refund_required" so the buyer can be refunded.
+    """
+    logger.info("Updating status of payment record with ID: %s to %s.", payment_id, status)
+    payment = payment_repo.update_payment_status_repo(payment_id, status)
+    if payment:
+        PAYMENTS.inc(status=status)
+    if payment and status == "completed" and not confirm_booking_service(payment.booking_id):
+        booking = get_booking_by_id_service(payment.booking_id)
+        if not booking or booking.status != "confirmed":  # Not a repeated callback for a confirmed booking
+            logger.error(
+                "Payment completed but its booking could not be confirmed, refund required",
+                extra={"extra": {"payment_id": payment_id, "booking_id": payment.booking_id}},
+            )
+            payment = payment_repo.update_payment_status_repo(payment_id, "refund_required")
+            PAYMENTS.inc(status="refund_required")
+    return payment
 
 def delete_payment_service(payment_id: int) -> bool:
     """Service to delete a payment record."""
-    logger.info(f"Deleting payment record with ID: {payment_id}.")
+    logger.info("Deleting payment record with ID: %s.", payment_id)
     return payment_repo.delete_payment_repo(payment_id)
 
-def list_payments_service() -> list[dict]:
-    """Service to list all payments."""
+def list_payments_service(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[PaymentOut]:
+    """Service to list one page of payments."""
     logger.info("Listing all payment records.")
-    return payment_repo.list_payments_repo()
+    return payment_repo.list_payments_repo(cursor, limit)
 
 def get_payments_by_booking_id_service(booking_id: int) -> list[dict]:
     """Service to retrieve payments by booking ID."""
-    logger.info(f"Retrieving payment records for booking ID: {booking_id}.")
+    logger.info("Retrieving payment records for booking ID: %s.", booking_id)
     return payment_repo.get_payments_by_booking_id_repo(booking_id)
 
 def record_payment_callback_service(payment_id: int, callback_payload: str) -> Optional[dict]:
     """Service to record the callback payload for a payment."""
-    logger.info(f"Recording callback payload for payment ID: {payment_id}.")
+    logger.info("Recording callback payload for payment ID: %s.", payment_id)
     return payment_repo.record_callback_payload_repo(payment_id, callback_payload)
 
 def get_payment_by_mpesa_ref_service(mpesa_ref: str) -> list[dict]:
     """Service to retrieve payments by M-Pesa reference."""
-    logger.info(f"Retrieving payment records with M-Pesa reference: {mpesa_ref}.")
+    logger.info("Retrieving payment records with M-Pesa reference: %s.", mpesa_ref)
     return payment_repo.get_payment_by_mpesa_ref_repo(mpesa_ref)
 
 def list_payments_by_status_service(status: str) -> list[dict]:
     """Service to list payments by their status."""
-    logger.info(f"Listing payment records with status: {status}.")
+    logger.info("Listing payment records with status: %s.", status)
     return payment_repo.list_payments_by_status_repo(status)
 
 def count_payments_service() -> int:
@@ -64,20 +92,20 @@ def count_payments_service() -> int:
 
 def get_total_by_booking_id_service(booking_id: int) -> float:
     """Service to get the total payment amount for a specific booking ID."""
-    logger.info(f"Calculating total payment amount for booking ID: {booking_id}.")
+    logger.info("Calculating total payment amount for booking ID: %s.", booking_id)
     return payment_repo.get_total_amount_by_booking_id_repo(booking_id)
 
 def get_payments_created_after_service(date_time: datetime) -> list[dict]:
     """Service to retrieve payments created after a specific date and time."""
-    logger.info(f"Retrieving payment records created after: {date_time}.")
+    logger.info("Retrieving payment records created after: %s.", date_time)
     return payment_repo.get_payments_created_after_repo(date_time)
 
 def get_payments_updated_after_service(date_time: datetime) -> list[dict]:
     """Service to retrieve payments updated after a specific date and time."""
-    logger.info(f"Retrieving payment records updated after: {date_time}.")
+    logger.info("Retrieving payment records updated after: %s.", date_time)
     return payment_repo.get_payments_updated_after_repo(date_time)
 
 def get_latest_payments_service(limit: int = 10) -> list[dict]:
     """Service to retrieve the latest payment records."""
-    logger.info(f"Retrieving the latest {limit} payment records.")
+    logger.info("Retrieving the latest %s payment records.", limit)
     return payment_repo.get_latest_payments_repo(limit)
\ No newline at end of file
@@ -3,8 +3,11 @@
 
 from app.core.logging_config import logger
 import app.db.repositories.ticket_instance_repo as ti_repo
-from app.schemas.ticket_instance import TicketInstanceCreate, TicketInstanceUpdate
+from app.schemas.ticket_instance import TicketInstanceCreate, TicketInstanceUpdate, TicketInstanceOut
+from app.schemas.pagination import Page
+from app.core.config import PAGE_SIZE_DEFAULT
 from typing import Optional
+from app.utils.ticket_codes import generate_ticket_codes
 from datetime import datetime
 
 def create_ticket_instance(ticket_instance_create: TicketInstanceCreate) -> dict:
@@ -14,35 +17,43 @@ def create_ticket_instance(ticket_instance_create: TicketInstanceCreate) -> dict
 
 def get_ticket_instance_by_id(ticket_instance_id: int) -> Optional[dict]:
     """Retrieve a TicketInstance by its ID."""
-    logger.info(f"Retrieving TicketInstance with ID: {ticket_instance_id}")
+    logger.info("Retrieving TicketInstance with ID: %s", ticket_instance_id)
     return ti_repo.get_ticket_instance_by_id_repo(ticket_instance_id)
 
 def update_ticket_instance(ticket_instance_id: int, ticket_instance_update: TicketInstanceUpdate) -> Optional[dict]:
     """Update an existing TicketInstance."""
-    logger.info(f"Updating TicketInstance with ID: {ticket_instance_id}")
+    logger.info("Updating TicketInstance with ID: %s", ticket_instance_id)
     return ti_repo.update_ticket_instance_repo(ticket_instance_id, ticket_instance_update)
 
 def delete_ticket_instance(ticket_instance_id: int) -> bool:
     """Delete a TicketInstance by its ID."""
-    logger.info(f"Deleting TicketInstance with ID: {ticket_instance_id}")
+    logger.info("Deleting TicketInstance with ID: %s", ticket_instance_id)
     return ti_repo.delete_ticket_instance_repo(ticket_instance_id)
 
-def list_ticket_instances() -> list[dict]:
-    """List all TicketInstances in the database."""
+def list_ticket_instances(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[TicketInstanceOut]:
+    """List one page of TicketInstances."""
     logger.info("Listing all TicketInstances")
-    return ti_repo.list_ticket_instances_repo()
+    return ti_repo.list_ticket_instances_repo(cursor, limit)
 
 def list_ticket_instances_in_date_range(start_date: str, end_date: str) -> list[dict]:
     """List TicketInstances created within a specific date range."""
-    logger.info(f"Listing TicketInstances from {start_date} to {end_date}")
+    logger.info("Listing TicketInstances from %s to %s", start_date, end_date)
     return ti_repo.list_ticket_instances_in_date_range_repo(start_date, end_date)
 
 def get_ticket_instances_by_user(user_id: int) -> list[dict]:
     """List TicketInstances for a specific user."""
-    logger.info(f"Listing TicketInstances for user ID: {user_id}")
+    logger.info("Listing TicketInstances for user ID: %s", user_id)
     return ti_repo.get_ticket_instances_by_user_repo(user_id)
 
 def get_ticket_instances_by_status(status: str) -> list[dict]:
     """List TicketInstances filtered by their status."""
-    logger.info(f"Listing TicketInstances with status: {status}")
-    return ti_repo.get_ticket_instances_by_status_repo(status)
\ No newline at end of file
+    logger.info("Listing TicketInstances with status: %s", status)
+    return ti_repo.get_ticket_instances_by_status_repo(status)
+
+def issue_ticket_instances(booking_id: int, ticket_type_id: int, user_id: int, quantity: int, issued_to: Optional[str] = None) -> list[dict]:
+    """Issue `quantity` TicketInstances for a booking in one bulk insert."""
+    logger.info("Issuing %s TicketInstances for booking ID: %s", quantity, booking_id)
+    if quantity < 1:
+        raise ValueError("Quantity must be at least 1.")
+    codes = generate_ticket_codes(quantity)
+    return ti_repo.issue_ticket_instances_repo(booking_id, ticket_type_id, user_id, codes, issued_to)
@@ -9,44 +9,44 @@ from app.core.logging_config import logger
 
 def create_ticket_type_service(ticket_type_in: TicketTypeCreate) -> dict:
     """Service to create a new TicketType."""
-    logger.info(f"Creating TicketType with data: {ticket_type_in.model_dump()}")
+    logger.info("Creating TicketType with data: %s", ticket_type_in)
     ticket_type = tt_repo.create_ticket_type_repo(ticket_type_in)
-    logger.info(f"Created TicketType with ID: {ticket_type.id}")
+    logger.info("Created TicketType with ID: %s", ticket_type.id)
     return ticket_type
 
 def get_ticket_type_by_id_service(ticket_type_id: int) -> Optional[dict]:
     """Service to get a TicketType by ID."""
-    logger.info(f"Retrieving TicketType with ID: {ticket_type_id}")
+    logger.info("Retrieving TicketType with ID: %s", ticket_type_id)
     ticket_type = tt_repo.get_ticket_type_by_id_repo(ticket_type_id)
     if ticket_type:
-        logger.info(f"Retrieved TicketType: {ticket_type}")
+        logger.info("Retrieved TicketType: %s", ticket_type)
     else:
-        logger.warning(f"TicketType with ID {ticket_type_id} not found")
+        logger.warning("TicketType with ID %s not found", ticket_type_id)
     return ticket_type
 
 def update_ticket_type_service(ticket_type_id: int, ticket_type_in: TicketTypeUpdate) -> Optional[dict]:
     """Service to update an existing TicketType."""
-    logger.info(f"Updating TicketType with ID: {ticket_type_id} using data: {ticket_type_in.model_dump(exclude_unset=True)}")
+    logger.info("Updating TicketType with ID: %s using data: %s", ticket_type_id, ticket_type_in)
     ticket_type = tt_repo.update_ticket_type_repo(ticket_type_id, ticket_type_in)
     if ticket_type:
-        logger.info(f"Updated TicketType: {ticket_type}")
+        logger.info("Updated TicketType: %s", ticket_type)
     else:
-        logger.warning(f"TicketType with ID {ticket_type_id} not found for update")
+        logger.warning("TicketType with ID %s not found for update", ticket_type_id)
     return ticket_type
 
 def delete_ticket_type_service(ticket_type_id: int) -> bool:
     """Service to delete a TicketType by ID."""
-    logger.info(f"Deleting TicketType with ID: {ticket_type_id}")
+    logger.info("Deleting TicketType with ID: %s", ticket_type_id)
     success = tt_repo.delete_ticket_type_repo(ticket_type_id)
     if success:
-        logger.info(f"Deleted TicketType with ID: {ticket_type_id}")
+        logger.info("Deleted TicketType with ID: %s", ticket_type_id)
     else:
-        logger.warning(f"TicketType with ID {ticket_type_id} not found for deletion")
+        logger.warning("TicketType with ID %s not found for deletion", ticket_type_id)
     return success
 
 def list_ticket_types_by_event_id_service(event_id: int) -> list[dict]:
     """Service to list all TicketTypes for a given Event ID."""
-    logger.info(f"Listing TicketTypes for Event ID: {event_id}")
+    logger.info("Listing TicketTypes for Event ID: %s", event_id)
     ticket_types = tt_repo.list_ticket_types_event_id_repo(event_id)
-    logger.info(f"Found {len(ticket_types)} TicketTypes for Event ID: {event_id}")
+    logger.info("Found %s TicketTypes for Event ID: %s", len(ticket_types), event_id)
     return ticket_types
\ No newline at end of file
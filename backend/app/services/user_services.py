@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """User-related services for MGLTickets."""
 
+import time
 import app.db.repositories.user_repo as user_repo
+import app.db.repositories.async_user_repo as async_user_repo
 from typing import Optional
-from passlib.hash import argon2
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.hashing import hash_password, verify_password
 from app.core.logging_config import logger
+from app.core.config import PAGE_SIZE_DEFAULT
+from app.core.cache import user_cache
+from app.schemas.pagination import Page
+from app.schemas.user import UserOut, UserAuth
 
 
-def register_user_service(name: str, email: str, password: str, phone_number: str, role: Optional[str]) -> dict:
+async def register_user_service(name: str, email: str, password: str, phone_number: str, role: Optional[str]) -> dict:
     """Create a new user and return the user"""
     logger.info("Registering user...")
 
@@ -23,78 +30,104 @@ def register_user_service(name: str, email: str, password: str, phone_number: st
     if user_repo.get_user_by_email_repo(email):  # Check if the email exists
         raise ValueError("Email already exists! Please use a different email.")
     
-    password_hash = argon2.hash(password)
+    password_hash = await hash_password(password)
 
     user = user_repo.create_user_repo(name, email, password_hash, phone_number, role)
 
-    logger.info(f"User {user.name} with ID {user.id} registered successfully.")
+    logger.info("User %s with ID %s registered successfully.", user.name, user.id)
 
     return user
 
-def authenticate_user_service(user_id: int, email: str, password: str) -> dict:
-    """Authenticate a user and return the user"""
-    logger.info(f"Authenticating user with ID: {user_id}")
+async def authenticate_user_service(email: str, password: str, session: Optional[AsyncSession] = None) -> UserAuth:
+    """Authenticate a user by email and password with a single user lookup."""
+    logger.info("Authenticating user...")
 
     if '@' not in email or '.' not in email:
         raise ValueError("Invalid email format.")
-    
-    user = user_repo.get_user_with_password_by_id_repo(user_id)
+
+    start = time.perf_counter()
+    user = await async_user_repo.get_user_auth_by_email_repo(email, session=session)
+    db_ms = (time.perf_counter() - start) * 1000
     if not user:
         raise ValueError("User not found.")
-    
-    if not argon2.verify(password, user.password_hash):
+
+    start = time.perf_counter()
+    verified = await verify_password(password, user.password_hash)
+    hash_ms = (time.perf_counter() - start) * 1000
+    # Breaks login latency down into the lookup and argon2 (including time queued for the hashing pool)
+    logger.info(
+        "Login timing",
+        extra={"extra": {"user_id": user.id, "db_ms": round(db_ms, 2), "hash_ms": round(hash_ms, 2)}},
+    )
+    if not verified:
         raise ValueError("Invalid password.")
-    
-    return user.model_dump(exclude={"password_hash"})
 
-def get_user_by_email_service(email: str) -> dict:
+    if not user.is_active:
+        raise ValueError("Account is deactivated.")
+
+    return user
+
+async def get_user_by_email_service(email: str, session: Optional[AsyncSession] = None) -> dict:
     """Retrieve a user by email."""
     logger.info("Getting user by email...")
-    return user_repo.get_user_by_email_repo(email)
+    return await async_user_repo.get_user_by_email_repo(email, session=session)
 
-def get_user_by_id_service(user_id: int) -> dict:
+async def get_user_by_id_service(user_id: int, session: Optional[AsyncSession] = None) -> dict:
     """Retrieve a user by ID."""
     logger.info("Getting user by ID...")
-    return user_repo.get_user_by_id_repo(user_id)
+    return await async_user_repo.get_user_by_id_repo(user_id, session=session)
+
+async def get_cached_user_by_id_service(user_id: int, session: Optional[AsyncSession] = None) -> Optional[UserOut]:
+    """
+    Retrieve a user by ID from the user cache, loading it on a miss.
+    A user loaded while a user_repo write committed is returned but not cached.
+    """
+    user = user_cache.get(user_id)
+    if user is None:
+        generation = user_cache.generation
+        user = await async_user_repo.get_user_by_id_repo(user_id, session=session)
+        if user:
+            user_cache.set(user_id, user, generation=generation)
+    return user
 
 def search_users_by_name_service(name_query: str) -> list[dict]:
     """Search users by name."""
-    logger.info(f"Searching users by name: {name_query}")
+    logger.info("Searching users by name: %s", name_query)
     return user_repo.search_users_by_name_repo(name_query)
 
 def promote_user_to_admin_service(user_id: int) -> dict:
     """Promote a user to admin role."""
-    logger.info(f"Promoting user with ID {user_id} to admin.")
+    logger.info("Promoting user with ID %s to admin.", user_id)
     return user_repo.update_user_role_repo(user_id, "admin")
 
 def demote_user_from_admin_service(user_id: int) -> dict:
     """Demote a user from admin role."""
-    logger.info(f"Demoting user with ID {user_id} from admin.")
+    logger.info("Demoting user with ID %s from admin.", user_id)
     return user_repo.update_user_role_repo(user_id, "attendee")
 
 def promote_user_to_organizer_service(user_id: int) -> dict:
     """Promote a user to organizer role."""
-    logger.info(f"Promoting user with ID {user_id} to organizer.")
+    logger.info("Promoting user with ID %s to organizer.", user_id)
     return user_repo.update_user_role_repo(user_id, "organizer")
 
 def demote_user_from_organizer_service(user_id: int) -> dict:
     """Demote a user from organizer role."""
-    logger.info(f"Demoting user with ID {user_id} from organizer.")
+    logger.info("Demoting user with ID %s from organizer.", user_id)
     return user_repo.update_user_role_repo(user_id, "attendee")
 
 def promote_organizer_to_admin_service(user_id: int) -> dict:
     """Promote an organizer to admin role."""
-    logger.info(f"Promoting organizer with ID {user_id} to admin.")
+    logger.info("Promoting organizer with ID %s to admin.", user_id)
     return user_repo.update_user_role_repo(user_id, "admin")
 
 def demote_admin_to_organizer_service(user_id: int) -> dict:
     """Demote an admin to organizer role."""
-    logger.info(f"Demoting admin with ID {user_id} from admin.")
+    logger.info("Demoting admin with ID %s from admin.", user_id)
     return user_repo.update_user_role_repo(user_id, "organizer")
 
 def update_user_contact_service(user_id: int, new_email: Optional[str], new_phone_number: Optional[str]) -> dict:
     """Update a user's contact information."""
-    logger.info(f"Updating contact information of user with ID: {user_id}")
+    logger.info("Updating contact information of user with ID: %s", user_id)
     if new_email:
         if '@' not in new_email or '.' not in new_email:
             raise ValueError("Invalid email format.")
@@ -105,34 +138,34 @@ def update_user_contact_service(user_id: int, new_email: Optional[str], new_phon
 
 def delete_user_service(user_id: int) -> bool:
     """Delete a user by ID."""
-    logger.info(f"Deleting user with ID: {user_id}")
+    logger.info("Deleting user with ID: %s", user_id)
     user_repo.delete_user_repo(user_id)
 
 def deactivate_user_service(user_id: int) -> dict:
     """Deactivate a user account."""
-    logger.info(f"Deactivating a user account with ID: {user_id}")
+    logger.info("Deactivating a user account with ID: %s", user_id)
     return user_repo.deactivate_user_repo(user_id)
 
 def activate_user_service(user_id: int) -> dict:
     """Activate a user account."""
-    logger.info("Activating user account with ID: {user_id}")
+    logger.info("Activating user account with ID: %s", user_id)
     return user_repo.activate_user_repo(user_id)
 
-def update_user_password_service(user_id: int, new_password: str) -> dict:
+async def update_user_password_service(user_id: int, new_password: str) -> dict:
     """Update a user's password."""
-    logger.info("Updating password of user with ID: {user_id}")
-    new_password_hash = argon2.hash(new_password)
+    logger.info("Updating password of user with ID: %s", user_id)
+    new_password_hash = await hash_password(new_password)
     return user_repo.update_user_password_repo(user_id, new_password_hash)
 
 def count_users_by_role_service(role: str) -> int:
     """Count users by their role."""
-    logger.info(f"Counting users by role: {role.upper()}")
+    logger.info("Counting users by role: %s", role.upper())
     return user_repo.count_users_by_role_repo(role)
 
-def list_all_users_service() -> list[dict]:
+def list_all_users_service(cursor: Optional[str] = None, limit: int = PAGE_SIZE_DEFAULT) -> Page[UserOut]:
     """List users with pagination."""
     logger.info("Listing all users...")
-    return user_repo.list_all_users_repo()
+    return user_repo.list_all_users_repo(cursor, limit)
 
 def list_active_users_service() -> list[dict]:
     """List active users with pagination."""
@@ -141,12 +174,12 @@ def list_active_users_service() -> list[dict]:
 
 def verify_user_email_service(user_id: int) -> dict:
     """Verify a user's email."""
-    logger.info("Verifying email of user with ID: {user_id}")
+    logger.info("Verifying email of user with ID: %s", user_id)
     return user_repo.verify_user_email_repo(user_id)
 
 def unverify_user_email_service(user_id: int) -> dict:
     """Unverify a user's email."""
-    logger.info("Unverifying email of user with ID: {user_id}")
+    logger.info("Unverifying email of user with ID: %s", user_id)
     return user_repo.unverify_user_email_repo(user_id)
 
 def list_verified_users_service() -> list[dict]:
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Flash-sale waiting room for MGLTickets.
+
+When enabled for an event, buyers first join a FIFO queue and get a signed
+position token. Positions are admitted at a fixed rate, and only admitted
+tokens may create a booking, so the database sees a bounded, steady flow
+instead of the whole crowd at once.
+
+Rooms live in process memory, so the feature needs a single worker, or
+requests for an event routed to the same worker. Each room signs its tokens
+with a random epoch, and tokens from another worker's room or from before a
+restart or re-enable are rejected, so one token buys at most one booking.
+Tokens are also bound to the buyer who joined the queue.
+"""
+
+import base64
+import hashlib
+import hmac
+import math
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import (
+    SECRET_KEY,
+    WAITING_ROOM_EVENT_IDS,
+    WAITING_ROOM_ADMIT_RATE,
+    WAITING_ROOM_BURST,
+    WAITING_ROOM_TOKEN_TTL_SECONDS,
+)
+from app.core.logging_config import logger
+from app.schemas.waiting_room import QueueTicketOut
+
+
+class NotAdmittedError(ValueError):
+    """Raised when a booking is attempted without an admitted queue token."""
+
+    def __init__(self, message: str, ahead: int = 0, retry_after: float = 1.0):
+        super().__init__(message)
+        self.ahead = ahead
+        self.retry_after = retry_after
+
+
+@dataclass
+class QueueStatus:
+    """Where a queue position stands right now."""
+    position: int
+    admitted: bool
+    ahead: int
+    retry_after: float
+
+
+class WaitingRoom:
+    """FIFO queue for one event that admits `admit_rate` positions per second."""
+
+    def __init__(self, event_id: int, admit_rate: float, burst: int, token_ttl: float = WAITING_ROOM_TOKEN_TTL_SECONDS):
+        self.event_id = event_id
+        self.admit_rate = admit_rate
+        self.burst = burst
+        self.epoch = secrets.token_hex(8)  # Signed into tokens, a new room never honours an old room's tokens
+        # Admitted positions this far behind the frontier have expired, so _consumed only keeps the rest
+        self._expiry_window = burst + math.ceil(admit_rate * token_ttl)
+        self._next_position = 0           # next position handed out
+        self._admitted_upto = float(burst)  # positions wholly below this are admitted
+        self._consumed: set[int] = set()  # admitted positions already used for a booking
+        self._last_tick = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _advance(self) -> None:
+        """Move the admission frontier forward for the time elapsed (lock held)."""
+        now = time.monotonic()
+        self._admitted_upto += (now - self._last_tick) * self.admit_rate
+        self._last_tick = now
+        # Do not bank admissions for buyers who have not arrived yet
+        self._admitted_upto = min(self._admitted_upto, self._next_position + self.burst)
+
+    def join(self) -> int:
+        """Take the next position in the queue."""
+        with self._lock:
+            self._advance()
+            position = self._next_position
+            self._next_position += 1
+            return position
+
+    def status(self, position: int) -> QueueStatus:
+        """Report whether `position` is admitted, and how long until it is."""
+        with self._lock:
+            self._advance()
+            admitted_upto = self._admitted_upto
+        if position + 1 <= admitted_upto:  # The frontier counts whole admissions
+            return QueueStatus(position=position, admitted=True, ahead=0, retry_after=0.0)
+        ahead = math.ceil(position + 1 - admitted_upto)
+        return QueueStatus(position=position, admitted=False, ahead=ahead, retry_after=ahead / self.admit_rate)
+
+    def consume(self, position: int) -> QueueStatus:
+        """Use an admitted position for a booking, each position only once and before it expires."""
+        queue_status = self.status(position)
+        if not queue_status.admitted:
+            raise NotAdmittedError("Not admitted yet, please wait.", queue_status.ahead, queue_status.retry_after)
+        with self._lock:
+            expired_below = self._admitted_upto - self._expiry_window
+            if position < expired_below:
+                raise ValueError("Queue token has expired, join the queue again.")
+            if position in self._consumed:
+                raise ValueError("Queue token has already been used.")
+            self._consumed.add(position)
+            if len(self._consumed) > 2 * self._expiry_window:
+                self._consumed = {p for p in self._consumed if p >= expired_below}
+        return queue_status
+
+    def release(self, position: int) -> None:
+        """Let a consumed position be used again, e.g. after a failed booking."""
+        with self._lock:
+            self._consumed.discard(position)
+
+
+_rooms: dict[int, WaitingRoom] = {
+    event_id: WaitingRoom(event_id, WAITING_ROOM_ADMIT_RATE, WAITING_ROOM_BURST)
+    for event_id in WAITING_ROOM_EVENT_IDS
+}
+_rooms_lock = threading.Lock()
+
+
+def enable_waiting_room(event_id: int, admit_rate: float = WAITING_ROOM_ADMIT_RATE, burst: int = WAITING_ROOM_BURST) -> WaitingRoom:
+    """Turn on the waiting room for an event (kept if already enabled)."""
+    with _rooms_lock:
+        room = _rooms.get(event_id)
+        if room is None:
+            room = _rooms[event_id] = WaitingRoom(event_id, admit_rate, burst)
+            logger.info("Waiting room enabled", extra={"extra": {"event_id": event_id, "admit_rate": admit_rate}})
+        return room
+
+
+def disable_waiting_room(event_id: int) -> bool:
+    """Turn off the waiting room for an event."""
+    with _rooms_lock:
+        return _rooms.pop(event_id, None) is not None
+
+
+def get_waiting_room(event_id: int) -> Optional[WaitingRoom]:
+    """Return the event's waiting room, or None if bookings are open to everyone."""
+    return _rooms.get(event_id)
+
+
+def has_waiting_rooms() -> bool:
+    """Cheap check used to skip admission entirely when no event opted in."""
+    return bool(_rooms)
+
+
+def _sign(payload: bytes) -> str:
+    digest = hmac.new(str(SECRET_KEY).encode(), payload, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+@dataclass
+class QueueToken:
+    """The signed contents of a queue token."""
+    event_id: int
+    epoch: str
+    user_id: int
+    position: int
+
+
+def issue_queue_token(room: WaitingRoom, user_id: int, position: int) -> str:
+    """Create a tamper-proof token for a queue position in `room`, usable only by `user_id`."""
+    payload = f"{room.event_id}.{room.epoch}.{user_id}.{position}"
+    return f"{payload}.{_sign(payload.encode())}"
+
+
+def parse_queue_token(token: str) -> QueueToken:
+    """Return the contents of a token, raising ValueError if it is forged or malformed."""
+    try:
+        event_id, epoch, user_id, position, signature = token.split(".")
+        payload = f"{event_id}.{epoch}.{user_id}.{position}"
+        if not hmac.compare_digest(signature, _sign(payload.encode())):
+            raise ValueError
+        return QueueToken(event_id=int(event_id), epoch=epoch, user_id=int(user_id), position=int(position))
+    except ValueError as e:
+        raise ValueError("Invalid queue token.") from e
+
+
+def _check_queue_token(room: WaitingRoom, user_id: int, token: str) -> int:
+    """Return the token's position in `room`, raising ValueError if it was issued for another room or buyer."""
+    queue_token = parse_queue_token(token)
+    if queue_token.event_id != room.event_id:
+        raise ValueError("Queue token is for a different event.")
+    if queue_token.epoch != room.epoch:
+        raise ValueError("Queue token has expired, join the queue again.")
+    if queue_token.user_id != user_id:
+        raise ValueError("Queue token belongs to another user.")
+    return queue_token.position
+
+
+def admit(event_id: int, user_id: int, token: Optional[str]) -> Optional[int]:
+    """
+    Check that a buyer may book tickets for `event_id` right now and use up
+    their admitted position. Returns the position, or None when the event
+    has no waiting room.
+    """
+    room = get_waiting_room(event_id)
+    if room is None:
+        return None
+    if not token:
+        raise NotAdmittedError("This event uses a waiting room, join the queue first.")
+    position = _check_queue_token(room, user_id, token)
+    room.consume(position)
+    return position
+
+
+def readmit(event_id: int, position: Optional[int]) -> None:
+    """Give back a position taken by admit() when the booking did not go through."""
+    room = get_waiting_room(event_id)
+    if room is not None and position is not None:
+        room.release(position)
+
+
+def join_queue_service(event_id: int, user_id: int) -> QueueTicketOut:
+    """Give the buyer a place in the event's waiting room."""
+    room = get_waiting_room(event_id)
+    if room is None:
+        return QueueTicketOut(event_id=event_id, waiting_room=False, admitted=True)
+    position = room.join()
+    queue_status = room.status(position)
+    return QueueTicketOut(
+        event_id=event_id,
+        waiting_room=True,
+        token=issue_queue_token(room, user_id, position),
+        position=position,
+        admitted=queue_status.admitted,
+        ahead=queue_status.ahead,
+        retry_after=queue_status.retry_after,
+    )
+
+
+def queue_status_service(event_id: int, user_id: int, token: str) -> QueueTicketOut:
+    """Report how far a queue token is from being admitted."""
+    room = get_waiting_room(event_id)
+    if room is None:
+        return QueueTicketOut(event_id=event_id, waiting_room=False, admitted=True)
+    position = _check_queue_token(room, user_id, token)
+    queue_status = room.status(position)
+    return QueueTicketOut(
+        event_id=event_id,
+        waiting_room=True,
+        token=token,
+        position=position,
+        admitted=queue_status.admitted,
+        ahead=queue_status.ahead,
+        retry_after=queue_status.retry_after,
+    )
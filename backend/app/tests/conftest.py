@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Shared pytest fixtures for MGLTickets.
+
+Tests run against TEST_DATABASE_URL / TEST_ASYNC_DATABASE_URL when set (use a
+throwaway Postgres database for realistic concurrency numbers), otherwise
+against a temporary SQLite file. The schema is recreated for every test.
+"""
+
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+_sqlite_path = os.path.join(tempfile.mkdtemp(prefix="mgltickets-tests-"), "test.db")
+
+# Settings must be in place before app.core.config is first imported
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("HOLD_SWEEPER_ENABLED", "false")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", f"sqlite:///{_sqlite_path}")
+os.environ["ASYNC_DATABASE_URL"] = os.environ.get("TEST_ASYNC_DATABASE_URL", f"sqlite+aiosqlite:///{_sqlite_path}")
+
+import pytest
+
+from app.db.session import Base, engine, get_session
+from app.db.async_session import async_engine
+from app.db.models.user import User
+from app.db.models.event import Event
+from app.db.models.ticket_type import TicketType
+import app.db.models.booking, app.db.models.payment, app.db.models.ticket_instance, app.db.models.revoked_token  # noqa: F401, register tables
+from app.core.cache import user_cache, token_cache
+from app.core.revocation import revocation_list
+from app.core.security import create_access_token
+from app.services.catalog_cache import catalog_cache
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: timing test, run with -s to see the numbers")
+
+
+def run(coro):
+    """Run a coroutine on a fresh event loop, closing the async pool's connections on that loop."""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(main())
+
+
+def report(name: str, **numbers) -> None:
+    """Print a benchmark result on one line (shown with pytest -s)."""
+    print(f"\n[benchmark] {name}: " + ", ".join(f"{key}={value}" for key, value in numbers.items()))
+
+
+def auth_headers(user_id: int) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token(user_id)}"}
+
+
+@pytest.fixture
+def db():
+    """Empty schema and caches for one test."""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    user_cache.clear()
+    token_cache.clear()
+    revocation_list.clear()
+    run(catalog_cache.clear())
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def make_user(db):
+    def make(role: str = "attendee", email: str | None = None, password_hash: str = "x") -> int:
+        with get_session() as session:
+            count = session.query(User).count()
+            user = User(
+                name=f"User {count + 1}",
+                email=email or f"user{count + 1}@example.com",
+                password_hash=password_hash,
+                phone_number="0700000000",
+                role=role,
+            )
+            session.add(user)
+            session.flush()
+            return user.id
+    return make
+
+
+@pytest.fixture
+def make_event(db):
+    def make(organizer_id: int, **fields) -> int:
+        start = datetime.now(timezone.utc) + timedelta(days=7)
+        values = dict(title="Event", venue="Venue", start_time=start, end_time=start + timedelta(hours=3), flyer_url="flyer.png")
+        with get_session() as session:
+            event = Event(organizer_id=organizer_id, **{**values, **fields})
+            session.add(event)
+            session.flush()
+            return event.id
+    return make
+
+
+@pytest.fixture
+def make_ticket_type(db):
+    def make(event_id: int, price: int = 100, quantity_available: int = 10) -> int:
+        with get_session() as session:
+            ticket_type = TicketType(event_id=event_id, name="Regular", price=price, quantity_available=quantity_available)
+            session.add(ticket_type)
+            session.flush()
+            return ticket_type.id
+    return make
+
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    with TestClient(app) as test_client:
+        yield test_client
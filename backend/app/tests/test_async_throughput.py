@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark: DB-bound request throughput on the sync and the async engine."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import event, text
+
+from app.db.session import engine, get_session
+from app.db.async_session import async_engine, get_async_session
+from app.tests.conftest import report, run
+
+CONCURRENCY = 20
+QUERY_SECONDS = 0.05
+SLOW_QUERY = text("SELECT pg_sleep(:seconds)")
+
+
+def _add_pg_sleep(dbapi_connection, connection_record):
+    dbapi_connection.create_function("pg_sleep", 1, time.sleep)
+
+
+@pytest.fixture
+def slow_queries(db):
+    """A query that takes QUERY_SECONDS in the database; SQLite gets a pg_sleep() for it."""
+    if engine.dialect.name != "sqlite":
+        yield
+        return
+    event.listen(engine, "connect", _add_pg_sleep)
+    event.listen(async_engine.sync_engine, "connect", _add_pg_sleep)
+    engine.dispose()
+    yield
+    event.remove(engine, "connect", _add_pg_sleep)
+    event.remove(async_engine.sync_engine, "connect", _add_pg_sleep)
+
+
+async def _sync_handler():
+    # Before: an async def route calling a sync repository blocks the event loop
+    with get_session() as session:
+        session.execute(SLOW_QUERY, {"seconds": QUERY_SECONDS})
+
+
+async def _async_handler():
+    # After: the route awaits the query and the loop serves other requests meanwhile
+    async with get_async_session() as session:
+        await session.execute(SLOW_QUERY, {"seconds": QUERY_SECONDS})
+
+
+async def _throughput(handler) -> float:
+    await handler()  # Warm up the pool
+    start = time.perf_counter()
+    await asyncio.gather(*(handler() for _ in range(CONCURRENCY)))
+    return CONCURRENCY / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_async_engine_overlaps_db_bound_requests(slow_queries):
+    sync_rps = run(_throughput(_sync_handler))
+    async_rps = run(_throughput(_async_handler))
+    report(
+        "concurrent DB-bound requests",
+        concurrency=CONCURRENCY,
+        query_ms=QUERY_SECONDS * 1000,
+        sync_req_per_s=round(sync_rps, 1),
+        async_req_per_s=round(async_rps, 1),
+    )
+    # Sync requests run one after another; async ones overlap up to the pool size
+    assert sync_rps < 1.5 / QUERY_SECONDS
+    assert async_rps > 3 * sync_rps
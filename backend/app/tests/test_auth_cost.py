@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-request cost of get_current_user with and without its caches."""
+
+import time
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.requests import Request
+
+from app.core.cache import token_cache, user_cache
+from app.core.security import create_access_token, get_current_user
+from app.tests.conftest import report, run
+
+REQUESTS = 2000
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+async def _per_request_us(credentials: HTTPAuthorizationCredentials, clear_tokens: bool, clear_users: bool) -> float:
+    await get_current_user(_request(), None, credentials)  # Warm up
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        if clear_tokens:
+            token_cache.clear()
+        if clear_users:
+            user_cache.clear()
+        await get_current_user(_request(), None, credentials)
+    return (time.perf_counter() - start) / REQUESTS * 1e6
+
+
+@pytest.mark.benchmark
+def test_get_current_user_cost(make_user):
+    user_id = make_user()
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(user_id))
+
+    uncached = run(_per_request_us(credentials, clear_tokens=True, clear_users=True))
+    user_cached = run(_per_request_us(credentials, clear_tokens=True, clear_users=False))
+    cached = run(_per_request_us(credentials, clear_tokens=False, clear_users=False))
+    report(
+        "get_current_user per request",
+        uncached_us=round(uncached, 1),
+        token_miss_us=round(user_cached, 1),
+        cached_us=round(cached, 1),
+    )
+    assert cached < user_cached < uncached
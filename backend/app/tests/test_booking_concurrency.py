@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Stress test: concurrent buyers against limited stock never oversell."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+
+from app.db.session import get_session
+from app.db.models.booking import Booking
+from app.db.models.ticket_type import TicketType
+from app.db.repositories.booking_repo import create_booking_repo
+from app.schemas.booking import BookingCreate
+from app.tests.conftest import report
+
+BUYERS = 40
+STOCK = 15
+
+
+def test_concurrent_buyers_never_oversell(make_user, make_event, make_ticket_type):
+    user_id = make_user()
+    ticket_type_id = make_ticket_type(make_event(user_id), quantity_available=STOCK)
+    start_together = threading.Barrier(BUYERS)
+
+    def buy(_) -> bool:
+        start_together.wait()
+        try:
+            create_booking_repo(BookingCreate(user_id=user_id, ticket_type_id=ticket_type_id, quantity=1))
+            return True
+        except ValueError:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=BUYERS) as pool:
+        results = list(pool.map(buy, range(BUYERS)))
+    elapsed = time.perf_counter() - start
+
+    with get_session() as session:
+        ticket_type = session.get(TicketType, ticket_type_id)
+        bookings = session.scalar(select(func.count()).select_from(Booking).where(Booking.ticket_type_id == ticket_type_id))
+        assert ticket_type.quantity_sold == ticket_type.quantity_available
+    assert sum(results) == STOCK
+    assert bookings == STOCK
+    report("concurrent booking attempts", buyers=BUYERS, stock=STOCK, attempts_per_s=round(BUYERS / elapsed))
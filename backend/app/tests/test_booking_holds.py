@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Tests for payments that complete after their booking's hold expired."""
+
+from datetime import datetime, timedelta, timezone
+
+from app.db.session import get_session
+from app.db.models.ticket_type import TicketType
+from app.db.repositories.booking_repo import create_booking_repo, expire_stale_holds_repo
+from app.schemas.booking import BookingCreate
+from app.schemas.payment import PaymentCreate
+from app.services.booking_services import get_booking_by_id_service
+from app.services.payment_services import create_payment_service, update_payment_status_service
+
+
+def _expired_booking(user_id: int, ticket_type_id: int, quantity: int) -> int:
+    booking = create_booking_repo(BookingCreate(user_id=user_id, ticket_type_id=ticket_type_id, quantity=quantity))
+    expire_stale_holds_repo(datetime.now(timezone.utc) + timedelta(minutes=1), batch_size=10)
+    assert get_booking_by_id_service(booking.id).status == "expired"
+    return booking.id
+
+
+def _pay(booking_id: int):
+    payment = create_payment_service(PaymentCreate(booking_id=booking_id, amount=100, currency="KES", method="m-pesa", mpesa_ref="REF"))
+    return update_payment_status_service(payment.id, "completed")
+
+
+def _quantity_sold(ticket_type_id: int) -> int:
+    with get_session() as session:
+        return session.get(TicketType, ticket_type_id).quantity_sold
+
+
+def test_late_payment_reinstates_expired_booking_while_in_stock(make_user, make_event, make_ticket_type):
+    user_id = make_user()
+    ticket_type_id = make_ticket_type(make_event(user_id), quantity_available=5)
+    booking_id = _expired_booking(user_id, ticket_type_id, quantity=2)
+    assert _quantity_sold(ticket_type_id) == 0
+
+    payment = _pay(booking_id)
+
+    assert payment.status == "completed"
+    assert get_booking_by_id_service(booking_id).status == "confirmed"
+    assert _quantity_sold(ticket_type_id) == 2
+
+
+def test_late_payment_after_sell_out_requires_refund(make_user, make_event, make_ticket_type):
+    user_id = make_user()
+    ticket_type_id = make_ticket_type(make_event(user_id), quantity_available=2)
+    booking_id = _expired_booking(user_id, ticket_type_id, quantity=2)
+    create_booking_repo(BookingCreate(user_id=user_id, ticket_type_id=ticket_type_id, quantity=2))
+
+    payment = _pay(booking_id)
+
+    assert payment.status == "refund_required"
+    assert get_booking_by_id_service(booking_id).status == "expired"
+    assert _quantity_sold(ticket_type_id) == 2
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Tests for the booking routes."""
+
+from app.tests.conftest import auth_headers
+
+
+def test_booking_price_comes_from_ticket_type_not_client(client, make_user, make_event, make_ticket_type):
+    user_id = make_user()
+    ticket_type_id = make_ticket_type(make_event(user_id), price=10)
+
+    response = client.post(
+        "/api/v1/bookings",
+        json={"ticket_type_id": ticket_type_id, "quantity": 2, "total_price": 1},
+        headers=auth_headers(user_id),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["total_price"] == 20
+    assert response.json()["user_id"] == user_id
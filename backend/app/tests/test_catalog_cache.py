@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Tests and benchmark for the event catalog cache."""
+
+import time
+
+import pytest
+from pydantic import TypeAdapter
+
+import app.services.event_services as event_services
+from app.db.async_session import get_async_session
+from app.services.catalog_cache import catalog_cache
+from app.tests.conftest import report, run
+
+EVENTS = 200
+HITS = 1000
+STRINGS = TypeAdapter(list[str])
+
+
+async def _listing_ms() -> tuple[float, float]:
+    start = time.perf_counter()
+    await event_services.get_events_by_status_service("upcoming", limit=EVENTS)
+    miss = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(HITS):
+        page = await event_services.get_events_by_status_service("upcoming", limit=EVENTS)
+    hit = (time.perf_counter() - start) / HITS
+    assert len(page.items) == EVENTS
+    return miss * 1000, hit * 1000
+
+
+@pytest.mark.benchmark
+def test_listing_cache_hit_under_one_millisecond(make_user, make_event):
+    organizer_id = make_user(role="organizer")
+    for i in range(EVENTS):
+        make_event(organizer_id, title=f"Event {i}")
+
+    miss_ms, hit_ms = run(_listing_ms())
+    report("event listing latency", events=EVENTS, miss_ms=round(miss_ms, 2), hit_ms=round(hit_ms, 4))
+    assert hit_ms < 1.0
+    assert hit_ms < miss_ms
+
+
+async def _approved_counts(event_ids: list[int]) -> list[int]:
+    """Approved listing size: cached, after a committed approval, after a rolled-back one."""
+    counts = [len(await event_services.get_approved_events_service())]
+    async with get_async_session() as session:
+        await event_services.approve_event_service(event_ids[0], session=session)
+    counts.append(len(await event_services.get_approved_events_service()))
+    with pytest.raises(RuntimeError):
+        async with get_async_session() as session:
+            await event_services.approve_event_service(event_ids[1], session=session)
+            raise RuntimeError("checkout failed")
+    counts.append(len(await event_services.get_approved_events_service()))
+    return counts
+
+
+def test_event_writes_invalidate_listings_only_once_committed(make_user, make_event):
+    organizer_id = make_user(role="organizer")
+    event_ids = [make_event(organizer_id) for _ in range(2)]
+
+    assert run(_approved_counts(event_ids)) == [0, 1, 1]
+
+
+async def _loads_across_a_write() -> int:
+    """Load a listing while an event write commits, then read it again."""
+    loads = 0
+
+    async def load() -> list[str]:
+        nonlocal loads
+        loads += 1
+        await catalog_cache.invalidate()  # Commits after the rows below were read
+        return ["old rows"]
+
+    await catalog_cache.get_or_load("race", STRINGS, load)
+    await catalog_cache.get_or_load("race", STRINGS, load)
+    return loads
+
+
+def test_read_racing_a_write_does_not_cache_old_rows(db):
+    assert run(_loads_across_a_write()) == 2
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests and scan-rate benchmark for gate check-in."""
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+import app.services.checkin_services as checkin_services
+from app.db.profiler import profile_queries
+from app.db.session import engine
+from app.db.repositories.booking_repo import create_booking_repo, confirm_booking_repo
+from app.schemas.booking import BookingCreate
+from app.schemas.checkin import OfflineScan
+from app.tests.conftest import auth_headers, report, run
+
+SCANS = 2000
+
+
+@pytest.fixture(autouse=True)
+def clear_checkin_state():
+    checkin_services._indexes.clear()
+    checkin_services._event_owners.clear()
+
+
+@pytest.fixture
+def gate(make_user, make_event, make_ticket_type):
+    """An organizer's event, with a helper that issues n tickets and returns their codes."""
+    organizer_id = make_user(role="organizer")
+    event_id = make_event(organizer_id)
+    ticket_type_id = make_ticket_type(event_id, quantity_available=10 * SCANS)
+
+    def issue(n: int) -> list[str]:
+        booking = create_booking_repo(BookingCreate(user_id=organizer_id, ticket_type_id=ticket_type_id, quantity=n))
+        _, ticket_instances = confirm_booking_repo(booking.id)
+        return [ticket_instance.code for ticket_instance in ticket_instances]
+
+    return organizer_id, event_id, issue
+
+
+async def _scan_all(event_id: int, codes: list[str]) -> list[str]:
+    return [(await checkin_services.check_in_ticket_service(event_id, code)).result for code in codes]
+
+
+def test_unknown_codes_are_rejected_without_queries(gate):
+    _, event_id, issue = gate
+    issue(10)
+    run(checkin_services.preload_event_codes_service(event_id))
+
+    with profile_queries() as profile:
+        results = run(_scan_all(event_id, [f"FORGED-{i}" for i in range(100)]))
+
+    assert set(results) == {"invalid"}
+    assert profile.count == 0
+
+
+def test_ticket_issued_after_preload_is_admitted_once(gate, monkeypatch):
+    _, event_id, issue = gate
+    issue(10)
+    run(checkin_services.preload_event_codes_service(event_id))
+    monkeypatch.setattr(checkin_services, "CHECKIN_INDEX_REFRESH_SECONDS", 0.0)
+
+    [code] = issue(1)
+    results = run(_scan_all(event_id, [code, code]))
+
+    assert results == ["admitted", "already_used"]
+
+
+def test_only_the_events_organizer_or_an_admin_can_scan(client, gate, make_user):
+    organizer_id, event_id, issue = gate
+    [code] = issue(1)
+    other_organizer_id = make_user(role="organizer")
+    admin_id = make_user(role="admin")
+    url = f"/api/v1/events/{event_id}/check-in"
+
+    assert client.post(url, json={"code": code}, headers=auth_headers(other_organizer_id)).status_code == 403
+    assert client.get(f"{url}/bundle", headers=auth_headers(other_organizer_id)).status_code == 403
+    assert client.post(url, json={"code": code}, headers=auth_headers(organizer_id)).json()["result"] == "admitted"
+    assert client.post(url, json={"code": code}, headers=auth_headers(admin_id)).json()["result"] == "already_used"
+    assert client.post("/api/v1/events/999/check-in", json={"code": code}, headers=auth_headers(admin_id)).status_code == 404
+
+
+async def _no_tickets(*args, **kwargs):
+    return {}
+
+
+def test_offline_sync_compares_and_binds_scan_times_in_utc(monkeypatch):
+    bound = []
+
+    async def sync_check_ins_repo(event_id, scans, session=None):
+        bound.extend(scans)
+        return []
+
+    monkeypatch.setattr(checkin_services.ti_repo, "sync_check_ins_repo", sync_check_ins_repo)
+    monkeypatch.setattr(checkin_services.ti_repo, "get_ticket_instances_by_codes_repo", _no_tickets)
+    scans = [
+        OfflineScan(code="A", scanned_at=datetime(2026, 6, 1, 10, 0)),  # Naive, taken as UTC
+        OfflineScan(code="A", scanned_at=datetime.fromisoformat("2026-06-01T12:30:00+03:00")),
+    ]
+
+    run(checkin_services.sync_offline_scans_service(1, scans))
+    assert bound == [("A", datetime(2026, 6, 1, 9, 30, tzinfo=timezone.utc))]
+
+
+@pytest.mark.skipif(engine.dialect.name == "sqlite", reason="UPDATE ... FROM (VALUES ...) needs Postgres")
+def test_offline_sync_accepts_naive_and_aware_times(client, gate):
+    organizer_id, event_id, issue = gate
+    [code] = issue(1)
+    scans = [
+        {"code": code, "scanned_at": "2026-06-01T10:00:00"},  # Naive, taken as UTC
+        {"code": code, "scanned_at": "2026-06-01T12:30:00+03:00"},  # 09:30 UTC, the earlier scan
+    ]
+
+    response = client.post(
+        f"/api/v1/events/{event_id}/check-in/sync", json={"scans": scans}, headers=auth_headers(organizer_id)
+    )
+    assert response.status_code == 200
+    assert response.json()["applied"] == 1
+    [conflict] = response.json()["conflicts"]
+    assert conflict["result"] == "already_used"
+    assert datetime.fromisoformat(conflict["used_at"]) == datetime(2026, 6, 1, 9, 30, tzinfo=timezone.utc)
+
+
+@pytest.mark.benchmark
+def test_scan_rate(gate):
+    _, event_id, issue = gate
+    codes = issue(SCANS)
+    run(checkin_services.preload_event_codes_service(event_id))
+
+    def scans_per_second(batch: list[str], expected: str) -> float:
+        start = time.perf_counter()
+        results = run(_scan_all(event_id, batch))
+        elapsed = time.perf_counter() - start
+        assert set(results) == {expected}
+        return len(batch) / elapsed
+
+    first = scans_per_second(codes, "admitted")  # One conditional UPDATE each
+    repeat = scans_per_second(codes, "already_used")  # Answered by the index
+    unknown = scans_per_second([f"FORGED-{i}" for i in range(SCANS)], "invalid")  # Answered by the index
+    report(
+        "gate scans per second",
+        scans=SCANS,
+        first_scan=round(first),
+        repeat_scan=round(repeat),
+        unknown_code=round(unknown),
+    )
+    assert repeat > 5 * first
+    assert unknown > 5 * first
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests for the event read routes."""
+
+import pytest
+
+from app.db.models.event import Event
+from app.db.session import get_session
+from app.tests.conftest import auth_headers
+
+
+def test_missing_event_is_404_on_both_reads(client, make_user):
+    headers = auth_headers(make_user())
+
+    assert client.get("/api/v1/events/999", headers=headers).status_code == 404
+    assert client.get("/api/v1/events/999/details", headers=headers).status_code == 404
+
+
+def test_unchanged_event_is_304(client, make_user, make_event):
+    user_id = make_user()
+    event_id = make_event(user_id)
+    headers = auth_headers(user_id)
+
+    response = client.get(f"/api/v1/events/{event_id}", headers=headers)
+    assert response.status_code == 200
+
+    not_modified = client.get(f"/api/v1/events/{event_id}", headers={**headers, "If-None-Match": response.headers["ETag"]})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+
+@pytest.mark.parametrize("path", ["/api/v1/events", "/api/v1/events/status/upcoming"])
+def test_changed_listing_is_200_with_new_etag(client, make_user, make_event, path):
+    user_id = make_user()
+    event_id = make_event(user_id, title="Before")
+    headers = auth_headers(user_id)
+    old_etag = client.get(path, headers=headers).headers["ETag"]
+    assert client.get(path, headers={**headers, "If-None-Match": old_etag}).status_code == 304
+
+    # Written directly, as by another worker: this worker's listing cache is not invalidated
+    with get_session() as session:
+        session.get(Event, event_id).title = "After"
+
+    response = client.get(path, headers={**headers, "If-None-Match": old_etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != old_etag
+    assert response.json()["items"][0]["title"] == "After"
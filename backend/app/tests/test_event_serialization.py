@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Benchmark: encoding a 10k-event page through FastAPI vs the pre-serialized fast path."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.responses import serialized_response
+from app.schemas.event import EventOut
+from app.schemas.pagination import Page
+from app.services.event_services import EVENT_PAGE
+from app.tests.conftest import report
+
+EVENTS = 10_000
+ROUNDS = 3
+
+
+def _page() -> Page[EventOut]:
+    now = datetime.now(timezone.utc)
+    events = [
+        EventOut.model_validate(dict(
+            id=i, title=f"Event {i}", description="Live music", venue="Venue", start_time=now,
+            end_time=now, flyer_url="flyer.png", status="upcoming", organizer_id=1, created_at=now, updated_at=now,
+        ))
+        for i in range(EVENTS)
+    ]
+    return Page[EventOut](items=events, next_cursor="cursor")
+
+
+def _fastapi_body(page: Page[EventOut]) -> bytes:
+    """What a route returning the page with response_model=Page[EventOut] sends."""
+    field = create_model_field(name="Response", type_=Page[EventOut], mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=page, is_coroutine=True))
+    return JSONResponse(content).body
+
+
+def _best_ms(encode) -> tuple[float, bytes]:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        body = encode()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000, body
+
+
+@pytest.mark.benchmark
+def test_pre_serialized_page_skips_revalidation():
+    page = _page()
+    fastapi_ms, fastapi_body = _best_ms(lambda: _fastapi_body(page))
+    fast_ms, fast_body = _best_ms(lambda: serialized_response(page, EVENT_PAGE).body)
+    report("10k-event page encoding", events=EVENTS, fastapi_ms=round(fastapi_ms, 1), fast_path_ms=round(fast_ms, 1))
+    assert json.loads(fast_body) == json.loads(fastapi_body)
+    assert fast_ms < fastapi_ms
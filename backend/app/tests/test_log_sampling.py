@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Tests for request log sampling."""
+
+import logging
+
+import app.core.logging_middleware as logging_middleware
+from app.core.logging_config import SamplingFilter
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_client_errors_are_logged_when_requests_are_not_sampled(client, monkeypatch):
+    monkeypatch.setattr(logging_middleware, "sample_request", lambda path: False)
+    handler = _Collect()
+    handler.addFilter(SamplingFilter())
+    logging.getLogger().addHandler(handler)
+    try:
+        assert client.get("/metrics").status_code == 200
+        assert client.get("/api/v1/events?limit=5").status_code in (401, 403)
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    assert not [record for record in handler.records if record.getMessage() == "Incoming request"]
+    responses = [record.extra for record in handler.records if record.getMessage() == "Outgoing response"]
+    assert [response["path"] for response in responses] == ["/api/v1/events"]
+    # The dropped incoming line's request fields are on the forced response record
+    assert responses[0]["method"] == "GET"
+    assert responses[0]["query"] == "limit=5"
+    assert responses[0]["client"] == "testclient"
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""Tests for the logging configuration."""
+
+import queue
+
+import pytest
+
+from app.core.logging_config import BoundedQueueHandler
+
+
+@pytest.mark.parametrize("policy", ["Block", "blocking", ""])
+def test_unknown_queue_full_policy_fails_fast(policy):
+    with pytest.raises(ValueError, match="LOG_QUEUE_FULL_POLICY"):
+        BoundedQueueHandler(queue.Queue(maxsize=1), policy=policy)
+
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark: log records formatted per second, and the cost of disabled log calls."""
+
+import json
+import logging
+import time
+
+import pytest
+
+from app.core.logging_config import JSONFormatter
+from app.schemas.ticket_type import TicketTypeCreate
+from app.tests.conftest import report
+
+RECORDS = 20000
+
+
+class BaselineJSONFormatter(logging.Formatter):
+    """The formatter as it was before: formatTime and json.dumps on every record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "user_id": getattr(record, "user_id", "unknown"),
+            "role": getattr(record, "role", "unknown"),
+            "message": record.getMessage(),
+        }
+        if record.__dict__.get("extra", None):
+            log_data.update(record.__dict__["extra"])
+        return json.dumps(log_data)
+
+
+def _records() -> list[logging.LogRecord]:
+    records = []
+    for i in range(RECORDS):
+        record = logging.LogRecord("MGLTicketsLogger", logging.INFO, __file__, 1, "Outgoing response", None, None)
+        record.extra = {"method": "GET", "status": 200, "path": f"/api/v1/events/{i}", "duration_ms": 1.5}
+        records.append(record)
+    return records
+
+
+def _records_per_second(formatter: logging.Formatter, records: list[logging.LogRecord]) -> float:
+    start = time.perf_counter()
+    for record in records:
+        formatter.format(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+def test_json_formatter_records_per_second():
+    records = _records()
+    before = _records_per_second(BaselineJSONFormatter(), records)
+    after = _records_per_second(JSONFormatter(), records)
+    report("JSON log records per second", records=RECORDS, before=round(before), after=round(after))
+    assert after > before
+
+
+@pytest.mark.benchmark
+def test_disabled_log_calls_cost_nothing_when_lazy():
+    bench_logger = logging.getLogger("MGLTicketsLogger.benchmark")
+    bench_logger.setLevel(logging.WARNING)  # INFO disabled, as when a request is not sampled
+    ticket_type = TicketTypeCreate(event_id=1, name="Regular", price=100, quantity_available=500)
+
+    start = time.perf_counter()
+    for _ in range(RECORDS):
+        bench_logger.info(f"Creating TicketType with data: {ticket_type.model_dump()}")
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(RECORDS):
+        bench_logger.info("Creating TicketType with data: %s", ticket_type)
+    lazy = time.perf_counter() - start
+
+    report("disabled INFO call", eager_us=round(eager / RECORDS * 1e6, 2), lazy_us=round(lazy / RECORDS * 1e6, 2))
+    assert lazy < eager
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark: login latency broken down into DB time and hash time."""
+
+import time
+
+import pytest
+
+import app.db.repositories.async_user_repo as async_user_repo
+from app.core.hashing import hash_password, verify_password
+from app.services.user_services import authenticate_user_service
+from app.tests.conftest import report, run
+
+LOGINS = 10
+EMAIL = "login@example.com"
+PASSWORD = "correct horse battery staple"
+
+
+async def _login_timings() -> dict[str, float]:
+    """Average milliseconds per login for each step, and for the whole service call."""
+    totals = dict.fromkeys(("db_before_ms", "db_ms", "hash_ms", "login_ms"), 0.0)
+    for _ in range(LOGINS):
+        # Before: look the user up by email, then load it again with its password hash
+        start = time.perf_counter()
+        user = await async_user_repo.get_user_by_email_repo(EMAIL)
+        await async_user_repo.get_user_with_password_by_id_repo(user.id)
+        totals["db_before_ms"] += time.perf_counter() - start
+
+        # After: one projected lookup by the indexed email column
+        start = time.perf_counter()
+        user_auth = await async_user_repo.get_user_auth_by_email_repo(EMAIL)
+        totals["db_ms"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert await verify_password(PASSWORD, user_auth.password_hash)
+        totals["hash_ms"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        await authenticate_user_service(EMAIL, PASSWORD)
+        totals["login_ms"] += time.perf_counter() - start
+    return {name: round(total / LOGINS * 1000, 2) for name, total in totals.items()}
+
+
+@pytest.mark.benchmark
+def test_login_latency_breakdown(make_user):
+    make_user(email=EMAIL, password_hash=run(hash_password(PASSWORD)))
+
+    timings = run(_login_timings())
+    report("login latency", logins=LOGINS, **timings)
+    assert timings["db_ms"] < timings["db_before_ms"]
+    # argon2 dominates a login, the single lookup is a small share of it
+    assert timings["db_ms"] < timings["hash_ms"]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for the SQL query profiler and its middleware."""
+
+import logging
+import re
+
+from sqlalchemy import select
+
+import app.core.profiler_middleware as profiler_middleware
+from app.core.config import QUERY_PROFILER_REPEAT_THRESHOLD
+from app.db.models.event import Event
+from app.db.models.user import User
+from app.db.profiler import profile_queries
+from app.db.session import get_session
+from app.tests.conftest import auth_headers
+
+SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries"')
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_same_select_in_a_loop_is_flagged_as_repeated(make_user):
+    user_ids = [make_user() for _ in range(QUERY_PROFILER_REPEAT_THRESHOLD)]
+
+    with profile_queries() as profile:
+        with get_session() as session:
+            session.execute(select(User.id)).all()  # Runs once, not flagged
+            for user_id in user_ids:
+                session.execute(select(User.name).where(User.id == user_id)).one()
+
+    assert profile.count == len(user_ids) + 1
+    repeated = profile.summary()["repeated_queries"]
+    assert [entry["count"] for entry in repeated] == [len(user_ids)]
+    assert "FROM users WHERE users.id" in repeated[0]["statement"]
+
+
+def test_lazy_load_per_row_is_flagged_as_n_plus_one(make_user, make_event):
+    for _ in range(QUERY_PROFILER_REPEAT_THRESHOLD):
+        make_event(make_user(role="organizer"))
+
+    with profile_queries() as profile:
+        with get_session() as session:
+            events = session.scalars(select(Event)).all()
+            [event.organizer.name for event in events]  # One lazy load per event
+
+    assert list(profile.repeated().values()) == [QUERY_PROFILER_REPEAT_THRESHOLD]
+
+
+def test_profiled_request_gets_server_timing_and_summary(client, make_user, make_event, monkeypatch):
+    monkeypatch.setattr(profiler_middleware, "QUERY_PROFILER", "header")
+    user_id = make_user()
+    event_id = make_event(user_id)
+    headers = auth_headers(user_id)
+    handler = _Collect()
+    logging.getLogger().addHandler(handler)
+    try:
+        profiled = client.get(f"/api/v1/events/{event_id}", headers={**headers, "X-Query-Profile": "1"})
+        plain = client.get(f"/api/v1/events/{event_id}", headers=headers)
+    finally:
+        logging.getLogger().removeHandler(handler)
+
+    assert profiled.status_code == plain.status_code == 200
+    match = SERVER_TIMING.fullmatch(profiled.headers["Server-Timing"])
+    assert match and int(match.group(1)) >= 1
+    assert "Server-Timing" not in plain.headers
+
+    summaries = [record.extra for record in handler.records if record.getMessage() == "Query profile"]
+    assert len(summaries) == 1
+    assert summaries[0]["route"] == "/api/v1/events/{event_id}"
+    assert summaries[0]["queries"] >= 1
+    assert summaries[0]["repeated_queries"] == []
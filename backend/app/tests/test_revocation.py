@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Tests for access token revocation on logout."""
+
+import time
+import uuid
+
+from app.core.config import REVOCATION_BLOOM_CAPACITY, REVOCATION_BLOOM_ERROR_RATE
+from app.core.revocation import RevocationList, revocation_list
+from app.db.profiler import profile_queries
+from app.tests.conftest import auth_headers, run
+
+
+def _worker() -> RevocationList:
+    """Another worker's revocation list, or this one's after a restart."""
+    return RevocationList(REVOCATION_BLOOM_CAPACITY, REVOCATION_BLOOM_ERROR_RATE, sync_interval=1, prune_interval=300)
+
+
+def test_logged_out_token_is_rejected(client, make_user):
+    headers = auth_headers(make_user())
+    assert client.post("/api/v1/refresh", headers=headers).status_code == 200
+
+    assert client.post("/api/v1/logout", headers=headers).status_code == 200
+    response = client.post("/api/v1/refresh", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+async def _revoke_on_other_worker_then_sync(jti: str) -> tuple[bool, bool]:
+    await _worker().revoke(jti, time.time() + 3600)
+    before = await revocation_list.is_revoked(jti)
+    await revocation_list.sync()
+    return before, await revocation_list.is_revoked(jti)
+
+
+def test_revocation_reaches_other_workers_on_sync(db):
+    run(revocation_list.sync())  # Loaded at startup
+    assert run(_revoke_on_other_worker_then_sync(uuid.uuid4().hex)) == (False, True)
+
+
+async def _revoked_after_restart(jti: str) -> bool:
+    await revocation_list.revoke(jti, time.time() + 3600)
+    restarted = _worker()
+    await restarted.sync()
+    return await restarted.is_revoked(jti)
+
+
+def test_revocations_survive_restart(db):
+    assert run(_revoked_after_restart(uuid.uuid4().hex))
+
+
+async def _prune(live: str, expired: str) -> tuple[bool, bool]:
+    await revocation_list.revoke(live, time.time() + 3600)
+    await revocation_list.revoke(expired, time.time() + 0.1)
+    time.sleep(0.2)
+    await revocation_list.prune()
+    return expired in revocation_list._bloom, await revocation_list.is_revoked(live)
+
+
+def test_prune_drops_expired_revocations(db):
+    live, expired = uuid.uuid4().hex, uuid.uuid4().hex
+    assert run(_prune(live, expired)) == (False, True)
+
+
+def test_unrevoked_token_check_skips_database(db):
+    run(revocation_list.sync())
+    with profile_queries() as profile:
+        for _ in range(100):
+            assert not run(revocation_list.is_revoked(uuid.uuid4().hex))
+    assert profile.count == 0
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Tests for the authenticated-user cache."""
+
+import asyncio
+
+import app.db.repositories.async_user_repo as async_user_repo
+from app.core.cache import user_cache
+from app.db.repositories.user_repo import deactivate_user_repo, update_user_role_repo
+from app.services.user_services import get_cached_user_by_id_service
+from app.tests.conftest import auth_headers, run
+
+
+def test_deactivated_cached_user_gets_401(client, make_user):
+    user_id = make_user()
+    headers = auth_headers(user_id)
+    assert client.post("/api/v1/refresh", headers=headers).status_code == 200
+    assert user_cache.get(user_id) is not None
+
+    deactivate_user_repo(user_id)
+    response = client.post("/api/v1/refresh", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User account is deactivated"
+
+
+def test_read_racing_a_write_does_not_cache_the_old_user(make_user, monkeypatch):
+    user_id = make_user()
+    load_user = async_user_repo.get_user_by_id_repo
+
+    async def load_then_promote(user_id, session=None):
+        user = await load_user(user_id, session=session)
+        await asyncio.to_thread(update_user_role_repo, user_id, "admin")  # Commits after the read
+        return user
+
+    monkeypatch.setattr(async_user_repo, "get_user_by_id_repo", load_then_promote)
+    assert run(get_cached_user_by_id_service(user_id)).role == "attendee"
+    assert user_cache.get(user_id) is None
+
+    monkeypatch.setattr(async_user_repo, "get_user_by_id_repo", load_user)
+    assert run(get_cached_user_by_id_service(user_id)).role == "admin"
+    assert user_cache.get(user_id).role == "admin"
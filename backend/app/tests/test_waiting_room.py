@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Tests for the flash-sale waiting room in front of booking creation."""
+
+import pytest
+
+import app.services.waiting_room as waiting_room
+from app.tests.conftest import auth_headers
+
+
+@pytest.fixture
+def flash_sale(make_user, make_event, make_ticket_type):
+    """Two events with waiting rooms admitting one buyer at once, then one every 100 seconds."""
+    organizer_id = make_user(role="organizer")
+    event_ids = [make_event(organizer_id) for _ in range(2)]
+    ticket_type_ids = [make_ticket_type(event_id) for event_id in event_ids]
+    for event_id in event_ids:
+        waiting_room.enable_waiting_room(event_id, admit_rate=0.01, burst=1)
+    yield event_ids, ticket_type_ids
+    for event_id in event_ids:
+        waiting_room.disable_waiting_room(event_id)
+
+
+def _join(client, event_id: int, headers: dict) -> dict:
+    response = client.post(f"/api/v1/events/{event_id}/queue", headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _book(client, ticket_type_id: int, headers: dict, token: str | None):
+    queue_headers = {"X-Queue-Token": token} if token else {}
+    return client.post(
+        "/api/v1/bookings",
+        json={"ticket_type_id": ticket_type_id, "quantity": 1},
+        headers={**headers, **queue_headers},
+    )
+
+
+def test_not_yet_admitted_gets_429_with_retry_after(client, make_user, flash_sale):
+    (event_id, _), (ticket_type_id, _) = flash_sale
+    first, second = auth_headers(make_user()), auth_headers(make_user())
+    assert _join(client, event_id, first)["admitted"]
+    queued = _join(client, event_id, second)
+    assert not queued["admitted"]
+
+    response = _book(client, ticket_type_id, second, queued["token"])
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert _book(client, ticket_type_id, second, None).status_code == 429
+
+
+def test_token_buys_one_booking(client, make_user, flash_sale):
+    (event_id, _), (ticket_type_id, _) = flash_sale
+    headers = auth_headers(make_user())
+    token = _join(client, event_id, headers)["token"]
+
+    assert _book(client, ticket_type_id, headers, token).status_code == 200
+    response = _book(client, ticket_type_id, headers, token)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Queue token has already been used."
+
+
+def test_token_for_another_event_is_rejected(client, make_user, flash_sale):
+    (event_id, _), (_, other_ticket_type_id) = flash_sale
+    headers = auth_headers(make_user())
+    token = _join(client, event_id, headers)["token"]
+
+    response = _book(client, other_ticket_type_id, headers, token)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Queue token is for a different event."
+
+
+def test_forged_token_is_rejected(client, make_user, flash_sale):
+    (event_id, _), (ticket_type_id, _) = flash_sale
+    first, second = auth_headers(make_user()), auth_headers(make_user())
+    _join(client, event_id, first)
+    event, epoch, user_id, position, signature = _join(client, event_id, second)["token"].split(".")
+    forged = f"{event}.{epoch}.{user_id}.0.{signature}"  # Jump to the admitted front of the queue
+
+    response = _book(client, ticket_type_id, second, forged)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid queue token."
+
+
+def test_token_is_bound_to_the_buyer(client, make_user, flash_sale):
+    (event_id, _), (ticket_type_id, _) = flash_sale
+    token = _join(client, event_id, auth_headers(make_user()))["token"]
+
+    response = _book(client, ticket_type_id, auth_headers(make_user()), token)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Queue token belongs to another user."
+
+
+def test_tokens_from_before_a_reenable_are_rejected(client, make_user, flash_sale):
+    (event_id, _), (ticket_type_id, _) = flash_sale
+    headers = auth_headers(make_user())
+    token = _join(client, event_id, headers)["token"]
+
+    waiting_room.disable_waiting_room(event_id)
+    waiting_room.enable_waiting_room(event_id, admit_rate=0.01, burst=1)
+    response = _book(client, ticket_type_id, headers, token)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Queue token has expired, join the queue again."
+
+
+def test_consumed_positions_are_bounded(monkeypatch):
+    clock = iter(range(10**6))
+    monkeypatch.setattr(waiting_room.time, "monotonic", lambda: next(clock))  # One second per reading
+    room = waiting_room.WaitingRoom(event_id=1, admit_rate=1, burst=1, token_ttl=50)
+    for _ in range(1000):
+        room.consume(room.join())
+    assert len(room._consumed) <= 2 * room._expiry_window
+    with pytest.raises(ValueError, match="expired"):
+        room.consume(0)
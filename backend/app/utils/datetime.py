@@ -4,15 +4,22 @@
 from datetime import datetime
 import pytz
 
+# Looked up once, pytz.timezone() is costly to call for every converted field
+EAT = pytz.timezone("Africa/Nairobi")
+
 def to_eat(dt: datetime) -> datetime:
     """Convert a UTC datetime to East Africa Time (EAT)."""
     if dt is None:
         return None
 
-    eat = pytz.timezone("Africa/Nairobi")
-
     # If dt does not have timezone info, assume it's UTC
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=pytz.utc)
 
-    return dt.astimezone(eat)
\ No newline at end of file
+    return dt.astimezone(EAT)
+
+def to_utc(dt: datetime) -> datetime:
+    """Convert a datetime to UTC, treating a naive one as UTC already (as to_eat does)."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=pytz.utc)
+    return dt.astimezone(pytz.utc)
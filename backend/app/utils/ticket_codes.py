@@ -0,0 +1,21 @@
+#! /usr/bin/env python3
+"""Generates unique, scanner-friendly ticket codes."""
+
+import base64
+import hashlib
+import secrets
+
+def generate_ticket_code() -> str:
+    """Return a random 16 character code (80 bits, A-Z and 2-7 only)."""
+    return base64.b32encode(secrets.token_bytes(10)).decode()
+
+def generate_ticket_codes(count: int) -> list[str]:
+    """Return `count` distinct ticket codes."""
+    codes: set[str] = set()
+    while len(codes) < count:
+        codes.add(generate_ticket_code())
+    return list(codes)
+
+def ticket_code_hash(code: str) -> int:
+    """64-bit hash of a ticket code, shared by the gate index and the offline scanner bundle."""
+    return int.from_bytes(hashlib.blake2b(code.encode(), digest_size=8).digest(), "big")